@@ -0,0 +1,44 @@
+"""
+Compare the memory of full parameter objects and `CompactParameter`s.
+
+    python benchmarks/bench_compact.py
+"""
+
+#%% [Imports]
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d.compact import CompactParameter, ParameterSpec
+from param123d.parameter_base import RangeParameter
+from param123d.parameter_types import ParameterType
+
+#%% [Benchmark]
+
+def create(count: int):
+    # an assembly repeats the same parameter definitions for every part
+    return [RangeParameter(f"length_{index % 100}", index, ParameterType.IntegerParameter, "mm", help="Length of the part", min_value=0, max_value=100_000, step_value=1) for index in range(count)]
+
+
+def measure(factory) -> int:
+    tracemalloc.start()
+    result = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    count = 20_000
+    specs = [ParameterSpec.of(parameter) for parameter in create(100)]
+    full = measure(lambda: create(count))
+    compacted = measure(lambda: [CompactParameter(specs[index % 100], f"length_{index % 100}", index) for index in range(count)])
+    print(f"{count} full parameters   : {full / count:8.1f} bytes per parameter")
+    print(f"{count} compact parameters: {compacted / count:8.1f} bytes per parameter")
+
+
+if __name__ == '__main__':
+    main()
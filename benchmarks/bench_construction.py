@@ -0,0 +1,52 @@
+"""
+Micro-benchmark of parameter construction throughput per parameter type.
+
+    python benchmarks/bench_construction.py
+"""
+
+#%% [Imports]
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d.parameter_base import BaseParameter
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameter_types import ParameterType
+
+#%% [Benchmark]
+
+HERE = str(Path(__file__).resolve())
+
+CASES = [
+    (ParameterType.BooleanParameter, True),
+    (ParameterType.IntegerParameter, 42),
+    (ParameterType.FloatParameter, 4.2),
+    (ParameterType.StringParameter, "text"),
+    (ParameterType.FontSizeParameter, 12),
+    (ParameterType.FileNameParameter, "model/part.step"),
+    (ParameterType.FileParameter, HERE),
+    (ParameterType.PathParameter, str(Path(HERE).parent)),
+]
+
+
+def bulk_load(count: int) -> None:
+    with ParameterGroup('bulk'):
+        for index in range(count):
+            BaseParameter(f"value_{index}", index, ParameterType.IntegerParameter)
+
+
+def main():
+    number = 20_000
+    print(f"{'type':<20} {'constructions/s':>16}")
+    for param_type, value in CASES:
+        seconds = timeit.timeit(lambda: BaseParameter("name", value, param_type), number=number)
+        print(f"{param_type.name:<20} {number / seconds:>16,.0f}")
+    
+    seconds = timeit.timeit(lambda: bulk_load(number), number=1)
+    print(f"{'bulk load (group)':<20} {number / seconds:>16,.0f}")
+
+
+if __name__ == '__main__':
+    main()
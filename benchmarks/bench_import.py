@@ -0,0 +1,52 @@
+"""
+Measure the startup cost of `import param123d` with `python -X importtime` and check it against a budget.
+
+    python benchmarks/bench_import.py [budget in ms]
+"""
+
+#%% [Imports]
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_MS = 150.0
+
+#%% [Benchmark]
+
+def import_time(module: str = 'param123d') -> tuple:
+    """Return the cumulative import time [ms] of `module` and the names of all imported modules."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = None
+    modules = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        name = name.strip()
+        if not total.strip().isdigit():
+            continue  # header line
+        modules.append(name)
+        if name == module:
+            cumulative = int(total) / 1000
+    return cumulative, modules
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    runs = [import_time() for _ in range(5)]
+    best = min(cumulative for cumulative, _ in runs)
+    heavy = sorted({name.split('.')[0] for name in runs[0][1]} & {'nicegui', 'fastapi', 'uvicorn', 'numpy', 'pint'})
+    
+    print(f"import param123d: {best:.1f} ms (budget {budget:.0f} ms)")
+    if heavy:
+        print(f"unexpected heavy imports: {', '.join(heavy)}")
+    if best > budget or heavy:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
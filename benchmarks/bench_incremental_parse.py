@@ -0,0 +1,55 @@
+"""
+Benchmark a full parse against an incremental update of a generated 5,000-line model.
+
+    python benchmarks/bench_incremental_parse.py
+"""
+
+#%% [Imports]
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d import parser
+from param123d.parser import IncrementalParser, parse_source
+
+#%% [Benchmark]
+
+def generate_model(groups: int = 250, parameters: int = 19) -> str:
+    lines = ["n = 42"]
+    for g in range(groups):
+        lines.append(f"with ParameterGroup('group_{g}') as group_{g}:")
+        for p in range(parameters):
+            lines.append(f"    p_{g}_{p} = IntegerParameter('p_{g}_{p}', {p}, unit='mm', min_value=0, max_value=100)")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    source = generate_model()
+    edits = {
+        'edit value': source.replace("'p_120_7', 7,", "'p_120_7', 8,"),
+        'insert line': source.replace("    p_120_7 =", "    q = BooleanParameter('q', True)\n    p_120_7 ="),
+    }
+    repeat = 20
+    print(f"model lines: {source.count(chr(10))}")
+
+    def full(edited):
+        parser.clear_cache()
+        parse_source(edited)
+
+    def incremental(edited):
+        model = IncrementalParser(source=source)
+        start = timeit.default_timer()
+        model.update(edited)
+        return timeit.default_timer() - start
+
+    for title, edited in edits.items():
+        full_seconds = timeit.timeit(lambda: full(edited), number=repeat) / repeat
+        incremental_seconds = sum(incremental(edited) for _ in range(repeat)) / repeat
+        print(f"{title:<12} full parse        : {full_seconds * 1e3:8.2f} ms")
+        print(f"{title:<12} incremental update: {incremental_seconds * 1e3:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark `ParameterGroup.__enter__` for the different capture modes on deep call stacks.
+
+    python benchmarks/bench_parameter_group.py
+"""
+
+#%% [Imports]
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d.parameter_groups import ParameterGroup, CaptureMode
+
+#%% [Benchmark]
+
+def enter_group(capture: CaptureMode):
+    with ParameterGroup(capture=capture) as group:
+        pass
+    return group
+
+
+def nested(depth: int, capture: CaptureMode, repeat: int) -> float:
+    """Descend `depth` frames and time `repeat` group entries from there."""
+    if depth > 0:
+        return nested(depth - 1, capture, repeat)
+    return timeit.timeit(lambda: enter_group(capture), number=repeat)
+
+
+def main():
+    repeat = 200
+    print(f"{'depth':>6} {'mode':>6} {'per enter [us]':>15}")
+    for depth in (0, 10, 50, 200):
+        results = {}
+        for capture in CaptureMode:
+            seconds = nested(depth, capture, repeat)
+            results[capture] = seconds / repeat * 1e6
+            print(f"{depth:>6} {capture.value:>6} {results[capture]:>15.2f}")
+        speedup = results[CaptureMode.STACK] / results[CaptureMode.FRAME]
+        print(f"{depth:>6} {'ratio':>6} {speedup:>14.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare opening a large parameter set as YAML and as a memory-mapped binary snapshot.
+
+    python benchmarks/bench_parameter_sets.py
+"""
+
+#%% [Imports]
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d.parameter_sets import load, save
+
+#%% [Benchmark]
+
+def main():
+    count = 20_000
+    values = {f"parameter_{index}": index * 0.5 if index % 3 else f"value {index}" for index in range(count)}
+
+    with tempfile.TemporaryDirectory() as folder:
+        for suffix in ('.yaml', '.pset'):
+            file_name = Path(folder) / f"variant{suffix}"
+            save(values, file_name)
+
+            def open_and_read():
+                loaded = load(file_name)
+                loaded["parameter_4711"]
+                if hasattr(loaded, 'close'):
+                    loaded.close()
+
+            seconds = min(timeit.repeat(open_and_read, number=1, repeat=3))
+            print(f"{count} parameters, {suffix:5}: {seconds * 1e3:8.2f} ms to open and read one value")
+
+
+if __name__ == '__main__':
+    main()
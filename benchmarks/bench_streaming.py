@@ -0,0 +1,42 @@
+"""
+Stream a large parameter set to CSV and JSON Lines and back, and report the peak memory.
+
+    python benchmarks/bench_streaming.py
+"""
+
+#%% [Imports]
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d import streaming
+from param123d.parameters import FloatParameter
+
+#%% [Benchmark]
+
+def generate(count: int):
+    for index in range(count):
+        yield FloatParameter(f"length_{index}", float(index % 1000), "mm", min_value=0.0, max_value=1000.0, step_value=0.5, default_value=1.0)
+
+
+def main():
+    count = 100_000
+    with tempfile.TemporaryDirectory() as folder:
+        for suffix in ('.csv', '.jsonl'):
+            file_name = Path(folder) / f"parameters{suffix}"
+            tracemalloc.start()
+            start = time.perf_counter()
+            streaming.write(generate(count), file_name)
+            total = sum(parameter.value for parameter in streaming.read(file_name))
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{count} parameters, {suffix:6}: {seconds:6.2f} s write + read, peak memory {peak / 1024:8.1f} KiB (sum {total})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Compare applying a 10k parameter preset value by value and in one transaction (with a group listener).
+
+    python benchmarks/bench_transactions.py
+"""
+
+#%% [Imports]
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameters import FloatParameter
+
+#%% [Benchmark]
+
+def main():
+    count = 10_000
+    with ParameterGroup("preset") as group:
+        for index in range(count):
+            FloatParameter(f"parameter_{index}", 0.0)
+    calls = []
+    group.subscribe(calls.append, weak=False)
+    presets = [{f"parameter_{index}": index + offset * 0.5 for index in range(count)} for offset in (1, 2)]
+    cycle = iter(range(1_000_000))
+
+    def set_values():
+        preset = presets[next(cycle) % 2]
+        for parameter in group:
+            parameter.set_value(preset[parameter.name])
+
+    def transaction():
+        group.apply(presets[next(cycle) % 2])
+
+    for name, function in (('set_value', set_values), ('transaction', transaction)):
+        calls.clear()
+        seconds = min(timeit.repeat(function, number=1, repeat=5))
+        print(f"{count} values, {name:11}: {seconds * 1e3:8.2f} ms, {len(calls) // 5:5} notifications per preset")
+
+
+if __name__ == '__main__':
+    main()
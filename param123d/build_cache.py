@@ -0,0 +1,288 @@
+"""
+A content-addressed, size-bounded disk cache for model build results.
+
+A build is keyed by a SHA-256 of the parameters it reads (name, type, value, unit). The names a model reads
+are recorded on the first (missed) build through a recording mapping and stored as a manifest per model, so
+parameters a model never touches do not invalidate its results. A manifest can hold several read sets when
+the reads depend on the values (e.g. `if values['hollow']: ...`).
+
+    cache = BuildCache('.param123d/builds', max_bytes=512 * 2**20)
+    result = cache.build(make_part, group)   # group, {name: parameter} or {name: value}
+"""
+
+#%% [Imports]
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Union
+from .parameter_base import BaseParameter, Identifier, UnionFilesystem, UnionType
+
+#%% [Types]
+
+type Model = Callable[[Mapping], Any]
+type Parameters = Union[Mapping, Iterable[BaseParameter]]
+
+
+class KeyEntry(NamedTuple):
+    """The part of a parameter that goes into a cache key."""
+    name: Identifier
+    type: str
+    value: Any
+    unit: Optional[str]
+
+
+#%% [Helper Functions]
+
+def key_entry(name: Identifier, item: Union[BaseParameter, UnionType]) -> KeyEntry:
+    if isinstance(item, BaseParameter):
+        value = item.value
+        return KeyEntry(name, item.param_type.name, stable_value(value), getattr(item, 'unit', None))
+    return KeyEntry(name, type(item).__name__, stable_value(item), None)
+
+
+def stable_value(value: Any) -> Any:
+    # the value type is part of the key, `1`, `1.0` and `True` are different builds
+    if isinstance(value, Path):
+        return ['Path', str(value)]
+    if isinstance(value, float):
+        return ['float', value.hex()]
+    if value is None or isinstance(value, (bool, int, str)):
+        return [type(value).__name__, value]
+    if isinstance(value, (list, tuple)):
+        return [type(value).__name__, [stable_value(item) for item in value]]
+    raise ValueError(f"Value '{value!r}' of type '{type(value).__name__}' cannot be part of a build key.")
+
+
+def parameter_key(entries: Iterable[KeyEntry], salt: str = '') -> str:
+    """Return the stable hash of key entries (the order of the entries does not matter)."""
+    document = json.dumps([salt, sorted(entries)], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(document.encode('utf-8')).hexdigest()
+
+
+def model_name(model: Model) -> str:
+    return f"{getattr(model, '__module__', '')}.{getattr(model, '__qualname__', type(model).__qualname__)}"
+
+
+def as_mapping(parameters: Parameters) -> Mapping:
+    if isinstance(parameters, Mapping):
+        return parameters
+    return {parameter.name: parameter for parameter in parameters}
+
+
+class ReadRecorder(Mapping):
+    """A read-only `{name: value}` view that records which names the model reads."""
+
+    def __init__(self, items: Mapping):
+        self._items = items
+        self.reads: Set[Identifier] = set()
+
+    def __getitem__(self, name: Identifier) -> UnionType:
+        self.reads.add(name)
+        item = self._items[name]
+        return item.value if isinstance(item, BaseParameter) else item
+
+    def __contains__(self, name) -> bool:
+        self.reads.add(name)
+        return name in self._items
+
+    def __iter__(self) -> Iterator[Identifier]:
+        # iterating reads everything
+        self.reads.update(self._items)
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+#%% [Main Class]
+
+class BuildCache:
+    """Store model results on disk by the hash of the parameters the model read, evicting least recently used results.
+
+    `max_bytes` bounds the total size of the stored results. `version` is mixed into every key, change it
+    when the model code changes.
+    """
+
+    def __init__(self, directory: UnionFilesystem, max_bytes: int = 256 * 2**20, version: str = ''):
+        if max_bytes < 1:
+            raise ValueError(f"Cache size '{max_bytes}' must be at least 1 byte.")
+
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._version = version
+        self._index: Optional[OrderedDict[str, int]] = None
+        self._size = 0
+        self._manifests: Dict[str, List[FrozenSet[Identifier]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # worker processes (e.g. an `Exploration`) rebuild the index from the directory
+        state = self.__dict__.copy()
+        state['_index'] = None
+        state['_size'] = 0
+        return state
+
+    def build(self, model: Model, parameters: Parameters, reads: Optional[Iterable[Identifier]] = None) -> Any:
+        """Return the cached result of `model(values)` or run the model and store its result.
+
+        `reads` declares the names the model reads, by default they are recorded during the first build.
+        """
+        items = as_mapping(parameters)
+        name = model_name(model)
+        if reads is not None:
+            reads = frozenset(reads)
+            missing = reads.difference(items)
+            if missing:
+                raise ValueError(f"Build of '{name}' reads undefined parameters: {', '.join(sorted(missing))}.")
+        read_sets = [reads] if reads is not None else self._manifest(name)
+
+        for read_set in read_sets:
+            key = self.key(name, items, read_set)
+            found, result = self._load(key)
+            if found:
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        recorder = ReadRecorder(items)
+        result = model(recorder)
+        read_set = reads if reads is not None else frozenset(recorder.reads)
+        if reads is None:
+            self._add_manifest(name, read_set)
+        self._store(self.key(name, items, read_set), result)
+        return result
+
+    def wrap(self, model: Model) -> 'CachedModel':
+        """Return a picklable callable that builds through this cache (e.g. as the model of an exploration)."""
+        return CachedModel(self, model)
+
+    def key(self, name: str, items: Mapping, read_set: Iterable[Identifier]) -> str:
+        # a name the model looked up but did not find is part of the key as well
+        entries = (key_entry(read, items[read]) if read in items else KeyEntry(read, 'missing', None, None) for read in read_set)
+        return parameter_key(entries, f"{name}\0{self._version}")
+
+    def clear(self) -> None:
+        for key in list(self._entries()):
+            self._remove(key)
+        self._manifests.clear()
+        for manifest in self._directory.glob('manifests/*.json'):
+            manifest.unlink(missing_ok=True)
+
+    # results ------------------------------------------------------------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._directory / 'objects' / key[:2] / f"{key}.pickle"
+
+    def _entries(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            files = []
+            for path in self._directory.glob('objects/*/*.pickle'):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime_ns, path.stem, stat.st_size))
+            self._index = OrderedDict((key, size) for _, key, size in sorted(files))
+            self._size = sum(self._index.values())
+        return self._index
+
+    def _load(self, key: str):
+        entries = self._entries()
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as stream:
+                result = pickle.load(stream)
+        except FileNotFoundError:
+            if key in entries:
+                self._size -= entries.pop(key)
+            return False, None
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self._remove(key)
+            return False, None
+
+        # the modification time is the recency of a result, also for other processes using the directory
+        os.utime(path)
+        if key not in entries:
+            entries[key] = path.stat().st_size
+            self._size += entries[key]
+        entries.move_to_end(key)
+        return True, result
+
+    def _store(self, key: str, result: Any) -> None:
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self._max_bytes:
+            return
+
+        entries = self._entries()
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+
+        self._size += len(data) - entries.pop(key, 0)
+        entries[key] = len(data)
+        while self._size > self._max_bytes:
+            self._remove(next(iter(entries)))
+
+    def _remove(self, key: str) -> None:
+        entries = self._entries()
+        self._size -= entries.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    # manifests ----------------------------------------------------------------------------------------------------------------------
+
+    def _manifest_path(self, name: str) -> Path:
+        digest = hashlib.sha256(f"{name}\0{self._version}".encode('utf-8')).hexdigest()
+        return self._directory / 'manifests' / f"{digest}.json"
+
+    def _manifest(self, name: str) -> List[FrozenSet[Identifier]]:
+        read_sets = self._manifests.get(name)
+        if read_sets is None:
+            try:
+                read_sets = [frozenset(reads) for reads in json.loads(self._manifest_path(name).read_text(encoding='utf-8'))]
+            except (OSError, ValueError, TypeError):
+                read_sets = []
+            self._manifests[name] = read_sets
+        return read_sets
+
+    def _add_manifest(self, name: str, read_set: FrozenSet[Identifier]) -> None:
+        read_sets = self._manifest(name)
+        if read_set in read_sets:
+            return
+        read_sets.append(read_set)
+
+        path = self._manifest_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps([sorted(reads) for reads in read_sets]), encoding='utf-8')
+        os.replace(temporary, path)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """The total size (bytes) of the stored results."""
+        self._entries()
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+
+class CachedModel:
+    """A model that builds through a `BuildCache`."""
+
+    def __init__(self, cache: BuildCache, model: Model):
+        self.cache = cache
+        self.model = model
+
+    def __call__(self, parameters: Parameters) -> Any:
+        return self.cache.build(self.model, parameters)
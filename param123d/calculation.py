@@ -0,0 +1,90 @@
+"""
+A compiled and cached evaluation engine for `CalculationParameter.calc` expressions.
+
+A `calc` expression is restricted to arithmetic, comparisons, conditional expressions, the names of other
+parameters and calls of the whitelisted functions below. Every expression is validated and compiled once,
+later evaluations only run the cached code object.
+"""
+
+#%% [Imports]
+import ast
+import math
+from functools import lru_cache
+from types import CodeType
+from typing import Any, FrozenSet, Mapping, NamedTuple, Optional
+
+#%% [Whitelist]
+
+ALLOWED_NODES = (
+    ast.Expression, ast.Load,
+    ast.Constant, ast.Name, ast.Tuple, ast.List,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call, ast.keyword,
+    # operators
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+FUNCTIONS = {
+    'abs': abs, 'min': min, 'max': max, 'round': round, 'int': int, 'float': float, 'bool': bool,
+    'sqrt': math.sqrt, 'hypot': math.hypot, 'exp': math.exp, 'log': math.log, 'log10': math.log10,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan, 'asin': math.asin, 'acos': math.acos, 'atan': math.atan, 'atan2': math.atan2,
+    'radians': math.radians, 'degrees': math.degrees, 'floor': math.floor, 'ceil': math.ceil,
+    'pi': math.pi, 'tau': math.tau,
+}
+
+_globals = {'__builtins__': {}, **FUNCTIONS}
+
+#%% [Types]
+
+class CompiledCalculation(NamedTuple):
+    source: str
+    code: CodeType
+    names: FrozenSet[str]   # parameter names the expression reads
+
+
+#%% [Engine]
+
+def validate_node(node: ast.AST, source: str) -> None:
+    if not isinstance(node, ALLOWED_NODES):
+        raise ValueError(f"Calculation '{source}' uses the unsupported element '{type(node).__name__}'.")
+    if isinstance(node, ast.Name) and node.id.startswith('_'):
+        raise ValueError(f"Calculation '{source}' uses the private name '{node.id}'.")
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ValueError(f"Calculation '{source}' calls a function that is not allowed.")
+        if any(keyword.arg is None for keyword in node.keywords):
+            raise ValueError(f"Calculation '{source}' uses '**' arguments.")
+
+
+@lru_cache(maxsize=1024)
+def compile_calculation(calc: str) -> CompiledCalculation:
+    """Validate and compile a `calc` expression, results are cached by the source string."""
+    if not isinstance(calc, str):
+        raise ValueError(f"Calculation '{calc}' is not a string.")
+    try:
+        tree = ast.parse(calc.strip(), mode='eval')
+    except SyntaxError as error:
+        raise ValueError(f"Calculation '{calc}' is not a valid Python expression: {error.msg}") from None
+
+    names = set()
+    for node in ast.walk(tree):
+        validate_node(node, calc)
+        if isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+            names.add(node.id)
+
+    return CompiledCalculation(calc, compile(tree, f'<calc {calc}>', 'eval'), frozenset(names))
+
+
+def evaluate(calc: str, namespace: Mapping[str, Any], functions: Optional[Mapping[str, Any]] = None) -> Any:
+    """Evaluate a `calc` expression with the parameter values in `namespace`.
+
+    `functions` replaces the whitelisted functions (e.g. with vectorized versions of the same names).
+    """
+    compiled = compile_calculation(calc)
+    missing = compiled.names.difference(namespace)
+    if missing:
+        raise ValueError(f"Calculation '{calc}' uses undefined parameters: {', '.join(sorted(missing))}.")
+
+    scope = _globals if functions is None else {'__builtins__': {}, **functions}
+    return eval(compiled.code, scope, {name: namespace[name] for name in compiled.names})
@@ -0,0 +1,179 @@
+"""
+Named choice catalogs (fonts, materials, thread sizes, ...) shared by all `ChoiceParameter`s of a process.
+
+A catalog source is registered by name (a mapping, a sequence, a `.csv`/`.json` file or a loader function) and
+loaded once, on first use. The loaded choices are interned and indexed once; parameters that use the catalog
+only reference it and keep their selected value.
+
+    register_catalog('materials', 'catalogs/materials.csv')
+    material = ChoiceParameter('material', catalog('materials'), 'PETG')
+"""
+
+#%% [Imports]
+import csv
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Union
+from .choices import ChoiceIndex
+
+#%% [Types]
+
+type Choices = Union[List, Dict]
+type CatalogSource = Union[Mapping, Sequence, str, Path, Callable[[], Union[Mapping, Sequence]]]
+
+#%% [Loaders]
+
+def intern_value(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def load_csv(file_name: Union[str, Path]) -> Choices:
+    """Load `value[,label]` rows, a first row `value,label` is treated as header."""
+    with open(file_name, encoding='utf-8', newline='') as stream:
+        rows = [row for row in csv.reader(stream) if row]
+    if rows and [cell.strip().lower() for cell in rows[0][:2]] in (['value'], ['value', 'label']):
+        rows = rows[1:]
+    if any(len(row) > 1 for row in rows):
+        return {row[0]: row[1] if len(row) > 1 else row[0] for row in rows}
+    return [row[0] for row in rows]
+
+
+def load_json(file_name: Union[str, Path]) -> Choices:
+    with open(file_name, encoding='utf-8') as stream:
+        return json.load(stream)
+
+
+LOADERS = {'.csv': load_csv, '.json': load_json}
+
+
+def load_source(name: str, source: CatalogSource) -> Choices:
+    if isinstance(source, (str, Path)):
+        loader = LOADERS.get(Path(source).suffix.lower())
+        if loader is None:
+            raise ValueError(f"Catalog '{name}' source '{source}' needs one of the suffixes {', '.join(LOADERS)}.")
+        source = loader(source)
+    elif callable(source):
+        source = source()
+
+    if isinstance(source, Mapping):
+        return {intern_value(value): intern_value(label) for value, label in source.items()}
+    if isinstance(source, (list, tuple)):
+        return [intern_value(value) for value in source]
+    raise ValueError(f"Catalog '{name}' source is not a mapping or a sequence of choices.")
+
+
+#%% [Main Class]
+
+class Catalog:
+    """A loaded, immutable choice catalog."""
+    __slots__ = ('_name', '_choices', '_index')
+
+    def __init__(self, name: str, choices: Choices):
+        self._name = name
+        self._choices = choices
+        self._index = ChoiceIndex(choices)
+        if not self._index.valid:
+            raise ValueError(f"Catalog '{name}' has no choices or choices of different types.")
+
+    def __repr__(self) -> str:
+        return f"Catalog({self._name}, {len(self)} choices)"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, value) -> bool:
+        return value in self._index
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def choices(self) -> Choices:
+        """The shared choices (a list or a `{value: label}` dict), do not modify them."""
+        return self._choices
+
+    @property
+    def index(self) -> ChoiceIndex:
+        return self._index
+
+
+class CatalogRegistry:
+    """Register catalog sources by name and load each of them once."""
+
+    def __init__(self):
+        self._sources: Dict[str, CatalogSource] = {}
+        self._catalogs: Dict[str, Catalog] = {}
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def register(self, name: str, source: CatalogSource, replace: bool = False) -> None:
+        with self._lock:
+            if name in self._sources and not replace:
+                raise ValueError(f"A catalog named '{name}' is already registered.")
+            self._sources[name] = source
+            self._catalogs.pop(name, None)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._sources.pop(name, None)
+            self._catalogs.pop(name, None)
+
+    def get(self, name: str) -> Catalog:
+        """Return the catalog, it is loaded on the first call."""
+        catalog = self._catalogs.get(name)
+        if catalog is not None:
+            return catalog
+
+        with self._lock:
+            if name not in self._sources:
+                raise ValueError(f"Catalog '{name}' is not registered.")
+            loading = self._loading.setdefault(name, threading.Lock())
+
+        # one loader runs per catalog, other callers of the same catalog wait for it; the registry lock is not
+        # held while loading, so a slow loader (the font scan) does not block other catalogs
+        with loading:
+            catalog = self._catalogs.get(name)
+            if catalog is not None:
+                return catalog
+            with self._lock:
+                source = self._sources.get(name)
+            if source is None:
+                raise ValueError(f"Catalog '{name}' is not registered.")
+
+            catalog = Catalog(name, load_source(name, source))
+            with self._lock:
+                if self._sources.get(name) is source:   # not replaced or unregistered while loading
+                    self._catalogs[name] = catalog
+                    self.loads += 1
+        return catalog
+
+    def reload(self, name: str) -> Catalog:
+        """Load the source again (e.g. after the catalog file changed)."""
+        with self._lock:
+            self._catalogs.pop(name, None)
+        return self.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def names(self) -> List[str]:
+        return sorted(self._sources)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._catalogs
+
+
+#%% [Shared instance]
+catalogs = CatalogRegistry()
+
+
+def register_catalog(name: str, source: CatalogSource, replace: bool = False) -> None:
+    catalogs.register(name, source, replace)
+
+
+def catalog(name: str) -> Catalog:
+    return catalogs.get(name)
@@ -0,0 +1,112 @@
+"""
+An index over the choices of a `ChoiceParameter` (material catalogs, fastener libraries, ...).
+
+A `ChoiceIndex` is built by the owner of the choices (a `ChoiceParameter` or a shared `Catalog`, whose index is
+used by all parameters of the catalog): membership and label lookups are hash lookups, the sorted keys are
+computed once and `search()` filters the options on the server, so a `ui.select` only receives the matching
+options. Choices are treated as immutable once they are indexed.
+"""
+
+#%% [Imports]
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+#%% [Main Class]
+
+class ChoiceIndex:
+    """Hash index of a list (values) or dict (`{value: label}`) of choices."""
+    __slots__ = ('_values', '_labels', '_positions', '_by_label', '_sorted', '_folded', '_valid')
+
+    def __init__(self, choices):
+        if isinstance(choices, dict):
+            self._values = tuple(choices)
+            items = tuple(choices.values())
+            self._labels = tuple(str(label) for label in items)
+        elif isinstance(choices, (list, tuple, set, frozenset)):
+            self._values = tuple(choices)
+            items = self._values
+            self._labels = tuple(str(value) for value in self._values)
+        else:
+            self._values = self._labels = items = ()
+
+        # a choice value defines a list of same values (for a dict: same labels)
+        item_type = type(items[0]) if items else None
+        self._valid = bool(items) and all(isinstance(item, item_type) for item in items)
+        try:
+            self._positions = {value: position for position, value in reversed(tuple(enumerate(self._values)))}
+        except TypeError:   # unhashable values
+            self._positions = {}
+            self._valid = False
+        self._by_label = {label: value for label, value in reversed(tuple(zip(self._labels, self._values)))}
+        self._sorted: Optional[Tuple] = None
+        self._folded: Optional[Tuple[str, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __contains__(self, value) -> bool:
+        try:
+            return value in self._positions
+        except TypeError:
+            return False
+
+    def __repr__(self) -> str:
+        return f"ChoiceIndex({len(self)} choices)"
+
+    @property
+    def valid(self) -> bool:
+        return self._valid
+
+    @property
+    def values(self) -> Tuple:
+        return self._values
+
+    @property
+    def sorted_keys(self) -> Tuple:
+        """The sorted values, computed once for all parameters that share the index."""
+        if self._sorted is None:
+            try:
+                self._sorted = tuple(sorted(self._values))
+            except TypeError:
+                self._sorted = self._values
+        return self._sorted
+
+    def position(self, value) -> Optional[int]:
+        return self._positions.get(value) if value in self else None
+
+    def label(self, value) -> str:
+        position = self.position(value)
+        if position is None:
+            raise ValueError(f"Choice '{value}' is not one of the {len(self)} choices.")
+        return self._labels[position]
+
+    def value_of(self, label: str) -> Any:
+        """Return the value of a label (the label of a list choice is the value as string)."""
+        if label not in self._by_label:
+            raise ValueError(f"Label '{label}' is not one of the {len(self)} choices.")
+        return self._by_label[label]
+
+    def search(self, text: str, limit: Optional[int] = 100) -> List:
+        """Return the values whose label contains `text` (case-insensitive), prefix matches first."""
+        if self._folded is None:
+            self._folded = tuple(label.casefold() for label in self._labels)
+
+        needle = (text or '').casefold()
+        if not needle:
+            return list(self._values[:limit])
+
+        prefix, contains = [], []
+        for value, label in zip(self._values, self._folded):
+            if label.startswith(needle):
+                prefix.append(value)
+                if limit is not None and len(prefix) >= limit:
+                    break
+            elif needle in label and (limit is None or len(contains) < limit):
+                contains.append(value)
+        return (prefix + contains)[:limit]
+
+    def options(self, values) -> Dict[Any, str]:
+        """Return `{value: label}` options (for `ui.select`) of the given values."""
+        return {value: self._labels[self._positions[value]] for value in values if value in self}
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from pathlib import Path
 from .parameter_base import Identifier
+from .source_cache import source_cache
 
 # TODO: is this really necessary (maybe yes if `ast` is used). But `RedBaron` can manipulate the values directly.
 
@@ -40,21 +41,38 @@ class CodeContext:
     def from_frame_info(cls, frame_info):
         return CodeContext(frame_info.filename, frame_info.lineno, frame_info.positions, frame_info.code_context)
     
+    @classmethod
+    def from_frame(cls, frame):
+        """Create a context from a frame object without touching the source file.
+        
+        Only file name and line number are stored, the source line is loaded on first use.
+        """
+        context = cls.__new__(cls)
+        context.file_name = frame.f_code.co_filename
+        context.line_number = frame.f_lineno
+        context.positions = None
+        context.code_context = None
+        return context
+    
     def __str__(self) -> str:
         return f"File: {self.file_name}:L{self.line_number}: {self.extract_code_context()}"
     
     def is_valid_file_name(self, value: str) -> bool:
-        return isinstance(value, str) and Path(value).exists()
+        return isinstance(value, str) and source_cache.exists(value)
     
     def is_valid_line_number(self, value: int) -> bool:
         value_type = isinstance(value, int)
         
-        with open(self.file_name) as f:
-            self.line_counter = sum(1 for _ in f)
+        # the file was just checked by `is_valid_file_name`, its `stat` is reused (no second `stat` call)
+        self.line_counter = source_cache.line_count(self.file_name, check=False)
             
         return value_type and value <= self.line_counter
 
     def extract_code_context(self) -> str:
+        if self.code_context is None and self.file_name and self.line_number:
+            line = source_cache.get_line(self.file_name, self.line_number)
+            self.code_context = [line] if line else []
+            
         if self.code_context:
             return "\n".join(self.code_context)
         return ""
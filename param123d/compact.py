@@ -0,0 +1,194 @@
+"""
+A slotted, memory-compact representation of parameters.
+
+A `CompactParameter` stores only its name, its value and a reference to an interned `ParameterSpec`, which holds
+the immutable metadata (type, help, unit, bounds, choices, ...) once for all parameters that share it.
+"""
+
+#%% [Imports]
+import copy
+import weakref
+from typing import Any, Callable, Hashable, Iterable, List, Optional
+from .parameter_base import BaseParameter, Identifier, UnionType
+from .parameter_types import ParameterType
+
+#%% [Helper Functions]
+
+class Identity:
+    """A key that compares an unhashable object by identity and keeps it alive (so its `id` cannot be reused)."""
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Identity) and other.value is self.value
+
+
+def frozen_items(items: tuple, freeze_items: Callable[[], tuple]) -> tuple:
+    # large choice lists hold hashable values, they are frozen item by item only if needed
+    try:
+        hash(items)
+    except TypeError:
+        return freeze_items()
+    return items
+
+
+def freeze(value: Any) -> Hashable:
+    """Return a hashable key for metadata values, lists and dicts (choices) are keyed by their content.
+    
+    A `Catalog` is immutable and keyed by identity (the key keeps it alive, so its `id` cannot be reused).
+    """
+    if isinstance(value, dict):
+        return ('dict', frozen_items(tuple(value.items()), lambda: tuple((key, freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, frozen_items(tuple(value), lambda: tuple(freeze(item) for item in value)))
+    if isinstance(value, set):
+        return ('set', frozenset(freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return Identity(value)
+    return value
+
+
+#%% [Spec]
+
+# the name and value, state derived from other attributes (the index of `_choices`) and the observers are not part of a spec key
+_KEY_EXCLUDED = ('_name', '_value', '_index', '_observers', '_groups')
+
+_specs: "weakref.WeakValueDictionary[Hashable, ParameterSpec]" = weakref.WeakValueDictionary()
+
+
+def spec_key(parameter: BaseParameter) -> Hashable:
+    attributes = vars(parameter)
+    # the choices of a catalog are identified by the catalog itself
+    excluded = _KEY_EXCLUDED + ('_choices',) if '_catalog' in attributes else _KEY_EXCLUDED
+    return (type(parameter), tuple((name, freeze(value)) for name, value in attributes.items() if name not in excluded))
+
+
+class ParameterSpec:
+    """Immutable, interned metadata of a parameter, backed by one shared prototype instance."""
+    __slots__ = ('_prototype', '_key', '__weakref__')
+
+    def __init__(self, prototype: BaseParameter, key: Hashable):
+        self._prototype = prototype
+        self._key = key
+
+    @classmethod
+    def of(cls, parameter: BaseParameter) -> 'ParameterSpec':
+        """Return the interned spec for the metadata of `parameter`."""
+        key = spec_key(parameter)
+        spec = _specs.get(key)
+        if spec is None:
+            prototype = copy.copy(parameter)
+            # parameters created from a spec start without listeners and groups, name and value are set by `create`
+            for name in ('_observers', '_groups'):
+                vars(prototype).pop(name, None)
+            prototype._name = prototype._value = None
+            # the prototype must not share mutable metadata with `parameter` (catalog choices are immutable)
+            for name, value in vars(prototype).items():
+                if isinstance(value, (list, dict, set)) and not (name == '_choices' and '_catalog' in vars(prototype)):
+                    setattr(prototype, name, copy.copy(value))
+            spec = _specs.setdefault(key, cls(prototype, key))
+        return spec
+
+    def __repr__(self) -> str:
+        return f"ParameterSpec({self.kind.__name__}, {self.param_type})"
+
+    def is_valid_type(self, value: UnionType) -> bool:
+        return self._prototype.is_valid_type(value)
+
+    def create(self, name: Identifier, value: UnionType) -> BaseParameter:
+        """Create a full parameter object with this metadata, `name` and `value`."""
+        parameter = copy.copy(self._prototype)
+        parameter._name = name
+        parameter._value = value
+        return parameter
+
+    @property
+    def kind(self) -> type:
+        return type(self._prototype)
+
+    @property
+    def param_type(self) -> ParameterType:
+        return self._prototype.param_type
+
+    @property
+    def help(self) -> Optional[str]:
+        return self._prototype.help
+
+    @property
+    def unit(self) -> Optional[str]:
+        return getattr(self._prototype, 'unit', None)
+
+    @property
+    def min_value(self) -> Optional[UnionType]:
+        return getattr(self._prototype, 'min_value', None)
+
+    @property
+    def max_value(self) -> Optional[UnionType]:
+        return getattr(self._prototype, 'max_value', None)
+
+    @property
+    def step_value(self) -> Optional[UnionType]:
+        return getattr(self._prototype, 'step_value', None)
+
+
+#%% [Main Class]
+
+class CompactParameter:
+    """A parameter name and value plus a reference to its shared `ParameterSpec`."""
+    __slots__ = ('_spec', '_name', '_value')
+
+    def __init__(self, spec: ParameterSpec, name: Identifier, value: UnionType):
+        if not spec.is_valid_type(value):
+            raise ValueError(f"Parameter value '{value}' is not a valid value for type '{spec.param_type}'.")
+        self._spec = spec
+        self._name = name
+        self._value = value
+
+    @classmethod
+    def from_parameter(cls, parameter: BaseParameter) -> 'CompactParameter':
+        compact = cls.__new__(cls)
+        compact._spec = ParameterSpec.of(parameter)
+        compact._name = parameter.name
+        compact._value = parameter.value
+        return compact
+
+    def __str__(self) -> str:
+        return f"{self.name} = {self._value} {self.param_type}"
+
+    def __repr__(self) -> str:
+        return f"CompactParameter({self.name}, {self._value}, {self.param_type})"
+
+    def to_parameter(self) -> BaseParameter:
+        return self._spec.create(self._name, self._value)
+
+    @property
+    def spec(self) -> ParameterSpec:
+        return self._spec
+
+    @property
+    def name(self) -> Identifier:
+        return self._name
+
+    @property
+    def param_type(self) -> ParameterType:
+        return self._spec.param_type
+
+    @property
+    def value(self) -> UnionType:
+        return self._value
+
+    def set_value(self, value: UnionType) -> None:
+        if not self._spec.is_valid_type(value):
+            raise ValueError(f"Parameter value '{value}' is not a valid value for type '{self.param_type}'.")
+        self._value = value
+
+
+def compact(parameters: Iterable[BaseParameter]) -> List[CompactParameter]:
+    return [CompactParameter.from_parameter(parameter) for parameter in parameters]
@@ -0,0 +1,152 @@
+"""
+A dependency graph between parameters and the `CalculationParameter`s that read them.
+"""
+
+#%% [Imports]
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Set, Tuple
+from .calculation import compile_calculation
+from .observers import batch, notify
+from .parameter_base import BaseParameter, CalculationParameter, Identifier, UnionType
+
+#%% [Main Class]
+
+class DependencyGraph:
+    """Recompute calculated parameters in topological order when one of their inputs changes.
+    
+    The graph is built from the names each `calc` expression reads. Cycles and references to unknown
+    names are reported when the graph is created. `constants` may provide additional global values.
+    """
+
+    def __init__(self, parameters: Iterable[BaseParameter], constants: Optional[Mapping[str, Any]] = None):
+        self._parameters: Dict[Identifier, BaseParameter] = {}
+        for parameter in parameters:
+            if parameter.name in self._parameters:
+                raise ValueError(f"Parameter name '{parameter.name}' is used more than once.")
+            self._parameters[parameter.name] = parameter
+        
+        self._namespace = {**(constants or {}), **self._parameters}
+        self._inputs: Dict[Identifier, FrozenSet[Identifier]] = {}
+        self._dependents: Dict[Identifier, Set[Identifier]] = {name: set() for name in self._parameters}
+        
+        for name, parameter in self._parameters.items():
+            if not isinstance(parameter, CalculationParameter) or not parameter.calc:
+                continue
+            
+            inputs = compile_calculation(parameter.calc).names
+            unknown = inputs.difference(self._namespace)
+            if unknown:
+                raise ValueError(f"Parameter '{name}' uses undefined parameters: {', '.join(sorted(unknown))}.")
+            
+            self._inputs[name] = inputs
+            for input_name in inputs.intersection(self._parameters):
+                self._dependents[input_name].add(name)
+        
+        try:
+            order = TopologicalSorter({name: inputs.intersection(self._parameters) for name, inputs in self._inputs.items()}).static_order()
+            self._order = tuple(name for name in order if name in self._inputs)
+        except CycleError as error:
+            raise ValueError(f"Calculations form a cycle: {' -> '.join(error.args[1])}.") from None
+        
+        self._rank = {name: index for index, name in enumerate(self._order)}
+        self._downstream: Dict[Identifier, Tuple[Identifier, ...]] = {}
+
+    def __contains__(self, name: Identifier) -> bool:
+        return name in self._parameters
+
+    def __getitem__(self, name: Identifier) -> BaseParameter:
+        return self._parameters[name]
+
+    def downstream(self, name: Identifier) -> Tuple[Identifier, ...]:
+        """Return all calculations that depend (directly or indirectly) on `name` in evaluation order."""
+        if name not in self._downstream:
+            if name not in self._parameters:
+                raise ValueError(f"Parameter '{name}' is not part of the graph.")
+            
+            found = set()
+            pending = [name]
+            while pending:
+                for dependent in self._dependents[pending.pop()]:
+                    if dependent not in found:
+                        found.add(dependent)
+                        pending.append(dependent)
+            self._downstream[name] = tuple(sorted(found, key=self._rank.__getitem__))
+        return self._downstream[name]
+
+    def set_value(self, name: Identifier, value: UnionType) -> Dict[Identifier, UnionType]:
+        """Set an input value and recompute its downstream calculations."""
+        return self.update({name: value})
+
+    def update(self, values: Mapping[Identifier, UnionType]) -> Dict[Identifier, UnionType]:
+        """Set several input values and recompute every affected calculation once.
+        
+        All values are validated before any is set. If a recalculation fails, the inputs and calculations are
+        restored and the error is raised. Returns the new values of the recomputed calculations.
+        """
+        self.validate(values)
+        names = self.affected(values)
+        previous = [(parameter, parameter.value) for parameter in map(self._parameters.__getitem__, (*values, *names))]
+        # listeners are notified once the update is complete, a rolled back update is not delivered
+        with batch():
+            try:
+                for name, value in values.items():
+                    self._parameters[name].set_value(value)
+                return self.recompute(names)
+            except BaseException:
+                for parameter, old in reversed(previous):
+                    notify(parameter, parameter.value, old)
+                    parameter._value = old
+                raise
+
+    def evaluate(self, values: Mapping[Identifier, UnionType]) -> Dict[Identifier, UnionType]:
+        """Return the calculations affected by `values` as if they were set, without changing any parameter.
+        
+        The calculations are evaluated on plain values, so no listener is notified (e.g. for the variants of an exploration).
+        """
+        self.validate(values)
+        namespace = {**self.values(), **values}
+        results = {}
+        for name in self.affected(values):
+            parameter = self._parameters[name]
+            value = namespace[name] = results[name] = parameter.evaluate(namespace)
+            if not parameter.is_valid_type(value):
+                raise ValueError(f"Parameter value '{value}' is not a valid value for type '{parameter.param_type}'.")
+        return results
+
+    def validate(self, values: Mapping[Identifier, UnionType]) -> None:
+        """Raise a `ValueError` for unknown names and values of the wrong type."""
+        for name, value in values.items():
+            if name not in self._parameters:
+                raise ValueError(f"Parameter '{name}' is not part of the graph.")
+            parameter = self._parameters[name]
+            if not parameter.is_valid_type(value):
+                raise ValueError(f"Parameter value '{value}' is not a valid value for type '{parameter.param_type}'.")
+
+    def affected(self, names: Iterable[Identifier]) -> Tuple[Identifier, ...]:
+        """Return the union of the downstream calculations of `names` in evaluation order."""
+        found = set()
+        for name in names:
+            found.update(self.downstream(name))
+        return tuple(sorted(found, key=self._rank.__getitem__))
+
+    def recompute(self, names: Optional[Iterable[Identifier]] = None) -> Dict[Identifier, UnionType]:
+        """Recompute the given calculations (in the given order) or all of them."""
+        results = {}
+        for name in self._order if names is None else names:
+            results[name] = self._parameters[name].recalculate(self._namespace)
+        return results
+
+    def values(self) -> Dict[str, Any]:
+        """Return the constants and the current parameter values as plain values."""
+        return {name: value.value if isinstance(value, BaseParameter) else value for name, value in self._namespace.items()}
+
+    @property
+    def order(self) -> Tuple[Identifier, ...]:
+        return self._order
+
+    @property
+    def parameters(self) -> Dict[Identifier, BaseParameter]:
+        return self._parameters
+
+    def inputs(self, name: Identifier) -> FrozenSet[Identifier]:
+        return self._inputs.get(name, frozenset())
@@ -0,0 +1,163 @@
+"""
+Design-space exploration: evaluate a model function for many parameter variants on a process pool.
+
+Variants are plain `{name: value}` snapshots. They are sent to the workers in chunks as a tuple of names
+plus rows of values, so the pickled payload stays small no matter how large the parameter objects are.
+"""
+
+#%% [Imports]
+import itertools
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from .dependencies import DependencyGraph
+from .parameter_base import BaseParameter, Identifier, RangeParameter, UnionType
+from .parameter_types import ParameterType
+from .parameters import ChoiceParameter
+
+#%% [Types]
+
+type Variant = Dict[Identifier, UnionType]
+
+
+class VariantResult(NamedTuple):
+    index: int
+    values: Variant
+    result: Any
+    error: Optional[BaseException]
+
+
+#%% [Sampling]
+
+def parameter_levels(parameter: BaseParameter) -> Tuple[UnionType, ...]:
+    """Return the discrete values a parameter can take during an exploration."""
+    if isinstance(parameter, ChoiceParameter):
+        return tuple(parameter.choices)
+    if isinstance(parameter, RangeParameter) and None not in (parameter.min_value, parameter.max_value) and parameter.step_value:
+        count = int(round((parameter.max_value - parameter.min_value) / parameter.step_value)) + 1
+        value_type = type(parameter.value)
+        return tuple(value_type(parameter.min_value + index * parameter.step_value) for index in range(count))
+    if parameter.param_type == ParameterType.BooleanParameter:
+        return (False, True)
+    return (parameter.value,)
+
+
+def cartesian_product(parameters: Sequence[BaseParameter]) -> Iterator[Variant]:
+    """Yield every combination of the parameter levels (lazily)."""
+    names = [parameter.name for parameter in parameters]
+    for values in itertools.product(*(parameter_levels(parameter) for parameter in parameters)):
+        yield dict(zip(names, values))
+
+
+def latin_hypercube(parameters: Sequence[BaseParameter], samples: int, seed: Optional[int] = None) -> List[Variant]:
+    """Draw a Latin-hypercube sample: every parameter hits each of its `samples` strata exactly once."""
+    if samples < 1:
+        raise ValueError(f"Sample count '{samples}' must be at least 1.")
+
+    generator = random.Random(seed)
+    columns = []
+    for parameter in parameters:
+        levels = parameter_levels(parameter)
+        strata = list(range(samples))
+        generator.shuffle(strata)
+        columns.append([levels[min(int((stratum + generator.random()) / samples * len(levels)), len(levels) - 1)] for stratum in strata])
+
+    names = [parameter.name for parameter in parameters]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+#%% [Runner]
+
+def run_chunk(model: Callable[[Variant], Any], names: Tuple[Identifier, ...], rows: List[Tuple[int, Tuple]]) -> List[Tuple[int, Any, Optional[BaseException]]]:
+    """Worker entry point: evaluate the model for each row of a chunk."""
+    results = []
+    for index, values in rows:
+        try:
+            results.append((index, model(dict(zip(names, values))), None))
+        except Exception as error:
+            results.append((index, None, error))
+    return results
+
+
+class Exploration:
+    """Evaluate `model(values)` for every variant on a `ProcessPoolExecutor` and stream the results.
+
+    `model` must be picklable (a module level function). When a `graph` is given, the calculated
+    values are added to each variant before it is sent to the workers, the parameters keep their values. Iterating yields
+    `VariantResult`s in completion order; `cancel()` stops submitting and drops pending chunks.
+    """
+
+    def __init__(self, model: Callable[[Variant], Any], variants: Iterable[Variant], max_workers: Optional[int] = None, chunksize: int = 1, graph: Optional[DependencyGraph] = None):
+        if chunksize < 1:
+            raise ValueError(f"Chunk size '{chunksize}' must be at least 1.")
+
+        self._model = model
+        self._variants = variants
+        self._max_workers = max_workers
+        self._chunksize = chunksize
+        self._graph = graph
+        self._cancelled = False
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cancel()
+
+    def __iter__(self) -> Iterator[VariantResult]:
+        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        pending: Set[Future] = set()
+        snapshots: Dict[int, Variant] = {}
+        chunks = self._chunks(snapshots)
+        limit = 2 * (self._max_workers or os.cpu_count() or 1)
+
+        try:
+            while not self._cancelled:
+                for names, rows in itertools.islice(chunks, limit - len(pending)):
+                    pending.add(self._executor.submit(run_chunk, self._model, names, rows))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, result, error in future.result():
+                        yield VariantResult(index, snapshots.pop(index), result, error)
+                        if self._cancelled:
+                            return
+        finally:
+            for future in pending:
+                future.cancel()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _chunks(self, snapshots: Dict[int, Variant]) -> Iterator[Tuple[Tuple[Identifier, ...], List[Tuple[int, Tuple]]]]:
+        names = None
+        rows = []
+        for index, variant in enumerate(self._variants):
+            if self._graph is not None:
+                # evaluated on plain values, the parameters of the graph (and their listeners) are not touched
+                variant = {**variant, **self._graph.evaluate(variant)}
+            if names is None:
+                names = tuple(variant)
+
+            snapshots[index] = variant
+            rows.append((index, tuple(variant[name] for name in names)))
+            if len(rows) == self._chunksize:
+                yield names, rows
+                rows = []
+        if rows:
+            yield names, rows
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+
+def explore(model: Callable[[Variant], Any], variants: Iterable[Variant], max_workers: Optional[int] = None, chunksize: int = 1, graph: Optional[DependencyGraph] = None) -> List[VariantResult]:
+    """Run a complete exploration and return the results ordered by variant index."""
+    return sorted(Exploration(model, variants, max_workers, chunksize, graph), key=lambda result: result.index)
@@ -0,0 +1,282 @@
+"""
+Installed font families for `FontParameter`s (the "fonts" catalog and font name validation).
+
+The font directories are scanned once, on a background thread, and the family names are read from the `name`
+table of the TrueType/OpenType files. The result is cached on disk per directory together with the directory
+modification time, a later start only re-reads directories whose content changed.
+"""
+
+#%% [Imports]
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from .catalogs import register_catalog
+
+#%% [Types]
+
+class FontValidation(Enum):
+    LENIENT = "lenient"     # any font name is accepted
+    STRICT = "strict"       # the font family must be installed (waits for the scan)
+
+
+FONT_SUFFIXES = ('.ttf', '.otf', '.ttc', '.otc')
+CACHE_VERSION = 1
+DEFAULT_FONT = 'Arial'
+
+# name IDs of the family names: font family and typographic family
+FAMILY_NAME_IDS = (1, 16)
+
+_u16 = struct.Struct('>H')
+_u32 = struct.Struct('>I')
+_table_record = struct.Struct('>4sIII')
+_name_record = struct.Struct('>HHHHHH')
+
+#%% [Font Files]
+
+def font_directories() -> List[Path]:
+    """Return the existing font directories of the platform (system and user)."""
+    home = Path.home()
+    if sys.platform == 'win32':
+        candidates = [Path(os.environ.get('WINDIR', 'C:/Windows')) / 'Fonts', Path(os.environ.get('LOCALAPPDATA', home)) / 'Microsoft' / 'Windows' / 'Fonts']
+    elif sys.platform == 'darwin':
+        candidates = [Path('/System/Library/Fonts'), Path('/Library/Fonts'), home / 'Library' / 'Fonts']
+    else:
+        data_home = Path(os.environ.get('XDG_DATA_HOME', home / '.local' / 'share'))
+        candidates = [Path('/usr/share/fonts'), Path('/usr/local/share/fonts'), data_home / 'fonts', home / '.fonts']
+    return [directory for directory in candidates if directory.is_dir()]
+
+
+def decode_name(platform_id: int, data: bytes) -> Optional[str]:
+    if platform_id in (0, 3):
+        return data.decode('utf-16-be', errors='replace')
+    if platform_id == 1:
+        return data.decode('mac_roman', errors='replace')
+    return None
+
+
+def read_names(stream, font_offset: int) -> Set[str]:
+    """Read the family names of the font that starts at `font_offset` (a TrueType/OpenType offset table)."""
+    stream.seek(font_offset + 4)
+    count = _u16.unpack(stream.read(2))[0]
+    stream.seek(font_offset + 12)
+    records = stream.read(_table_record.size * count)
+
+    for index in range(count):
+        tag, _, offset, length = _table_record.unpack_from(records, index * _table_record.size)
+        if tag == b'name':
+            break
+    else:
+        return set()
+
+    stream.seek(offset)
+    table = stream.read(length)
+    _, name_count, string_offset = struct.unpack_from('>HHH', table)
+
+    # prefer the English (US) Windows names, other records are used if there are none
+    preferred, other = set(), set()
+    for index in range(name_count):
+        platform_id, _, language_id, name_id, size, start = _name_record.unpack_from(table, 6 + index * _name_record.size)
+        if name_id not in FAMILY_NAME_IDS:
+            continue
+        begin = string_offset + start
+        name = decode_name(platform_id, table[begin:begin + size])
+        if name and name.strip('\x00 '):
+            (preferred if (platform_id, language_id) == (3, 0x409) else other).add(name.strip('\x00 '))
+    return preferred or other
+
+
+def read_font_families(file_name) -> Set[str]:
+    """Return the family names of a `.ttf`/`.otf` file or of all fonts of a `.ttc`/`.otc` collection."""
+    with open(file_name, 'rb') as stream:
+        tag = stream.read(4)
+        if tag == b'ttcf':
+            stream.seek(8)
+            count = _u32.unpack(stream.read(4))[0]
+            offsets = struct.unpack(f'>{count}I', stream.read(4 * count))
+        elif tag in (b'\x00\x01\x00\x00', b'OTTO', b'true'):
+            offsets = (0,)
+        else:
+            raise ValueError(f"Font file '{file_name}' is not a TrueType or OpenType font.")
+
+        families = set()
+        for offset in offsets:
+            families |= read_names(stream, offset)
+        return families
+
+
+#%% [Scanner]
+
+def default_cache_file() -> Path:
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'param123d' / 'fonts.json'
+
+
+class FontScanner:
+    """Scan font directories once (on a background thread) and cache the families per directory on disk."""
+
+    def __init__(self, directories: Optional[Iterable[Path]] = None, cache_file: Optional[Path] = None):
+        self._directories = [Path(directory) for directory in directories] if directories is not None else None
+        self._cache_file = Path(cache_file) if cache_file is not None else None
+        self._families: Optional[Dict[str, List[str]]] = None
+        self._cached_names: Optional[List[str]] = None
+        self._folded: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.parsed_files = 0
+
+    def start(self) -> 'FontScanner':
+        """Start the scan on a background thread (once)."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='param123d-fonts', daemon=True)
+                self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self.start()
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def families(self) -> Dict[str, List[str]]:
+        """`{family: [font files]}` of the installed fonts (waits for the scan)."""
+        self.wait()
+        return self._families
+
+    def names(self) -> List[str]:
+        return sorted(self.families, key=str.casefold)
+
+    def cached_names(self) -> List[str]:
+        """The family names without waiting: the scan result if it is ready, else the names of the last (cached) scan."""
+        if self.ready:
+            return self.names()
+        if self._cached_names is None:
+            cached = {name for entry in self._load_cache().values() for names in entry['files'].values() for name in names}
+            self._cached_names = sorted(cached, key=str.casefold)
+        return self._cached_names
+
+    def is_installed(self, family: str) -> bool:
+        self.wait()
+        return isinstance(family, str) and family.casefold() in self._folded
+
+    def _run(self) -> None:
+        try:
+            self._families = self.scan()
+        except Exception:  # pragma: no cover - a broken scan must not block waiting callers
+            logging.exception("Font scan failed")
+            self._families = {}
+        self._folded = {family.casefold(): family for family in self._families}
+        self._done.set()
+
+    def scan(self) -> Dict[str, List[str]]:
+        directories = self._directories if self._directories is not None else font_directories()
+        cache = self._load_cache()
+        entries = {}
+        for directory in directories:
+            self._scan_directory(str(directory), cache, entries)
+        if entries != cache:
+            self._save_cache(entries)
+
+        families: Dict[str, List[str]] = {}
+        for directory, entry in entries.items():
+            for file_name, names in entry['files'].items():
+                for name in names:
+                    families.setdefault(name, []).append(os.path.join(directory, file_name))
+        return families
+
+    def _scan_directory(self, directory: str, cache: dict, entries: dict) -> None:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+
+        entry = cache.get(directory)
+        if entry is None or entry['mtime_ns'] != mtime_ns:
+            entry = self._read_directory(directory, mtime_ns, entry)
+        entries[directory] = entry
+        for name in entry['directories']:
+            self._scan_directory(os.path.join(directory, name), cache, entries)
+
+    def _read_directory(self, directory: str, mtime_ns: int, previous: Optional[dict]) -> dict:
+        known = previous['files'] if previous else {}
+        files, directories = {}, []
+        try:
+            items = list(os.scandir(directory))
+        except OSError:
+            items = []
+
+        for item in items:
+            if item.is_dir(follow_symlinks=False):
+                directories.append(item.name)
+            elif item.name.lower().endswith(FONT_SUFFIXES):
+                if item.name in known:
+                    files[item.name] = known[item.name]
+                    continue
+                try:
+                    files[item.name] = sorted(read_font_families(item.path))
+                except (OSError, ValueError, struct.error):
+                    continue
+                self.parsed_files += 1
+        return {'mtime_ns': mtime_ns, 'files': files, 'directories': sorted(directories)}
+
+    def _load_cache(self) -> dict:
+        if self._cache_file is None:
+            return {}
+        try:
+            document = json.loads(self._cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(document, dict) or document.get('version') != CACHE_VERSION:
+            return {}
+        return document.get('directories', {})
+
+    def _save_cache(self, entries: dict) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self._cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(json.dumps({'version': CACHE_VERSION, 'directories': entries}), encoding='utf-8')
+            os.replace(temporary, self._cache_file)
+        except OSError:
+            pass  # the disk cache is optional
+
+
+#%% [Shared instance]
+font_scanner = FontScanner(cache_file=default_cache_file())
+font_validation = FontValidation.LENIENT
+
+
+def set_font_validation(mode: FontValidation) -> None:
+    """Select how font names are validated, `STRICT` starts the font scan right away."""
+    global font_validation
+    if not isinstance(mode, FontValidation):
+        raise ValueError(f"Font validation '{mode}' is not a valid mode.")
+    font_validation = mode
+    if mode == FontValidation.STRICT:
+        font_scanner.start()
+
+
+def is_font_name(name: str) -> bool:
+    if not isinstance(name, str):
+        return False
+    if font_validation == FontValidation.STRICT:
+        return font_scanner.is_installed(name)
+    return True
+
+
+def font_names() -> List[str]:
+    # a system without any font files still gets a usable catalog
+    return font_scanner.names() or [DEFAULT_FONT]
+
+
+register_catalog('fonts', font_names)
@@ -0,0 +1,195 @@
+"""
+A content-hash keyed cache of rendered help HTML (markdown and reStructuredText).
+
+Rendered help is kept in an LRU in memory and, optionally, as files in a size-bounded cache directory, so a
+restarted UI does not need to run markdown2 or docutils again for the same help text.
+"""
+
+#%% [Imports]
+import hashlib
+import importlib
+import os
+import textwrap
+from collections import OrderedDict
+from functools import lru_cache, singledispatch
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+from .parameter_base import BaseParameter, HelpType, detect_help_type
+from .parameters import BooleanParameter, IntegerParameter
+
+#%% [Renderer]
+
+MARKDOWN_EXTRAS = ['fenced-code-blocks', 'tables']
+RENDERERS = {HelpType.MARKDOWN: 'markdown2', HelpType.RESTRUCTURED_TEXT: 'docutils'}
+
+
+def default_directory() -> Path:
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'param123d' / 'help'
+
+
+def render_help(text: str, help_type: HelpType) -> str:
+    """Render help text to HTML (the same conversion `ui.markdown` and `ui.rst` use)."""
+    content = textwrap.dedent(text).strip('\n')
+    if help_type == HelpType.MARKDOWN:
+        import markdown2
+        return markdown2.markdown(content, extras=MARKDOWN_EXTRAS)
+    if help_type == HelpType.RESTRUCTURED_TEXT:
+        from docutils.core import publish_parts
+        html = publish_parts(content, writer_name='html4', settings_overrides={'syntax_highlight': 'short'})
+        return html['html_body'].replace('<div class="document"', '<div class="codehilite"')
+    raise ValueError(f"Help type '{help_type}' is not rendered to HTML.")
+
+
+@lru_cache(maxsize=None)
+def renderer_version(help_type: HelpType) -> str:
+    """Return the renderer and its version (part of the cache key, an update renders the help again)."""
+    module = RENDERERS.get(help_type)
+    if module is None:
+        return ''
+    try:
+        version = getattr(importlib.import_module(module), '__version__', '')
+    except ImportError:
+        version = ''
+    options = ','.join(MARKDOWN_EXTRAS) if help_type == HelpType.MARKDOWN else ''
+    return f"{module} {version} {options}"
+
+
+#%% [Help Text]
+
+@singledispatch
+def help_text(parameter: BaseParameter) -> Optional[Tuple[str, HelpType]]:
+    """Return the help text and type the user interface renders for `parameter` (`None` for a plain label)."""
+    if parameter.help_type in (HelpType.MARKDOWN, HelpType.RESTRUCTURED_TEXT):
+        return parameter.help, parameter.help_type
+    return None
+
+
+@help_text.register
+def boolean_help_text(parameter: BooleanParameter) -> Optional[Tuple[str, HelpType]]:
+    return parameter.help or '', HelpType.MARKDOWN
+
+
+@help_text.register
+def integer_help_text(parameter: IntegerParameter) -> Optional[Tuple[str, HelpType]]:
+    return (parameter.help or '') + f'\n- Min: {parameter.min_value},\n- Max: {parameter.max_value}', HelpType.MARKDOWN
+
+
+#%% [Main Class]
+
+class HelpCache:
+    """Cache rendered help HTML by a hash of help type, renderer version and text.
+
+    The files in `directory` are limited to `max_disk_bytes`, the least recently used ones are removed first.
+    """
+
+    def __init__(self, max_entries: int = 1024, directory: Optional[Path] = None, max_disk_bytes: int = 16 * 2**20):
+        if max_entries < 1 or max_disk_bytes < 1:
+            raise ValueError(f"Cache size '{max_entries}' and disk size '{max_disk_bytes}' must be at least 1.")
+
+        self._max_entries = max_entries
+        self._directory = Path(directory) if directory is not None else None
+        self._max_disk_bytes = max_disk_bytes
+        self._disk_bytes: Optional[int] = None    # counted on the first save
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(text: str, help_type: HelpType) -> str:
+        return hashlib.sha256(f"{help_type.value}\0{renderer_version(help_type)}\0{text}".encode('utf-8', errors='surrogatepass')).hexdigest()
+
+    def render(self, text: str, help_type: Optional[HelpType] = None) -> str:
+        """Return the HTML of a markdown or reStructuredText help text."""
+        help_type = help_type or detect_help_type(text)
+        key = self.key(text, help_type)
+
+        html = self._entries.get(key)
+        if html is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return html
+
+        html = self._load(key)
+        if html is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            html = render_help(text, help_type)
+            self._save(key, html)
+
+        self._entries[key] = html
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return html
+
+    def warm(self, parameters: Iterable[BaseParameter]) -> int:
+        """Render the help the user interface shows for the parameters (see `help_text`), returns the count."""
+        count = 0
+        for parameter in parameters:
+            rendered = help_text(parameter)
+            if rendered is not None:
+                self.render(*rendered)
+                count += 1
+        return count
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _load(self, key: str) -> Optional[str]:
+        if self._directory is None:
+            return None
+        path = self._directory / f"{key}.html"
+        try:
+            html = path.read_text(encoding='utf-8')
+            os.utime(path)    # the modification time orders the eviction
+        except OSError:
+            return None
+        return html
+
+    def _save(self, key: str, html: str) -> None:
+        if self._directory is None:
+            return
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._files())
+            temporary = self._directory / f"{key}.{os.getpid()}.tmp"
+            temporary.write_text(html, encoding='utf-8')
+            os.replace(temporary, self._directory / f"{key}.html")
+            self._disk_bytes += len(html.encode('utf-8'))
+            if self._disk_bytes > self._max_disk_bytes:
+                self._evict()
+        except OSError:
+            pass  # the disk cache is optional
+
+    def _files(self):
+        """Yield `(mtime, size, path)` of the cached files."""
+        for path in self._directory.glob('*.html'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue    # removed by another process
+            yield stat.st_mtime, stat.st_size, path
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the cache fits into `max_disk_bytes`."""
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self._max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return self._directory
+
+
+#%% [Shared instance]
+help_cache = HelpCache(directory=default_directory())
@@ -0,0 +1,140 @@
+"""
+Change notification for parameters and parameter groups.
+
+Parameter listeners are called with a `ChangeEvent(parameter, old, new)` for every value change, group
+listeners with the list of all changes of their parameters. Inside `batch()` the changes are collected (one
+event per parameter, from the first old to the last new value) and every listener is called once when the
+outermost batch ends.
+
+Listeners are weakly referenced by default: a bound method or function is dropped once its owner is garbage
+collected. Use `weak=False` for lambdas and closures that nothing else keeps alive.
+"""
+
+#%% [Imports]
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+if TYPE_CHECKING:   # `parameter_base` imports this module
+    from .parameter_base import BaseParameter
+
+#%% [Types]
+
+class ChangeEvent(NamedTuple):
+    parameter: 'BaseParameter'
+    old: Any
+    new: Any
+
+    @property
+    def name(self) -> str:
+        return self.parameter.name
+
+
+type Listener = Callable[[Any], Any]
+
+#%% [Observers]
+
+class Observers:
+    """A list of (weakly referenced) listeners."""
+    __slots__ = ('_references',)
+
+    def __init__(self):
+        self._references: List[Callable[[], Optional[Listener]]] = []
+
+    def subscribe(self, listener: Listener, weak: bool = True) -> Callable[[], None]:
+        """Register a listener and return a function that removes it again."""
+        if not callable(listener):
+            raise ValueError(f"Listener '{listener}' is not callable.")
+
+        try:
+            if not weak:
+                reference = lambda: listener
+            elif hasattr(listener, '__self__') and hasattr(listener, '__func__'):
+                reference = weakref.WeakMethod(listener, self._discard)
+            else:
+                reference = weakref.ref(listener, self._discard)
+        except TypeError:   # e.g. builtin functions cannot be weakly referenced
+            reference = lambda: listener
+        self._references.append(reference)
+        return lambda: self._discard(reference)
+
+    def _discard(self, reference) -> None:
+        if reference in self._references:
+            self._references.remove(reference)
+
+    def dispatch(self, argument: Any) -> None:
+        for reference in list(self._references):
+            listener = reference()
+            if listener is None:
+                continue
+            try:
+                listener(argument)
+            except Exception:
+                # a failing listener must not stop the others (e.g. a closed UI element)
+                logging.exception("Change listener %r failed", listener)
+
+    def __len__(self) -> int:
+        return sum(1 for reference in self._references if reference() is not None)
+
+    def __bool__(self) -> bool:
+        return bool(self._references)
+
+
+#%% [Notification]
+
+_state = threading.local()
+
+
+def _pending() -> Optional[Dict[int, ChangeEvent]]:
+    return getattr(_state, 'pending', None)
+
+
+def notify(parameter: 'BaseParameter', old: Any, new: Any) -> None:
+    """Deliver a value change now or, inside `batch()`, when the batch ends."""
+    pending = _pending()
+    if pending is not None:
+        previous = pending.get(id(parameter))
+        pending[id(parameter)] = ChangeEvent(parameter, previous.old if previous else old, new)
+        return
+    dispatch([ChangeEvent(parameter, old, new)])
+
+
+def dispatch(events: List[ChangeEvent]) -> None:
+    """Call the parameter listeners once per event and the group listeners once with their events."""
+    groups: Dict[int, Any] = {}
+    group_events: Dict[int, List[ChangeEvent]] = {}
+    for event in events:
+        parameter = event.parameter
+        if parameter._observers:
+            parameter._observers.dispatch(event)
+        for group in parameter._groups:
+            if group._observers:
+                groups[id(group)] = group
+                group_events.setdefault(id(group), []).append(event)
+
+    for key, group in groups.items():
+        group._observers.dispatch(group_events[key])
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Collect the changes of the block and notify every listener once at the end (nested batches join the outer one)."""
+    if _pending() is not None:
+        yield
+        return
+
+    _state.pending = {}
+    try:
+        yield
+    finally:
+        pending, _state.pending = _state.pending, None
+        # changes that were reverted within the batch are not delivered
+        events = [event for event in pending.values() if event.old != event.new]
+        if events:
+            dispatch(events)
+
+
+def in_batch() -> bool:
+    return _pending() is not None
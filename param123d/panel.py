@@ -0,0 +1,129 @@
+"""
+A lazily rendered, virtualized NiceGUI panel for parameter groups.
+
+Only expanded `ParameterGroup`s (`ui.expansion`) get elements, and only for the rows inside (or close to)
+the visible part of their scroll area. Help texts are rendered when they are requested.
+"""
+
+#%% [Imports]
+import logging
+import time
+from typing import Dict, Iterable, List, Optional
+from nicegui import ui
+from . import fonts
+from .parameter_base import BaseParameter
+from .parameter_groups import ParameterGroup
+from .ui import create_ui, help_ui, start_batcher
+from .updates import UpdateBatcher
+
+#%% [Helper Functions]
+
+def visible_rows(position: float, viewport_height: float, row_height: float, count: int, overscan: int = 4) -> range:
+    """Return the row indices to render for a scroll `position` (pixels) of a list with fixed row height."""
+    first = max(0, int(position // row_height) - overscan)
+    last = min(count, int((position + viewport_height) // row_height) + 1 + overscan)
+    return range(first, max(first, last))
+
+
+class GroupView:
+    """The rendered state of an expanded group."""
+
+    def __init__(self, parameters: List[BaseParameter], top, rows, bottom):
+        self.parameters = parameters
+        self.top = top
+        self.rows = rows
+        self.bottom = bottom
+        self.window: Optional[range] = None
+
+
+#%% [Main Class]
+
+class ParameterPanel:
+    """Render parameter groups as expansions with virtualized rows.
+
+    `element_count` and `render_time` (seconds, accumulated over all render steps) report the cost.
+    Value changes are coalesced by `batcher` (polled once per animation frame) when one is given.
+    """
+
+    def __init__(self, groups: Iterable[ParameterGroup], row_height: int = 48, viewport_height: int = 480, overscan: int = 4, batcher: Optional[UpdateBatcher] = None):
+        self._groups = list(groups)
+        self._batcher = batcher
+        self._row_height = row_height
+        self._viewport_height = viewport_height
+        self._overscan = overscan
+        self._root = None
+        self._views: Dict[int, GroupView] = {}
+        self._help_dialogs: Dict[int, ui.dialog] = {}
+        self.render_time = 0.0
+        self.renders = 0
+        # font parameters show the installed fonts once the scan (on its own thread) is done
+        fonts.font_scanner.start()
+
+    def render(self):
+        start = time.perf_counter()
+        with ui.column().classes('w-full') as self._root:
+            if self._batcher is not None:
+                start_batcher(self._batcher)
+            for index, group in enumerate(self._groups):
+                expansion = ui.expansion(group.name or f'Group {index + 1}', caption=f'{len(group)} parameters').classes('w-full')
+                expansion.on_value_change(lambda event, group=group, expansion=expansion: self._expand(group, expansion) if event.value else None)
+        self._measure(start)
+        return self._root
+
+    def _expand(self, group: ParameterGroup, expansion: ui.expansion) -> None:
+        if id(group) in self._views:
+            return
+
+        start = time.perf_counter()
+        parameters = list(group)
+        with expansion:
+            area = ui.scroll_area().classes('w-full').style(f'height: {min(self._viewport_height, len(parameters) * self._row_height)}px')
+            with area:
+                top = ui.element('div')
+                rows = ui.column().classes('w-full gap-0')
+                bottom = ui.element('div')
+
+        view = GroupView(parameters, top, rows, bottom)
+        self._views[id(group)] = view
+        area.on_scroll(lambda event, view=view: self._show(view, event.vertical_position))
+        self._measure(start)
+        self._show(view, 0)
+
+    def _show(self, view: GroupView, position: float) -> None:
+        window = visible_rows(position, self._viewport_height, self._row_height, len(view.parameters), self._overscan)
+        if window == view.window:
+            return
+
+        start = time.perf_counter()
+        view.window = window
+        view.top.style(f'height: {window.start * self._row_height}px')
+        view.bottom.style(f'height: {(len(view.parameters) - window.stop) * self._row_height}px')
+        view.rows.clear()
+        with view.rows:
+            for parameter in view.parameters[window.start:window.stop]:
+                with ui.row().classes('w-full items-center no-wrap').style(f'height: {self._row_height}px'):
+                    create_ui(parameter, with_help=False, batcher=self._batcher)
+                    if parameter.help:
+                        ui.button(icon='help_outline', on_click=lambda parameter=parameter: self.show_help(parameter)).props('flat dense round')
+        self._measure(start)
+
+    def show_help(self, parameter: BaseParameter) -> None:
+        """Render the help of a parameter in a dialog (once) and open it."""
+        dialog = self._help_dialogs.get(id(parameter))
+        if dialog is None:
+            with self._root, ui.dialog() as dialog, ui.card():
+                help_ui(parameter)
+            self._help_dialogs[id(parameter)] = dialog
+        dialog.open()
+
+    def _measure(self, start: float) -> None:
+        self.render_time += time.perf_counter() - start
+        self.renders += 1
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("Parameter panel: %d elements, %.1f ms render time", self.element_count, self.render_time * 1e3)
+
+    @property
+    def element_count(self) -> int:
+        if self._root is None:
+            return 0
+        return 1 + sum(1 for _ in self._root.descendants())
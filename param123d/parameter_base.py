@@ -1,13 +1,18 @@
 #%% [Imports]
 from dataclasses import dataclass
 from .parameter_types import ParameterType
-import ast 
+from .calculation import compile_calculation, evaluate
+from .stat_cache import stat_cache
+from . import fonts, units
+from .observers import Observers, notify
 from pathlib import Path
 import re
 from enum import Enum
-from typing import Optional, Union, Any #| [docs](https://docs.python.org/3/library/typing.html)
+from typing import Optional, Union, Any, Callable, Dict, Iterable, List #| [docs](https://docs.python.org/3/library/typing.html)
 import keyword       #| [docs](https://docs.python.org/3/library/keyword.html)
-from nicegui import ui
+import unicodedata
+from functools import lru_cache
+import importlib
 
 # Define type aliases
 type Identifier = str
@@ -18,8 +23,174 @@ type UnionFilesystem = Union[str, Path]
 
 # %% [Helper Functions]
 
+# invalid characters in file/directory names and Windows drive letters (e.g. C:)
+INVALID_PATH_CHARACTERS = re.compile(r'[<>:"|?*\x00-\x1F]')
+DRIVE_PATTERN = re.compile(r'^[a-zA-Z]:\\')
+
+
+@lru_cache(maxsize=65536)
 def is_valid_identifier(name: Identifier) -> bool:
-    return name.isidentifier() and not keyword.iskeyword(name)
+    # names that change under NFKC normalization would be stored under a different name by Python
+    return name.isidentifier() and not keyword.iskeyword(name) and (name.isascii() or unicodedata.normalize('NFKC', name) == name)
+
+
+def ui_module():
+    """Import the optional NiceGUI layer (`param123d.ui`) on first use."""
+    return importlib.import_module('.ui', __package__)
+
+
+# %% [Active Groups]
+
+# stack of the entered `ParameterGroup`s, new parameters are added to the innermost one
+_active_groups = []
+
+
+def enter_group(group) -> None:
+    _active_groups.append(group)
+
+
+def exit_group(group) -> None:
+    if _active_groups and _active_groups[-1] is group:
+        _active_groups.pop()
+
+
+def current_group():
+    return _active_groups[-1] if _active_groups else None
+
+
+class ParameterMeta(type):
+    """Add a new parameter to the active group once its constructor (including the subclass checks) succeeded."""
+
+    def __call__(cls, *args, **kwargs):
+        parameter = super().__call__(*args, **kwargs)
+        if _active_groups:
+            _active_groups[-1].add(parameter)
+        return parameter
+
+
+# %% [Type Validators]
+
+# maps each `ParameterType` to a callable `(parameter, value) -> bool` used by `BaseParameter.is_valid_type`
+type Validator = Callable[['BaseParameter', UnionType], bool]
+_type_validators: Dict[ParameterType, Validator] = {}
+
+
+def register_validator(param_type: ParameterType, validator: Optional[Validator] = None, replace: bool = False):
+    """Register the value validator for a parameter type, can also be used as a decorator.
+    
+    Plugins use this to add types like `AxisParameter`; `replace=True` overrides an existing validator.
+    """
+    if not isinstance(param_type, ParameterType):
+        raise ValueError(f"Parameter type '{param_type}' is not a valid parameter type.")
+    
+    def register(validator: Validator) -> Validator:
+        if param_type in _type_validators and not replace:
+            raise ValueError(f"A validator for parameter type '{param_type}' is already registered.")
+        _type_validators[param_type] = validator
+        return validator
+    
+    if validator is None:
+        return register
+    return register(validator)
+
+
+def type_validator(param_type: ParameterType) -> Optional[Validator]:
+    return _type_validators.get(param_type)
+
+
+@register_validator(ParameterType.BooleanParameter)
+def validate_boolean(parameter, value) -> bool:
+    return isinstance(value, bool)
+
+
+@register_validator(ParameterType.IntegerParameter)
+def validate_integer(parameter, value) -> bool:
+    return isinstance(value, int)
+
+
+@register_validator(ParameterType.FloatParameter)
+def validate_float(parameter, value) -> bool:
+    return isinstance(value, float)
+
+
+@register_validator(ParameterType.StringParameter)
+def validate_string(parameter, value) -> bool:
+    # a string is a basic `str` type (`TextParameter` is an alias of `StringParameter`)
+    return isinstance(value, str)
+
+
+@register_validator(ParameterType.ChoiceParameter)
+def validate_choice(parameter, value) -> bool:
+    if type(value) not in (str, int, float):
+        return False
+    # `ChoiceParameter` keeps a hash index of its choices
+    index = getattr(parameter, '_index', None)
+    return index is None or value in index
+
+
+@register_validator(ParameterType.RangeParameter)
+def validate_range(parameter, value) -> bool:
+    return type(value) in (int, float)
+
+
+@register_validator(ParameterType.FontNameParameter)
+def validate_font_name(parameter, value) -> bool:
+    # a font name is a string, with `FontValidation.STRICT` the family of an installed font
+    return fonts.is_font_name(value)
+
+
+@register_validator(ParameterType.FontSizeParameter)
+def validate_font_size(parameter, value) -> bool:
+    # a font size is a float or int
+    return (isinstance(value, int)) and value >= 0
+
+
+@register_validator(ParameterType.FileNameParameter)
+def validate_file_name(parameter, value) -> bool:
+    # a file name is a string
+    return (isinstance(value, str) or isinstance(value, Path)) and parameter.is_path(value)
+
+
+@register_validator(ParameterType.FileParameter)
+def validate_file(parameter, value) -> bool:
+    # TODO: check is_link for files? 
+    if not (isinstance(value, str) or isinstance(value, Path)):
+        return False
+    if not stat_cache.exists(value):
+        raise ValueError(f"Path '{value}' does not exist\n-> Please create file before using it as a parameter path.")
+    return stat_cache.is_file(value)
+
+
+@register_validator(ParameterType.PathParameter)
+def validate_path(parameter, value) -> bool:
+    # TODO: check is_link for directories?
+    if not (isinstance(value, str) or isinstance(value, Path)):
+        return False
+    if not stat_cache.exists(value):
+        raise ValueError(f"Path '{value}' does not exist\n-> Please create path before using it as a parameter path.")
+    return stat_cache.is_dir(value)
+
+
+FILESYSTEM_TYPES = (ParameterType.FileParameter, ParameterType.PathParameter)
+
+
+def validate_parameters(parameters: Iterable['BaseParameter'], max_workers: Optional[int] = None) -> List['BaseParameter']:
+    """Re-validate the values of a parameter set and return the invalid parameters.
+    
+    The paths of all file and path parameters are stat-ed concurrently before the validation.
+    """
+    parameters = list(parameters)
+    stat_cache.prefetch((parameter.value for parameter in parameters if parameter.param_type in FILESYSTEM_TYPES and isinstance(parameter.value, (str, Path))), max_workers)
+    
+    invalid = []
+    for parameter in parameters:
+        try:
+            valid = parameter.is_valid_type(parameter.value)
+        except ValueError:
+            valid = False
+        if not valid:
+            invalid.append(parameter)
+    return invalid
 
 
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------
@@ -30,8 +201,19 @@ class HelpType(Enum):
     MARKDOWN = "markdown"
     RESTRUCTURED_TEXT = "restructured_text"
 
+
+@lru_cache(maxsize=4096)
+def detect_help_type(help_text: Optional[str]) -> HelpType:
+    if help_text is None:
+        return HelpType.SIMPLE
+    if help_text.startswith("#") or help_text.startswith("*") or help_text.startswith("-"):
+        return HelpType.MARKDOWN
+    if help_text.startswith(".. "):
+        return HelpType.RESTRUCTURED_TEXT
+    return HelpType.SIMPLE
+
 @dataclass
-class BaseParameter:
+class BaseParameter(metaclass=ParameterMeta):
     """
     """
     _name: Identifier 
@@ -39,6 +221,8 @@ class BaseParameter:
     _type: ParameterType
     _help: Optional[str] = None
     _help_type: HelpType = HelpType.SIMPLE
+    _observers = None   # `Observers`, created by the first `subscribe()`
+    _groups = ()        # the `ParameterGroup`s that contain the parameter
 
     def __init__(self, name: Identifier, value: UnionType, param_type: ParameterType, help: Optional[str] = None):
         if not self.is_identifier(name):
@@ -67,98 +251,30 @@ class BaseParameter:
         return f"Parameter({self._name}, {self._value}, {self._type})"
     
     def is_identifier(self, name: Identifier) -> bool:
-        try:
-            node = ast.parse(name, mode='eval')
-            if isinstance(node.body, ast.Name) and node.body.id == name:
-                return True
-        except SyntaxError:
-            return False
-        return False
+        return isinstance(name, str) and is_valid_identifier(name)
     
     def is_path(self, path: UnionFilesystem) -> bool:
         if isinstance(path, Path):
             path = str(path)
         if not isinstance(path, str):
             return False
-        # Define a regex pattern for invalid characters in file/directory names
         # allow for Windows drive letters (e.g. C:)
-        if re.match(r'^[a-zA-Z]:\\', path):
+        if DRIVE_PATTERN.match(path):
             path = path[2:]
             
-        invalid_chars = r'[<>:"|?*\x00-\x1F]'
-        if re.search(invalid_chars, path):
+        if INVALID_PATH_CHARACTERS.search(path):
             return False
         return True
         
     
     def is_valid_type(self, value: UnionType) -> bool:
-        if self._type == ParameterType.BooleanParameter:
-            return isinstance(value, bool)
-        
-        elif self._type == ParameterType.IntegerParameter:
-            return isinstance(value, int)
-        
-        elif self._type == ParameterType.FloatParameter:
-            return isinstance(value, float)
-        
-        elif self._type == ParameterType.StringParameter:
-            # a string is a basic `str` type
-            return isinstance(value, str)
-                
-        elif self._type == ParameterType.ChoiceParameter:
-            if type(value) == str or type(value) == int  or type(value) == float:
-                return True
-            else:
-                return False
-
-        elif self._type == ParameterType.RangeParameter:
-            if type(value) == int  or type(value) == float:
-                return True
-            else:
-                return False
-            
-        elif self._type == ParameterType.FontNameParameter:
-            # a font name is a string
-            # TODO: find a way to check if the font is installed on the system
-            return isinstance(value, str)
-        
-        elif self._type == ParameterType.FontSizeParameter:
-            # a font size is a float or int
-            return (isinstance(value, int)) and value >= 0
-        
-        elif self._type == ParameterType.TextParameter:
-            # a text is a string
-            return isinstance(value, str)
-        
-        elif self._type == ParameterType.FileNameParameter:
-            # a file name is a string
-            return (isinstance(value, str) or isinstance(value, Path)) and self.is_path(value)
-        
-        elif self._type == ParameterType.FileParameter:
-            # a file name is a string
-            # TODO: check is_link for files? 
-            if not Path(value).exists():
-                raise ValueError(f"Path '{value}' does not exist\n-> Please create file before using it as a parameter path.")
-            return (isinstance(value, str) or isinstance(value, Path)) and Path(value).is_file()
-        
-        elif self._type == ParameterType.PathParameter:
-            # a path is a string
-            # TODO: check is_link for directories?
-            if not Path(value).exists():
-                raise ValueError(f"Path '{value}' does not exist\n-> Please create path before using it as a parameter path.")
-            return (isinstance(value, str) or isinstance(value, Path)) and Path(value).is_dir()
-        
-        else:
+        validator = _type_validators.get(self._type)
+        if validator is None:
             return False
+        return validator(self, value)
         
     def detect_help_type(self, help_text: Optional[str]) -> HelpType:
-        if help_text is None:
-            return HelpType.SIMPLE
-        if help_text.startswith("#") or help_text.startswith("*") or help_text.startswith("-"):
-            return HelpType.MARKDOWN
-        if help_text.startswith(".. "):
-            return HelpType.RESTRUCTURED_TEXT
-        return HelpType.SIMPLE
+        return detect_help_type(help_text)
     
     @property
     def name(self) -> Identifier:
@@ -168,6 +284,23 @@ class BaseParameter:
     def value(self) -> UnionType:
         return self._value
     
+    @value.setter
+    def value(self, value: UnionType) -> None:
+        self.set_value(value)
+    
+    def set_value(self, value: UnionType) -> None:
+        if not self.is_valid_type(value):
+            raise ValueError(f"Parameter value '{value}' is not a valid value for type '{self._type}'.")
+        old, self._value = self._value, value
+        if old != value and (self._observers or self._groups):
+            notify(self, old, value)
+    
+    def subscribe(self, listener: Callable, weak: bool = True) -> Callable[[], None]:
+        """Call `listener(ChangeEvent(parameter, old, new))` on value changes, returns the unsubscribe function."""
+        if self._observers is None:
+            self._observers = Observers()
+        return self._observers.subscribe(listener, weak)
+    
     
     @property
     def param_type(self) -> ParameterType:
@@ -188,22 +321,10 @@ class BaseParameter:
         return self._help_type
 
     def help_ui(self):
-        if self.help_type == HelpType.MARKDOWN:
-            return ui.markdown(self.help)
-        elif self.help_type == HelpType.RESTRUCTURED_TEXT:
-            return ui.rst(self.help)
-        else:
-            return ui.label(self.help)
+        return ui_module().help_ui(self)
 
     def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        # TODO: label.set_tooltip(self.param_type)
-        element = ui.input()
-        element.set_value(self.value)
-        
-        help = self.help_ui()
-        
-        return (label, element, help)
+        return ui_module().create_ui(self)
 
     # Arithmetic operations
     def __add__(self, other):
@@ -339,8 +460,7 @@ class RangeParameter(BaseParameter):
         return f"RangeParameter({self._name}, {self.value}, {self._unit}, {self._type})"
 
     def is_unit(self, unit: str) -> bool:
-        # TODO: implement is_unit() member based on of the given libraries or strings.
-        return True
+        return units.is_unit(unit)
 
     @property
     def min_value(self) -> Optional[UnionNumber]:
@@ -363,19 +483,6 @@ class RangeParameter(BaseParameter):
     def unit(self) -> str:
         return self._unit
 
-    def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        # TODO: label.set_tooltip(self.param_type)
-        with ui.row().classes('m-0 p-0') as element:
-            element_1 = ui.label(self.value).props('text-right')
-            if self.unit:
-                element_2 = ui.label(self.unit)
-            element_3 = ui.slider(value=self.value, min=self._min_value, max=self._max_value, step=self._step_value)
-            element_1.bind_text_from(element_3, 'value')
-        help = self.help_ui()
-        
-        return (label, element, help)
-
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------
 # -----------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -406,22 +513,28 @@ class CalculationParameter(BaseParameter):
         return f"CalculationParameter({self._name}, {self.value}, {self._unit}, {self._type})"
 
     def is_unit(self, unit: str) -> bool:
-        # TODO: implement is_unit() member based on of the given libraries or strings.
-        return True
+        return units.is_unit(unit)
     
     def is_calculation(self, calc: str) -> bool:
-        check = False 
-        
         try:
-            tree = ast.parse(calc)
-            # TODO: it should only be a simple calculation
-            
-            check = True
-            
-        except SyntaxError:
+            compile_calculation(calc)
+        except ValueError:
             return False
-        
-        return check
+        return True
+    
+    def evaluate(self, namespace: dict) -> UnionType:
+        """Evaluate `calc` with the values of the parameters (or plain values) in `namespace`."""
+        if not self._calc:
+            return self._value
+        
+        names = compile_calculation(self._calc).names
+        values = {name: namespace[name].value if isinstance(namespace[name], BaseParameter) else namespace[name] for name in names if name in namespace}
+        return evaluate(self._calc, values)
+    
+    def recalculate(self, namespace: dict) -> UnionType:
+        """Evaluate `calc` and store the result as the new value."""
+        self.set_value(self.evaluate(namespace))
+        return self._value
         
     @property
     def unit(self) -> str:
@@ -430,21 +543,3 @@ class CalculationParameter(BaseParameter):
     @property
     def calc(self) -> Optional[str]:
         return self._calc
-    
-    def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        # TODO: label.set_tooltip(self.param_type)
-        
-        
-        # value = ui.label(self.value)
-        # TODO: value.set_value(self.value)
-
-        element = ui.input().classes('w-full')
-        element.set_value(str(self.calc))
-        # TODO: how to solve this? Probably need to use RedBaron
-            
-        
-        help = self.help_ui()
-
-        
-        return (label, element, help)
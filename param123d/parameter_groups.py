@@ -4,36 +4,147 @@ Parameter groups for usage in `with` blocks.
     
 """
 
+#%% [Imports]
+import inspect
+import logging
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional
+from .code_context import CodeContext
+from .observers import Observers
+from .parameter_base import BaseParameter, Identifier, enter_group, exit_group
+from .transactions import Journal, JournalEntry, Transaction
+
+
+class CaptureMode(Enum):
+    FRAME = "frame"     # only the calling frame via `sys._getframe`, source lines are loaded lazily
+    STACK = "stack"     # full `inspect.stack()` scan for the `ParameterGroup` line (slow)
+
 
 class ParameterGroup:
-    """A context manager to capture file name and line number for the with block."""
+    """A context manager to capture file name and line number for the with block.
+    
+    Parameters created inside the block are added to the group and can be referenced as `group.name`,
+    `group['name']` or `group('name')`. Names are unique within a group.
+    """
 
-    def __init__(self):
+    def __init__(self, name: Optional[str] = None, capture: CaptureMode = CaptureMode.FRAME):
+        if not isinstance(capture, CaptureMode):
+            raise ValueError(f"Capture mode '{capture}' is not a valid capture mode.")
+        
+        self._name = name
+        self._capture = capture
         self._context = None
+        self._parameters: Dict[Identifier, BaseParameter] = {}
+        self._observers = Observers()
+        self._journal: Optional[Journal] = None
 
     def __enter__(self):
         """Capture file and line number of the calling script when entering the context."""
-        stack = inspect.stack()
-        stack_size = len(stack)
-        caller_frame = None
-
-        for i in range(stack_size):
-            print(stack[i].code_context)
-            for context in stack[i].code_context:
-                if context.find('ParameterGroup')>= 0:
-                    caller_frame = stack[i]
-                    break
-                
-        if caller_frame:
-            self._context = CodeContext(caller_frame)
-            logging.info(f"Entered 'with' block in file: {self.context}")
+        if self._capture == CaptureMode.FRAME:
+            # frame 0 is `__enter__` itself, frame 1 executes the `with` statement
+            self._context = CodeContext.from_frame(sys._getframe(1))
+        else:
+            self._context = self.context_from_stack()
         
+        if self._context:
+            logging.info("Entered 'with' block in file: %s", self._context)
         else:
             logging.error("Stack frame not found")
+        
+        enter_group(self)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Exit the context."""
-        if self.context:
-            logging.info(f"Exiting 'with' block in context {self.context}")
+        exit_group(self)
+        if self._context:
+            logging.info("Exiting 'with' block in context %s", self._context)
+
+    def context_from_stack(self) -> Optional[CodeContext]:
+        """Search the whole call stack for the line that creates the `ParameterGroup`."""
+        stack = inspect.stack()
+        
+        for frame_info in stack[1:]:
+            for context in frame_info.code_context or []:
+                if context.find('ParameterGroup') >= 0:
+                    return CodeContext.from_frame_info(frame_info)
+        return None
+
+    def add(self, parameter: BaseParameter) -> BaseParameter:
+        """Add a parameter, its name must not be used in the group yet."""
+        if parameter.name in self._parameters:
+            raise ValueError(f"Parameter name '{parameter.name}' is already used in group '{self.name}'.")
+        self._parameters[parameter.name] = parameter
+        parameter._groups += (self,)
+        return parameter
+
+    def extend(self, parameters: Iterable[BaseParameter]) -> None:
+        for parameter in parameters:
+            self.add(parameter)
+
+    def subscribe(self, listener: Callable, weak: bool = True) -> Callable[[], None]:
+        """Call `listener([ChangeEvent, ...])` with the value changes of the parameters, returns the unsubscribe function."""
+        return self._observers.subscribe(listener, weak)
+
+    def transaction(self, label: Optional[str] = None) -> Transaction:
+        """Collect value changes and apply them together at the end of the `with` block (recorded in the journal)."""
+        return Transaction(self, self.journal, label)
+
+    def apply(self, values: Mapping[Identifier, Any], label: Optional[str] = None) -> Optional[JournalEntry]:
+        """Apply `{name: value}` changes in one transaction, nothing is changed if a value is invalid."""
+        with self.transaction(label) as changes:
+            changes.update(values)
+        return changes.entry
+
+    def undo(self) -> Optional[JournalEntry]:
+        return self.journal.undo(self)
+
+    def redo(self) -> Optional[JournalEntry]:
+        return self.journal.redo(self)
+
+    def __getattr__(self, name: str) -> BaseParameter:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._parameters[name]
+        except KeyError:
+            raise AttributeError(f"Group '{self.name}' has no parameter '{name}'.") from None
+
+    def __getitem__(self, name: Identifier) -> BaseParameter:
+        return self._parameters[name]
+
+    def __call__(self, name: Identifier) -> BaseParameter:
+        return self._parameters[name]
+
+    def __contains__(self, name: Identifier) -> bool:
+        return name in self._parameters
+
+    def __iter__(self) -> Iterator[BaseParameter]:
+        return iter(self._parameters.values())
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+    @property
+    def parameters(self) -> Dict[Identifier, BaseParameter]:
+        return self._parameters
+
+    @property
+    def journal(self) -> Journal:
+        """The undo/redo journal of the transactions (created on first use)."""
+        if self._journal is None:
+            self._journal = Journal()
+        return self._journal
+
+    @property
+    def capture(self) -> CaptureMode:
+        return self._capture
 
+    @property
+    def context(self) -> Optional[CodeContext]:
+        return self._context
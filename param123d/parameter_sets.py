@@ -0,0 +1,271 @@
+"""
+Save and load parameter sets (the `{name: value}` snapshot of parameters) as YAML or as a binary snapshot.
+
+YAML (optional dependency: `param123d[yaml]`) is the human-readable format for the model folder. The binary
+format is columnar (sorted names, type codes, fixed size value slots, a string blob) and is opened with
+`mmap`: only the header is read up front, a value is decoded when it is accessed.
+
+    ┌────────┬───────────────────┬─────────────┬──────────────┬────────────┬───────────┐
+    │ header │ name offsets (u4) │ types (u1)  │ values (8 B) │ name bytes │ str bytes │
+    └────────┴───────────────────┴─────────────┴──────────────┴────────────┴───────────┘
+"""
+
+#%% [Imports]
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+from .parameter_base import BaseParameter, Identifier, UnionFilesystem, UnionType
+from .parameter_groups import ParameterGroup
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - depends on the installation
+    yaml = None
+
+#%% [Types]
+
+type ParameterValues = Dict[Identifier, UnionType]
+
+MAGIC = b'P123SET\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHI')   # magic, version, reserved, count
+
+NONE, FALSE, TRUE, INTEGER, FLOAT, STRING = range(6)
+
+_i8 = struct.Struct('<q')
+_f8 = struct.Struct('<d')
+_u4 = struct.Struct('<I')
+_slot = struct.Struct('<II')       # offset, length of a string
+
+BINARY_SUFFIXES = ('.pset',)
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+#%% [Helper Functions]
+
+def require_yaml():
+    if yaml is None:
+        raise ImportError("YAML parameter sets need PyYAML, install it with `pip install param123d[yaml]`.")
+    return yaml
+
+
+def snapshot(parameters: Iterable[BaseParameter]) -> ParameterValues:
+    """Return the `{name: value}` set of parameters (e.g. a `ParameterGroup`)."""
+    return {parameter.name: parameter.value for parameter in parameters}
+
+
+def apply(parameters: Iterable[BaseParameter], values: Mapping) -> None:
+    """Set the values of a parameter set, names without a parameter are ignored.
+
+    The values of a `ParameterGroup` are applied in one transaction (all or nothing, one undo step).
+    """
+    if isinstance(parameters, ParameterGroup):
+        parameters.apply({name: value for name, value in values.items() if name in parameters}, 'apply')
+        return
+    for parameter in parameters:
+        if parameter.name in values:
+            parameter.set_value(values[parameter.name])
+
+
+def plain_value(name: Identifier, value) -> Optional[UnionType]:
+    if isinstance(value, Path):
+        return str(value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise ValueError(f"Value of parameter '{name}' has the unsupported type '{type(value).__name__}'.")
+
+
+#%% [YAML]
+
+def save_yaml(values: Mapping, file_name: UnionFilesystem) -> None:
+    yaml_module = require_yaml()
+    document = {name: plain_value(name, value) for name, value in values.items()}
+    with open(file_name, 'w', encoding='utf-8') as stream:
+        yaml_module.safe_dump(document, stream, sort_keys=False, allow_unicode=True)
+
+
+def load_yaml(file_name: UnionFilesystem) -> ParameterValues:
+    yaml_module = require_yaml()
+    loader = getattr(yaml_module, 'CSafeLoader', yaml_module.SafeLoader)
+    with open(file_name, encoding='utf-8') as stream:
+        document = yaml_module.load(stream, Loader=loader) or {}
+    if not isinstance(document, dict):
+        raise ValueError(f"Parameter set '{file_name}' is not a mapping of names to values.")
+    return document
+
+
+#%% [Binary]
+
+def save_binary(values: Mapping, file_name: UnionFilesystem) -> None:
+    entries = sorted((name.encode('utf-8'), plain_value(name, value)) for name, value in values.items())
+    count = len(entries)
+
+    offsets = bytearray()
+    types = bytearray()
+    slots = bytearray()
+    names = bytearray()
+    strings = bytearray()
+    for name, value in entries:
+        offsets += _u4.pack(len(names))
+        names += name
+        if value is None:
+            types.append(NONE)
+            slots += bytes(8)
+        elif isinstance(value, bool):
+            types.append(TRUE if value else FALSE)
+            slots += bytes(8)
+        elif isinstance(value, int):
+            if not -2**63 <= value < 2**63:
+                raise ValueError(f"Value of parameter '{name.decode()}' does not fit into 64 bits.")
+            types.append(INTEGER)
+            slots += _i8.pack(value)
+        elif isinstance(value, float):
+            types.append(FLOAT)
+            slots += _f8.pack(value)
+        else:
+            data = value.encode('utf-8', errors='surrogatepass')
+            types.append(STRING)
+            slots += _slot.pack(len(strings), len(data))
+            strings += data
+    offsets += _u4.pack(len(names))
+
+    # write to a temporary file first, a reader never sees a half written snapshot
+    temporary = f"{file_name}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, 0, count))
+        for column in (offsets, types, slots, names, strings):
+            stream.write(column)
+    os.replace(temporary, file_name)
+
+
+class ParameterSetFile(Mapping):
+    """A read-only, memory-mapped binary parameter set.
+
+    Names are sorted, so a lookup is a binary search on the mapped file; nothing is decoded before it
+    is accessed. Use it as a context manager (or call `close()`) to release the mapping.
+    """
+
+    def __init__(self, file_name: UnionFilesystem):
+        self._file_name = str(file_name)
+        with open(file_name, 'rb') as stream:
+            size = os.fstat(stream.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Parameter set '{file_name}' is not a binary parameter set.")
+            self._buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError(f"Parameter set '{file_name}' is not a binary parameter set.")
+        if version != VERSION:
+            raise ValueError(f"Parameter set '{file_name}' has the unsupported version {version}.")
+
+        self._count = count
+        self._offsets = HEADER.size
+        self._types = self._offsets + 4 * (count + 1)
+        self._slots = self._types + count
+        self._names = self._slots + 8 * count
+        self._strings = self._names + self._name_offset(count)
+        if self._strings > size:
+            raise ValueError(f"Parameter set '{file_name}' is truncated.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Identifier]:
+        for index in range(self._count):
+            yield self._name(index).decode('utf-8')
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and self._find(name) is not None
+
+    def __getitem__(self, name: Identifier) -> Optional[UnionType]:
+        index = self._find(name) if isinstance(name, str) else None
+        if index is None:
+            raise KeyError(name)
+        return self._value(index)
+
+    def to_dict(self) -> ParameterValues:
+        return {self._name(index).decode('utf-8'): self._value(index) for index in range(self._count)}
+
+    def _name_offset(self, index: int) -> int:
+        return _u4.unpack_from(self._buffer, self._offsets + 4 * index)[0]
+
+    def _name(self, index: int) -> bytes:
+        return self._buffer[self._names + self._name_offset(index):self._names + self._name_offset(index + 1)]
+
+    def _find(self, name: Identifier) -> Optional[int]:
+        key = name.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._name(low) == key:
+            return low
+        return None
+
+    def _value(self, index: int) -> Optional[UnionType]:
+        code = self._buffer[self._types + index]
+        slot = self._slots + 8 * index
+        if code == INTEGER:
+            return _i8.unpack_from(self._buffer, slot)[0]
+        if code == FLOAT:
+            return _f8.unpack_from(self._buffer, slot)[0]
+        if code == STRING:
+            offset, length = _slot.unpack_from(self._buffer, slot)
+            start = self._strings + offset
+            return self._buffer[start:start + length].decode('utf-8', errors='surrogatepass')
+        if code in (TRUE, FALSE):
+            return code == TRUE
+        if code == NONE:
+            return None
+        raise ValueError(f"Parameter set '{self._file_name}' has the unknown type code {code}.")
+
+    @property
+    def file_name(self) -> str:
+        return self._file_name
+
+
+def load_binary(file_name: UnionFilesystem) -> ParameterSetFile:
+    return ParameterSetFile(file_name)
+
+
+#%% [Main Functions]
+
+def is_binary(file_name: UnionFilesystem) -> bool:
+    suffix = Path(file_name).suffix.lower()
+    if suffix in BINARY_SUFFIXES:
+        return True
+    if suffix in YAML_SUFFIXES:
+        return False
+    raise ValueError(f"Parameter set '{file_name}' needs one of the suffixes {', '.join(BINARY_SUFFIXES + YAML_SUFFIXES)}.")
+
+
+def save(values: Union[Mapping, Iterable[BaseParameter]], file_name: UnionFilesystem) -> None:
+    """Save a parameter set, the format is chosen by the suffix (`.pset` binary, `.yaml`/`.yml` YAML)."""
+    if not isinstance(values, Mapping):
+        values = snapshot(values)
+    if is_binary(file_name):
+        save_binary(values, file_name)
+    else:
+        save_yaml(values, file_name)
+
+
+def load(file_name: UnionFilesystem) -> Mapping:
+    """Load a parameter set, a binary set is returned as a lazy, memory-mapped `ParameterSetFile`."""
+    if is_binary(file_name):
+        return load_binary(file_name)
+    return load_yaml(file_name)
@@ -1,7 +1,8 @@
 from .parameter_base import Identifier, UnionType, UnionNumber, UnionFilesystem, BaseParameter, RangeParameter, CalculationParameter
 from .parameter_types import ParameterType
 from .parameter_groups import ParameterGroup
-from nicegui import ui
+from .catalogs import Catalog, catalog as load_catalog
+from .choices import ChoiceIndex
 from pathlib import Path
 from typing import Any, List, Optional, Union
 from dataclasses import dataclass
@@ -17,15 +18,6 @@ class BooleanParameter(BaseParameter):
     def __init__(self, name : str, value : bool, help : str = None):
         """Initialize the BooleanParameter class."""
         super().__init__(name, value, ParameterType.BooleanParameter, help)
-        
-    def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        switch = ui.switch()
-        switch.set_value(self.value)
-        
-        help   = ui.markdown(self.help)
-        
-        return (label, switch, help)
 
     @property
     def help(self):
@@ -52,15 +44,6 @@ class IntegerParameter(RangeParameter):
         validation['not in step'] = lambda value: (value-self.min_value) % self.step_value == 0
         return validation
     
-    def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        main = ui.number(validation=self.dict_valid())
-        main.set_value(self.value)
-        
-        help   = ui.markdown(self.help + f'\n- Min: {self.min_value},\n- Max: {self.max_value}')
-        
-        return (label, main, help)
-
     @property
     def help(self):
         return self._help
@@ -121,65 +104,54 @@ if 0:
 class ChoiceParameter(BaseParameter):
     """A choice parameter class that inherits from the Parameter class."""
     _choices : List[UnionType]
+    _index : ChoiceIndex
+    _catalog : Optional[Catalog] = None
     _default_value : UnionType
     
-    def __init__(self, name: Identifier, choices: List[UnionType], default_value: ParameterType = '', help: str = None):
-        """Initialize the ChoiceParameter class."""
-        if self.valid_choices(choices):
-            self._choices = choices 
+    def __init__(self, name: Identifier, choices: Union[List[UnionType], Catalog], default_value: ParameterType = '', help: str = None):
+        """Initialize the ChoiceParameter class (`choices` can be a shared `Catalog`)."""
+        if isinstance(choices, Catalog):
+            self._catalog = choices
+            self._choices = choices.choices
+            self._index = choices.index
         else:
-            self._choices = ['A', 'B', 'C']   
+            # the index is owned by the parameter, choices shared by many parameters belong into a `Catalog`
+            index = ChoiceIndex(choices)
+            if not index.valid:
+                choices = ['A', 'B', 'C']
+                index = ChoiceIndex(choices)
+            self._choices = choices
+            self._index = index
             
-        if type(self._choices) == dict: 
-            keys = list(self._choices.keys())
-            keys.sort()
-            if default_value not in keys:
-                self._default_value = keys[0]
-            else:
-                self._default_value = default_value
-        
+        if default_value in self._index:
+            self._default_value = default_value
+        elif type(self._choices) == dict:
+            self._default_value = self._index.sorted_keys[0]
         else:
-            if default_value not in self._choices:
-                self._default_value = self._choices[0]
-            else: 
-                self._default_value = default_value
+            self._default_value = self._index.values[0]
 
         super().__init__(name,  self._default_value, ParameterType.ChoiceParameter, help)
         
+    @property
+    def choices(self) -> List[UnionType]:
+        """The selectable values (the keys for a `dict` of choices)."""
+        return list(self._index.values)
+    
+    @property
+    def index(self) -> ChoiceIndex:
+        """The (shared) index of the choices."""
+        return self._index
+    
+    @property
+    def catalog(self) -> Optional[Catalog]:
+        return self._catalog
         
     # TODO: implement ChoiceParameter.create_ui()
     
     def valid_choices(self, value : List[ParameterType]) -> bool:
-        # a choice value defines a list of same values 
-        if type(value) == list or type(value) == tuple or type(value) == set:
-            item_type = type(value[0])
-            for item in value:
-                if not isinstance(item, item_type):
-                    return False
-            # all items have the same type! 
-            return True
-        elif type(value) == dict:
-            item_type = None 
-            for key,value in value.items():
-                if not item_type: # set type by first entry
-                    item_type = type(value)
-                    
-                if not isinstance(value, item_type):
-                    return False
-            # all items have the same type! 
-            return True
-        else:
-            return False
-        
+        # a choice value defines a list of same values (for a dict: same labels)
+        return ChoiceIndex(value).valid
 
-    def create_ui(self):
-        label  = ui.label(self.name).props('w-full')
-        main = ui.select(options=self._choices)
-        main.set_value(self.value)
-        
-        help   = super().help_ui()
-        
-        return (label, main, help)
 
 # ! LinearTranslationParameter = 'linear'  # Linear Function
 # ? Filter
@@ -192,16 +164,21 @@ class ChoiceParameter(BaseParameter):
 
 
 class FontParameter(StringParameter):
-    """A font parameter class that inherits from the Parameter class."""
+    """A font parameter class that inherits from the Parameter class.
+    
+    The value is a font family name, the installed families are available as the "fonts" catalog.
+    """
     _default_value : str = 'Arial'
     
     def __init__(self, name : str, value : str, default_value : str = 'Arial', help : str = None):
         """Initialize the FontParameter class."""
         self._default_value = default_value
         
-        super().__init__(name, value, help)
-        
-    #TODO: how to get the installed fonts -- probably FontManager from ocp/build123d
+        BaseParameter.__init__(self, name, value, ParameterType.FontNameParameter, help)
+    
+    @property
+    def default_value(self) -> str:
+        return self._default_value
 
             
 
@@ -258,3 +235,45 @@ class PathParameter(BaseParameter):
         super().__init__(name, value, ParameterType.PathParameter, help)
 
 
+
+
+#---------------------------------------------------------------------------------------------------------------------------------------
+# Factory
+#---------------------------------------------------------------------------------------------------------------------------------------
+
+def create_parameter(param_type: ParameterType, name: Identifier, value: UnionType, help: str = None, unit: str = None, min_value=None, max_value=None, step_value=None, default_value=None, calc: str = None, choices: List[UnionType] = None, catalog: str = None) -> BaseParameter:
+    """Create the parameter class for `param_type` from plain metadata (e.g. a record of a parameter file)."""
+    if calc is not None:
+        return CalculationParameter(name, value, param_type, unit, calc, help)
+    
+    if param_type == ParameterType.BooleanParameter:
+        return BooleanParameter(name, value, help)
+    if param_type == ParameterType.IntegerParameter:
+        return IntegerParameter(name, value, unit, help, min_value, max_value, step_value, default_value)
+    if param_type == ParameterType.FloatParameter:
+        return FloatParameter(name, value, unit, help, min_value, max_value, step_value, default_value)
+    if param_type == ParameterType.RangeParameter:
+        return RangeParameter(name, value, param_type, unit, help, min_value, max_value, step_value, default_value)
+    if param_type == ParameterType.ChoiceParameter:
+        if catalog is not None:
+            choices = load_catalog(catalog)
+        if choices is None:
+            raise ValueError(f"Choice parameter '{name}' needs choices or a catalog.")
+        if value not in choices:
+            raise ValueError(f"Parameter value '{value}' is not one of the choices of '{name}'.")
+        return ChoiceParameter(name, choices, value, help)
+    if param_type == ParameterType.FontSizeParameter:
+        return FontSizeParameter(name, value, unit or 'pt', help)
+    if param_type == ParameterType.FontNameParameter:
+        return FontParameter(name, value, default_value if default_value is not None else FontParameter._default_value, help)
+    
+    parameter_class = {
+        ParameterType.StringParameter: StringParameter,
+        ParameterType.ColorParameter: ColorParameter,
+        ParameterType.FileNameParameter: FileNameParameter,
+        ParameterType.FileParameter: FileParameter,
+        ParameterType.PathParameter: PathParameter,
+    }.get(param_type)
+    if parameter_class is not None:
+        return parameter_class(name, value, help)
+    return BaseParameter(name, value, param_type, help)
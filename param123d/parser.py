@@ -0,0 +1,336 @@
+"""
+parameter-parser
+  +-> ast
+
+Extract `ParameterGroup` blocks and `{Type}Parameter(...)` calls from model files.
+
+The parser walks statement lists only (module, function, class and compound statement bodies) and never
+descends into expressions, so a model file is handled in a single targeted pass.
+"""
+
+#%% [Imports]
+import ast
+import bisect
+import hashlib
+import os
+from collections import OrderedDict
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+from .parameter_base import UnionFilesystem
+
+#%% [Types]
+
+class Expression(NamedTuple):
+    """An argument that is not a literal (e.g. `calc=n/360`), kept as source code."""
+    source: str
+
+
+class ParameterEntry(NamedTuple):
+    group: Optional[str]
+    name: Optional[str]
+    type: str
+    args: Tuple[Any, ...]
+    kwargs: Tuple[Tuple[str, Any], ...]
+    line_start: int
+    line_end: int
+
+    def kwarg(self, key: str, default: Any = None) -> Any:
+        for name, value in self.kwargs:
+            if name == key:
+                return value
+        return default
+
+
+class GroupBlock(NamedTuple):
+    name: Optional[str]
+    alias: Optional[str]
+    line_start: int
+    line_end: int
+
+
+class ParameterTable(NamedTuple):
+    groups: Tuple[GroupBlock, ...]
+    parameters: Tuple[ParameterEntry, ...]
+
+
+GROUP_CLASS = 'ParameterGroup'
+PARAMETER_SUFFIX = 'Parameter'
+
+# statement fields that hold nested statement lists
+_BODY_FIELDS = ('body', 'orelse', 'finalbody')
+
+#%% [Helper Functions]
+
+def call_name(node: ast.AST) -> Optional[str]:
+    """Return the name of the called object for `Name(...)` and `module.Name(...)` calls."""
+    if not isinstance(node, ast.Call):
+        return None
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def is_parameter_call(node: ast.AST) -> bool:
+    name = call_name(node)
+    return name is not None and name.endswith(PARAMETER_SUFFIX) and name != GROUP_CLASS
+
+
+def literal(node: ast.AST) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return Expression(ast.unparse(node))
+
+
+def group_block(node: ast.With) -> Optional[GroupBlock]:
+    for item in node.items:
+        call = item.context_expr
+        if call_name(call) != GROUP_CLASS:
+            continue
+
+        name = None
+        if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+            name = call.args[0].value
+        for keyword in call.keywords:
+            if keyword.arg == 'name' and isinstance(keyword.value, ast.Constant):
+                name = keyword.value.value
+
+        alias = item.optional_vars.id if isinstance(item.optional_vars, ast.Name) else None
+        return GroupBlock(name, alias, node.lineno, node.end_lineno)
+    return None
+
+
+def parameter_entry(node: ast.stmt, call: ast.Call, group: Optional[str]) -> ParameterEntry:
+    args = tuple(literal(arg) for arg in call.args)
+    kwargs = tuple((keyword.arg, literal(keyword.value)) for keyword in call.keywords if keyword.arg)
+
+    name = None
+    if args and isinstance(args[0], str):
+        name = args[0]
+    else:
+        name = dict(kwargs).get('name')
+    if name is None and isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+        name = node.targets[0].id
+    elif name is None and isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        name = node.target.id
+
+    return ParameterEntry(group, name, call_name(call), args, kwargs, node.lineno, node.end_lineno)
+
+
+def visit_body(body: Iterable[ast.stmt], group: Optional[str], groups: List[GroupBlock], parameters: List[ParameterEntry]) -> None:
+    """Collect groups and parameters from a statement list and its nested statement lists."""
+    for node in body:
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.Expr)):
+            if node.value is not None and is_parameter_call(node.value):
+                parameters.append(parameter_entry(node, node.value, group))
+            continue
+
+        inner_group = group
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            block = group_block(node)
+            if block:
+                groups.append(block)
+                inner_group = block.name or block.alias
+
+        for field in _BODY_FIELDS:
+            statements = getattr(node, field, None)
+            if statements:
+                visit_body(statements, inner_group, groups, parameters)
+        for handler in getattr(node, 'handlers', ()):
+            visit_body(handler.body, inner_group, groups, parameters)
+        for case in getattr(node, 'cases', ()):
+            visit_body(case.body, inner_group, groups, parameters)
+
+
+#%% [Parser]
+
+_table_cache: OrderedDict[str, ParameterTable] = OrderedDict()
+_table_cache_size = 64
+
+
+def content_hash(source: str) -> str:
+    return hashlib.sha1(source.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def parse_tree(tree: ast.Module) -> ParameterTable:
+    groups: List[GroupBlock] = []
+    parameters: List[ParameterEntry] = []
+    visit_body(tree.body, None, groups, parameters)
+    return ParameterTable(tuple(groups), tuple(parameters))
+
+
+def parse_source(source: str, file_name: str = '<model>') -> ParameterTable:
+    """Parse the model source, results are cached by content hash."""
+    key = content_hash(source)
+    table = _table_cache.get(key)
+    if table is not None:
+        _table_cache.move_to_end(key)
+        return table
+
+    table = parse_tree(ast.parse(source, filename=file_name))
+    cache_table(key, table)
+    return table
+
+
+def cache_table(key: str, table: ParameterTable) -> None:
+    _table_cache[key] = table
+    _table_cache.move_to_end(key)
+    while len(_table_cache) > _table_cache_size:
+        _table_cache.popitem(last=False)
+
+
+def parse_file(file_name: UnionFilesystem) -> ParameterTable:
+    """Parse a model file, an unchanged file content is served from the cache."""
+    path = Path(file_name)
+    return parse_source(path.read_text(encoding='utf-8'), str(path))
+
+
+def clear_cache() -> None:
+    _table_cache.clear()
+
+
+#%% [Incremental Parser]
+
+def changed_lines(old: List[str], new: List[str]) -> Tuple[int, int, int]:
+    """Return the changed old line range `[first, last]` (1-based) and the line count delta.
+    
+    A pure insertion returns `last == first - 1`.
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    
+    return prefix + 1, len(old) - suffix, len(new) - len(old)
+
+
+def splice(entries: Tuple, block: GroupBlock, replacement: Tuple, delta: int) -> Tuple:
+    """Replace the entries inside `block` (entries are sorted by `line_start`) and shift the ones behind it."""
+    first = bisect.bisect_left(entries, block.line_start, key=attrgetter('line_start'))
+    last = bisect.bisect_right(entries, block.line_end, key=attrgetter('line_start'))
+    tail = entries[last:]
+    if delta and tail:
+        make = type(tail[0])._make
+        tail = tuple(make(entry[:-2] + (entry[-2] + delta, entry[-1] + delta)) for entry in tail)
+    return entries[:first] + replacement + tail
+
+
+class IncrementalParser:
+    """Keep the parameter table of one model file and patch it when the file changes.
+    
+    An edit inside a `with ParameterGroup(...)` block (below its `with` line) re-parses only the outermost
+    enclosing block and shifts the line spans behind it, everything else falls back to a full parse. Call `refresh()` periodically (e.g. from a
+    `ui.timer`) to follow changes of the file on disk.
+    """
+
+    def __init__(self, file_name: Optional[UnionFilesystem] = None, source: Optional[str] = None):
+        self._file_name = str(file_name) if file_name is not None else '<model>'
+        self._mtime_ns = None
+        self._lines: List[str] = []
+        self._table = ParameterTable((), ())
+        self.full_parses = 0
+        self.incremental_parses = 0
+        
+        if source is not None:
+            self.update(source)
+        elif file_name is not None:
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """Re-read the file if its modification time changed, return `True` if the table was updated."""
+        try:
+            mtime_ns = os.stat(self._file_name).st_mtime_ns
+        except OSError:
+            return False
+        if mtime_ns == self._mtime_ns:
+            return False
+        
+        self._mtime_ns = mtime_ns
+        old_table = self._table
+        self.update(Path(self._file_name).read_text(encoding='utf-8'))
+        return self._table != old_table
+
+    def update(self, source: str) -> ParameterTable:
+        """Apply a new version of the source and return the patched table."""
+        lines = source.split('\n')
+        if not self._lines:
+            return self._full_parse(source, lines)
+        
+        first, last, delta = changed_lines(self._lines, lines)
+        if first > len(self._lines) and delta == 0:
+            return self._table
+        
+        block = self.enclosing_block(first, last)
+        table = self._parse_block(block, lines, delta) if block else None
+        if table is None:
+            return self._full_parse(source, lines)
+        
+        # a patched table is not stored in the content hash cache, only full parses are
+        self.incremental_parses += 1
+        self._lines = lines
+        self._table = table
+        return table
+
+    def enclosing_block(self, first: int, last: int) -> Optional[GroupBlock]:
+        """Return the outermost group block that contains the changed lines below its `with` line."""
+        for block in self._table.groups:
+            if block.line_start < first <= block.line_end and last <= block.line_end:
+                return block
+        return None
+
+    def _full_parse(self, source: str, lines: List[str]) -> ParameterTable:
+        self.full_parses += 1
+        self._lines = lines
+        self._table = parse_source(source, self._file_name)
+        return self._table
+
+    def _parse_block(self, block: GroupBlock, lines: List[str], delta: int) -> Optional[ParameterTable]:
+        start, end = block.line_start, block.line_end + delta
+        snippet = lines[start - 1:end]
+        
+        # indented blocks (e.g. inside a function) are wrapped instead of dedented to keep string contents intact
+        offset = start - 1
+        if snippet[0][:1].isspace():
+            snippet = ['if 1:'] + snippet
+            offset -= 1
+        
+        try:
+            tree = ast.parse('\n'.join(snippet), filename=self._file_name)
+        except SyntaxError:
+            return None
+        ast.increment_lineno(tree, offset)
+        
+        body = tree.body[0].body if offset < start - 1 else tree.body
+        # a dedented line leaves the block (a second statement): the enclosing scope has to be parsed again
+        if len(tree.body) != 1 or len(body) != 1 or not isinstance(body[0], (ast.With, ast.AsyncWith)) or body[0].end_lineno != end:
+            return None
+        groups: List[GroupBlock] = []
+        parameters: List[ParameterEntry] = []
+        visit_body(body, None, groups, parameters)
+        
+        old = self._table
+        return ParameterTable(
+            splice(old.groups, block, tuple(groups), delta),
+            splice(old.parameters, block, tuple(parameters), delta),
+        )
+
+    @property
+    def file_name(self) -> str:
+        return self._file_name
+
+    @property
+    def source(self) -> str:
+        return '\n'.join(self._lines)
+
+    @property
+    def table(self) -> ParameterTable:
+        return self._table
@@ -0,0 +1,125 @@
+"""
+A shared, mtime-keyed cache of source file lines used by `CodeContext`.
+"""
+
+#%% [Imports]
+import os
+import tokenize
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+#%% [Types]
+
+class SourceEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    lines: List[str]
+
+
+class SourceCache:
+    """A bounded LRU cache of file lines, invalidated when mtime or size of a file change."""
+
+    def __init__(self, max_files: int = 128):
+        if max_files < 1:
+            raise ValueError(f"Cache size '{max_files}' must be at least 1.")
+        
+        self._max_files = max_files
+        self._entries: OrderedDict[str, SourceEntry] = OrderedDict()
+        self._recent: Optional[Tuple[str, os.stat_result]] = None    # the `stat` of the last `exists` call
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name in self._entries
+
+    def exists(self, file_name: str) -> bool:
+        """Check if the path (a file or a directory) exists with a single `stat` call, the file is not read."""
+        stat = self._stat(file_name)
+        self._recent = (file_name, stat) if stat is not None else None
+        return stat is not None
+
+    def lines(self, file_name: str, check: bool = True) -> Optional[List[str]]:
+        """Return all lines of the file (including line endings) or `None` if it cannot be read.
+        
+        With `check=False` the `stat` of the preceding `exists` call is reused, without one a cached entry is
+        returned as it is.
+        """
+        entry = self._entries.get(file_name)
+        stat = None
+        if not check:
+            if self._recent is not None and self._recent[0] == file_name:
+                stat = self._recent[1]
+            elif entry:
+                self.hits += 1
+                self._entries.move_to_end(file_name)
+                return entry.lines
+        self._recent = None
+        
+        if stat is None:
+            stat = self._stat(file_name)
+            if stat is None:
+                return None
+        
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.hits += 1
+            self._entries.move_to_end(file_name)
+            return entry.lines
+        
+        self.misses += 1
+        try:
+            # the encoding of a source file is detected like Python does (BOM or coding cookie, else UTF-8)
+            with tokenize.open(file_name) as f:
+                lines = f.readlines()
+        except (OSError, SyntaxError, UnicodeDecodeError):
+            self._entries.pop(file_name, None)
+            return None
+        
+        self._entries[file_name] = SourceEntry(stat.st_mtime_ns, stat.st_size, lines)
+        self._entries.move_to_end(file_name)
+        while len(self._entries) > self._max_files:
+            self._entries.popitem(last=False)
+        return lines
+
+    def _stat(self, file_name: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(file_name)
+        except (OSError, ValueError):
+            self._entries.pop(file_name, None)
+            return None
+
+    def line_count(self, file_name: str, check: bool = True) -> int:
+        lines = self.lines(file_name, check)
+        return len(lines) if lines is not None else 0
+
+    def get_line(self, file_name: str, line_number: int) -> str:
+        """Return the line (1-based) without its line ending or an empty string."""
+        lines = self.lines(file_name)
+        if lines is None or not 1 <= line_number <= len(lines):
+            return ""
+        return lines[line_number - 1].rstrip("\r\n")
+
+    def get_lines(self, file_name: str, start: int, end: int) -> List[str]:
+        """Return the lines `start` to `end` (1-based, inclusive) without line endings."""
+        lines = self.lines(file_name) or []
+        return [line.rstrip("\r\n") for line in lines[max(start, 1) - 1:end]]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._recent = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_files(self) -> int:
+        return self._max_files
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'files': len(self._entries), 'max_files': self._max_files}
+
+
+#%% [Shared instance]
+source_cache = SourceCache()
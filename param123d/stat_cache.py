@@ -0,0 +1,111 @@
+"""
+A shared filesystem stat cache with a time-to-live, used to validate file and path parameters.
+"""
+
+#%% [Imports]
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Union
+from pathlib import Path
+
+#%% [Types]
+
+class StatEntry(NamedTuple):
+    expires: float
+    result: Optional[os.stat_result]    # `None` if the path does not exist
+
+
+class StatCache:
+    """Cache `os.stat` results (and misses, unless `cache_misses` is false) for `ttl` seconds.
+    
+    One `stat` call answers `exists`, `is_file` and `is_dir`. `prefetch` stats many paths concurrently,
+    which hides the latency of network filesystems.
+    """
+
+    def __init__(self, ttl: float = 5.0, max_entries: int = 65536, clock: Callable[[], float] = time.monotonic, cache_misses: bool = True):
+        if ttl < 0:
+            raise ValueError(f"Time to live '{ttl}' must not be negative.")
+        
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._cache_misses = cache_misses
+        self._entries: Dict[str, StatEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stat(self, path: Union[str, Path]) -> Optional[os.stat_result]:
+        key = os.fspath(path)
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires > now:
+            self.hits += 1
+            return entry.result
+        
+        self.misses += 1
+        return self._store(key, self._stat(key), now)
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        return self.stat(path) is not None
+
+    def is_file(self, path: Union[str, Path]) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISREG(result.st_mode)
+
+    def is_dir(self, path: Union[str, Path]) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISDIR(result.st_mode)
+
+    def prefetch(self, paths: Iterable[Union[str, Path]], max_workers: Optional[int] = None) -> None:
+        """Stat all paths that are not cached yet on a thread pool."""
+        now = self._clock()
+        keys = {os.fspath(path) for path in paths}
+        keys = [key for key in keys if key not in self._entries or self._entries[key].expires <= now]
+        if not keys:
+            return
+        
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(keys))) as executor:
+            results = list(executor.map(self._stat, keys))
+        
+        now = self._clock()
+        self.misses += len(keys)
+        for key, result in zip(keys, results):
+            self._store(key, result, now)
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.fspath(path), None)
+
+    def _store(self, key: str, result: Optional[os.stat_result], now: float) -> Optional[os.stat_result]:
+        if result is None and not self._cache_misses:
+            self._entries.pop(key, None)
+            return result
+        if len(self._entries) >= self._max_entries:
+            self._entries = {name: entry for name, entry in self._entries.items() if entry.expires > now}
+            if len(self._entries) >= self._max_entries:
+                self._entries.clear()
+        self._entries[key] = StatEntry(now + self._ttl, result)
+        return result
+
+    @staticmethod
+    def _stat(key: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(key)
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+
+#%% [Shared instance]
+# a file that is written right before its parameter is created must not be rejected by a cached miss
+stat_cache = StatCache(cache_misses=False)
@@ -0,0 +1,212 @@
+"""
+Stream parameters from and to CSV and JSON Lines files in bounded memory.
+
+Every line (row) holds one parameter record: its name, the `ParameterType` name, the value and the optional
+metadata (unit, help, bounds, calc, choices or catalog name). Readers are generators that create and validate one parameter
+per record, writers consume any iterable of parameters (e.g. another reader) record by record.
+"""
+
+#%% [Imports]
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, TextIO
+from .parameter_base import BaseParameter, UnionFilesystem
+from .parameter_types import ParameterType
+from .parameters import ChoiceParameter, create_parameter
+
+#%% [Types]
+
+type Record = Dict[str, Any]
+
+FIELDS = ('name', 'type', 'value', 'unit', 'help', 'min_value', 'max_value', 'step_value', 'default_value', 'calc', 'choices', 'catalog')
+NUMBER_FIELDS = ('min_value', 'max_value', 'step_value')
+# an empty CSV value cell is no value for these types (and an empty text for all others)
+EMPTY_NONE_TYPES = (ParameterType.BooleanParameter, ParameterType.IntegerParameter, ParameterType.FontSizeParameter,
+                    ParameterType.FloatParameter, ParameterType.RangeParameter)
+
+#%% [Records]
+
+def parameter_record(parameter: BaseParameter) -> Record:
+    """Return the plain record of a parameter, metadata that is not set is left out."""
+    record = {'name': parameter.name, 'type': parameter.param_type.name, 'value': plain(parameter.value)}
+    for field in FIELDS[3:-2]:
+        value = getattr(parameter, field, None)
+        if value is not None:
+            record[field] = value
+    if isinstance(parameter, ChoiceParameter):
+        # a catalog is referenced by name instead of repeating its choices in every record
+        if parameter.catalog is not None:
+            record['catalog'] = parameter.catalog.name
+        elif isinstance(parameter._choices, dict):
+            # `[value, label]` pairs keep the value types (JSON object keys are strings)
+            record['choices'] = [[value, label] for value, label in parameter._choices.items()]
+        else:
+            record['choices'] = parameter.choices
+    return record
+
+
+def parameter_from_record(record: Record) -> BaseParameter:
+    """Create (and validate) the parameter of a record."""
+    unknown = set(record).difference(FIELDS)
+    if unknown:
+        raise ValueError(f"Parameter record has unknown fields: {', '.join(sorted(unknown))}.")
+    if 'name' not in record or 'type' not in record:
+        raise ValueError("Parameter record needs a 'name' and a 'type'.")
+
+    options = {field: value for field, value in record.items() if field not in ('name', 'type', 'value') and value is not None}
+    if 'choices' in options:
+        options['choices'] = record_choices(options['choices'])
+    return create_parameter(parameter_type(record['type']), record['name'], record.get('value'), **options)
+
+
+def record_choices(choices):
+    """Return the choices of a record, a list of `[value, label]` pairs is a dict of labeled choices."""
+    if isinstance(choices, list) and choices and all(isinstance(choice, list) and len(choice) == 2 for choice in choices):
+        return {value: label for value, label in choices}
+    return choices
+
+
+def parameter_type(name: str) -> ParameterType:
+    """Look up a `ParameterType` by name (`IntegerParameter`) or by value (`integer`)."""
+    if name in ParameterType.__members__:
+        return ParameterType[name]
+    try:
+        return ParameterType(name)
+    except ValueError:
+        raise ValueError(f"Parameter type '{name}' is not a valid parameter type.") from None
+
+
+def plain(value: Any) -> Any:
+    return str(value) if isinstance(value, Path) else value
+
+
+def stream_records(rows: Iterable, convert: Callable[[Any], Record], source: str, skip_invalid: bool = False) -> Iterator[BaseParameter]:
+    """Convert raw `(line, row)` pairs to records and create the parameters, one row at a time."""
+    for line, row in rows:
+        try:
+            yield parameter_from_record(convert(row))
+        except (ValueError, TypeError) as error:
+            if not skip_invalid:
+                raise ValueError(f"{source}:{line}: {error}") from None
+            logging.warning("Skipped invalid parameter in %s:%d: %s", source, line, error)
+
+
+#%% [JSON Lines]
+
+def read_jsonl(stream: TextIO, skip_invalid: bool = False) -> Iterator[BaseParameter]:
+    """Yield the parameters of a JSON Lines stream (one record object per line)."""
+    rows = ((line, text) for line, text in enumerate(stream, 1) if text.strip())
+    return stream_records(rows, json_record, getattr(stream, 'name', '<jsonl>'), skip_invalid)
+
+
+def json_record(text: str) -> Record:
+    record = json.loads(text)
+    if not isinstance(record, dict):
+        raise ValueError("Parameter record is not a JSON object.")
+    return record
+
+
+def write_jsonl(parameters: Iterable[BaseParameter], stream: TextIO) -> int:
+    count = 0
+    for parameter in parameters:
+        stream.write(json.dumps(parameter_record(parameter), ensure_ascii=False))
+        stream.write('\n')
+        count += 1
+    return count
+
+
+#%% [CSV]
+
+def csv_number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def csv_value(param_type: ParameterType, text: str):
+    """Convert the text of a CSV value cell to the value type of `param_type`."""
+    if text == '':
+        return None if param_type in EMPTY_NONE_TYPES else text
+    if param_type == ParameterType.BooleanParameter:
+        if text.lower() not in ('true', 'false', '1', '0'):
+            raise ValueError(f"Parameter value '{text}' is not a boolean.")
+        return text.lower() in ('true', '1')
+    if param_type in (ParameterType.IntegerParameter, ParameterType.FontSizeParameter):
+        return int(text)
+    if param_type == ParameterType.FloatParameter:
+        return float(text)
+    if param_type in (ParameterType.RangeParameter, ParameterType.ChoiceParameter):
+        try:
+            return csv_number(text)
+        except ValueError:
+            return text
+    return text
+
+
+def csv_record(row: Dict[str, str]) -> Record:
+    if None in row:
+        raise ValueError("Parameter row has more cells than the header.")
+    # empty cells of the optional metadata columns are not set, the value cell is kept
+    record = {field: text for field, text in row.items() if text is not None and (text != '' or field == 'value')}
+    if 'type' in record:
+        # the default has the type of the value (a number or e.g. a font name)
+        for field in ('value', 'default_value'):
+            if field in record:
+                record[field] = csv_value(parameter_type(record['type']), record[field])
+    for field in NUMBER_FIELDS:
+        if field in record:
+            record[field] = csv_number(record[field])
+    if 'choices' in record:
+        record['choices'] = json.loads(record['choices'])
+    return record
+
+
+def read_csv(stream: TextIO, skip_invalid: bool = False) -> Iterator[BaseParameter]:
+    """Yield the parameters of a CSV stream with a header row (columns as in `FIELDS`, all but name and type optional)."""
+    reader = csv.DictReader(stream)
+    rows = ((reader.line_num, row) for row in reader)
+    return stream_records(rows, csv_record, getattr(stream, 'name', '<csv>'), skip_invalid)
+
+
+def write_csv(parameters: Iterable[BaseParameter], stream: TextIO) -> int:
+    writer = csv.DictWriter(stream, FIELDS)
+    writer.writeheader()
+    count = 0
+    for parameter in parameters:
+        record = parameter_record(parameter)
+        if isinstance(record['value'], bool):
+            record['value'] = str(record['value']).lower()
+        if 'choices' in record:
+            record['choices'] = json.dumps(record['choices'], ensure_ascii=False)
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+#%% [Main Functions]
+
+FORMATS = {'.csv': (read_csv, write_csv), '.jsonl': (read_jsonl, write_jsonl)}
+
+
+def stream_format(file_name: UnionFilesystem):
+    suffix = Path(file_name).suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"Parameter file '{file_name}' needs one of the suffixes {', '.join(FORMATS)}.")
+    return FORMATS[suffix]
+
+
+def read(file_name: UnionFilesystem, skip_invalid: bool = False) -> Iterator[BaseParameter]:
+    """Yield the parameters of a `.csv` or `.jsonl` file one at a time (the file is closed when the generator ends)."""
+    reader, _ = stream_format(file_name)
+    with open(file_name, encoding='utf-8', newline='') as stream:
+        yield from reader(stream, skip_invalid)
+
+
+def write(parameters: Iterable[BaseParameter], file_name: UnionFilesystem) -> int:
+    """Write parameters to a `.csv` or `.jsonl` file and return the count."""
+    _, writer = stream_format(file_name)
+    with open(file_name, 'w', encoding='utf-8', newline='') as stream:
+        return writer(parameters, stream)
@@ -0,0 +1,125 @@
+"""
+Vectorized parameter sweeps with NumPy (optional dependency: `param123d[numpy]`).
+
+Input parameters are bound to arrays and every dependent `calc` expression is evaluated once on the whole
+array instead of once per variant.
+"""
+
+#%% [Imports]
+import ast
+from functools import lru_cache, reduce
+from types import CodeType
+from typing import Any, Dict, Mapping, Optional
+from .calculation import compile_calculation
+from .dependencies import DependencyGraph
+from .parameter_base import Identifier, RangeParameter
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
+
+#%% [Helper Functions]
+
+def require_numpy():
+    if np is None:
+        raise ImportError("Parameter sweeps need NumPy, install it with `pip install param123d[numpy]`.")
+    return np
+
+
+def range_values(parameter: RangeParameter):
+    """Return every step between `min_value` and `max_value` (inclusive) of a range parameter."""
+    numpy = require_numpy()
+    if parameter.min_value is None or parameter.max_value is None or not parameter.step_value:
+        raise ValueError(f"Parameter '{parameter.name}' needs min_value, max_value and step_value for a sweep.")
+    
+    count = int(round((parameter.max_value - parameter.min_value) / parameter.step_value)) + 1
+    values = parameter.min_value + numpy.arange(count) * parameter.step_value
+    return values.astype(type(parameter.value))
+
+
+@lru_cache(maxsize=1)
+def vector_functions() -> Dict[str, Any]:
+    """The NumPy counterparts of `calculation.FUNCTIONS` plus the helpers used by `VectorTransformer`."""
+    numpy = require_numpy()
+    return {
+        'abs': numpy.abs, 'round': numpy.round,
+        'min': lambda *args: reduce(numpy.minimum, args), 'max': lambda *args: reduce(numpy.maximum, args),
+        'int': lambda value: numpy.asarray(value).astype(int), 'float': lambda value: numpy.asarray(value, dtype=float),
+        'bool': lambda value: numpy.asarray(value, dtype=bool),
+        'sqrt': numpy.sqrt, 'hypot': numpy.hypot, 'exp': numpy.exp, 'log': numpy.log, 'log10': numpy.log10,
+        'sin': numpy.sin, 'cos': numpy.cos, 'tan': numpy.tan, 'asin': numpy.arcsin, 'acos': numpy.arccos, 'atan': numpy.arctan, 'atan2': numpy.arctan2,
+        'radians': numpy.radians, 'degrees': numpy.degrees, 'floor': numpy.floor, 'ceil': numpy.ceil,
+        'pi': numpy.pi, 'tau': 2 * numpy.pi,
+        '__builtins__': {},
+        '_where': numpy.where, '_and': numpy.logical_and, '_or': numpy.logical_or, '_not': numpy.logical_not,
+    }
+
+
+class VectorTransformer(ast.NodeTransformer):
+    """Rewrite conditional and boolean expressions into element-wise NumPy calls."""
+
+    @staticmethod
+    def call(name: str, *args: ast.expr) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+    def visit_IfExp(self, node: ast.IfExp) -> ast.AST:
+        self.generic_visit(node)
+        return self.call('_where', node.test, node.body, node.orelse)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        name = '_and' if isinstance(node.op, ast.And) else '_or'
+        return reduce(lambda left, right: self.call(name, left, right), node.values)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        return self.call('_not', node.operand) if isinstance(node.op, ast.Not) else node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        operands = [node.left] + node.comparators
+        pairs = [ast.Compare(left=left, ops=[op], comparators=[right]) for left, op, right in zip(operands, node.ops, operands[1:])]
+        return reduce(lambda left, right: self.call('_and', left, right), pairs)
+
+
+@lru_cache(maxsize=1024)
+def compile_vectorized(calc: str) -> CodeType:
+    """Compile a validated `calc` expression for element-wise evaluation on arrays."""
+    compile_calculation(calc)
+    tree = VectorTransformer().visit(ast.parse(calc.strip(), mode='eval'))
+    return compile(ast.fix_missing_locations(tree), f'<vectorized {calc}>', 'eval')
+
+
+#%% [Sweep]
+
+def sweep(graph: DependencyGraph, values: Mapping[Identifier, Optional[Any]]) -> Dict[Identifier, Any]:
+    """Evaluate all calculations downstream of the bound inputs on whole arrays in one pass.
+    
+    `values` maps input parameter names to arrays (broadcast against each other); `None` sweeps the full
+    range of a `RangeParameter`. Returns the bound inputs and the computed arrays of the affected calculations.
+    """
+    numpy = require_numpy()
+    namespace = graph.values()
+    results = {}
+    
+    for name, array in values.items():
+        if name not in graph:
+            raise ValueError(f"Parameter '{name}' is not part of the graph.")
+        if array is None:
+            parameter = graph[name]
+            if not isinstance(parameter, RangeParameter):
+                raise ValueError(f"Parameter '{name}' is not a range parameter, please provide the values to sweep.")
+            array = range_values(parameter)
+        results[name] = namespace[name] = numpy.asarray(array)
+    
+    functions = vector_functions()
+    for name in graph.affected(values):
+        calc = graph[name].calc
+        local = {input_name: namespace[input_name] for input_name in graph.inputs(name)}
+        results[name] = namespace[name] = eval(compile_vectorized(calc), functions, local)
+    
+    shape = numpy.broadcast_shapes(*(numpy.shape(array) for array in results.values()))
+    return {name: numpy.broadcast_to(array, shape) for name, array in results.items()}
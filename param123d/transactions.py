@@ -0,0 +1,155 @@
+"""
+Transactional bulk updates of a `ParameterGroup` with a bounded undo/redo journal.
+
+A transaction collects value changes, validates all of them in one pass and applies them together: either
+every change is applied (with one notification per listener, see `observers.batch`) or none is. The applied
+changes are recorded as one compact journal entry (the names with their old and new values).
+
+    with group.transaction('preset') as changes:
+        changes.update(preset)
+    group.undo()
+"""
+
+#%% [Imports]
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Mapping, NamedTuple, Optional, Tuple
+from .observers import batch, notify
+from .parameter_base import Identifier, UnionType
+
+if TYPE_CHECKING:   # `parameter_groups` imports this module
+    from .parameter_groups import ParameterGroup
+
+#%% [Types]
+
+class JournalEntry(NamedTuple):
+    """The changes of one transaction, as columns."""
+    label: Optional[str]
+    names: Tuple[Identifier, ...]
+    old: Tuple[UnionType, ...]
+    new: Tuple[UnionType, ...]
+
+
+#%% [Commit]
+
+def commit(group: 'ParameterGroup', values: Mapping[Identifier, UnionType], label: Optional[str] = None) -> Optional[JournalEntry]:
+    """Validate and apply `values` to the parameters of `group`, returns the entry of the changed values.
+
+    Raises `ValueError` (listing every invalid value) before anything is applied.
+    """
+    parameters = group.parameters
+    errors: List[str] = []
+    changes = []
+    for name, value in values.items():
+        parameter = parameters.get(name)
+        if parameter is None:
+            errors.append(f"'{name}' is not a parameter of the group")
+            continue
+        try:
+            valid = parameter.is_valid_type(value)
+        except ValueError as error:
+            errors.append(f"'{name}': {error}")
+            continue
+        if not valid:
+            errors.append(f"'{name}': '{value}' is not a valid value for type '{parameter.param_type}'")
+        elif parameter.value != value:
+            changes.append((parameter, parameter.value, value))
+    if errors:
+        raise ValueError(f"Transaction on group '{group.name}' failed: {'; '.join(errors)}.")
+    if not changes:
+        return None
+
+    # the values are validated: assign them directly, the listeners are notified once when the batch ends
+    applied = []
+    with batch():
+        try:
+            for parameter, old, new in changes:
+                parameter._value = new
+                applied.append((parameter, old))
+                notify(parameter, old, new)
+        except BaseException:
+            # the reverted changes are dropped by the batch
+            for parameter, old in reversed(applied):
+                parameter._value = old
+                notify(parameter, parameter.value, old)
+            raise
+
+    names, old_values, new_values = zip(*((parameter.name, old, new) for parameter, old, new in changes))
+    return JournalEntry(label, names, old_values, new_values)
+
+
+#%% [Journal]
+
+class Journal:
+    """Bounded undo and redo stacks of `JournalEntry`s."""
+
+    def __init__(self, max_entries: int = 100):
+        if max_entries < 1:
+            raise ValueError(f"Journal size '{max_entries}' must be at least 1.")
+        self._undo: Deque[JournalEntry] = deque(maxlen=max_entries)
+        self._redo: List[JournalEntry] = []
+
+    def record(self, entry: JournalEntry) -> None:
+        self._undo.append(entry)
+        self._redo.clear()
+
+    def undo(self, group: 'ParameterGroup') -> Optional[JournalEntry]:
+        """Restore the old values of the last entry, returns the entry (`None` if there is nothing to undo)."""
+        if not self._undo:
+            return None
+        entry = self._undo[-1]
+        commit(group, dict(zip(entry.names, entry.old)), entry.label)
+        self._redo.append(self._undo.pop())
+        return entry
+
+    def redo(self, group: 'ParameterGroup') -> Optional[JournalEntry]:
+        if not self._redo:
+            return None
+        entry = self._redo[-1]
+        commit(group, dict(zip(entry.names, entry.new)), entry.label)
+        self._undo.append(self._redo.pop())
+        return entry
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def entries(self) -> Tuple[JournalEntry, ...]:
+        return tuple(self._undo)
+
+
+#%% [Transaction]
+
+class Transaction(dict):
+    """The pending `{name: value}` changes of a group, committed when the `with` block ends without an exception."""
+
+    def __init__(self, group: 'ParameterGroup', journal: Optional[Journal] = None, label: Optional[str] = None):
+        super().__init__()
+        self._group = group
+        self._journal = journal
+        self._label = label
+        self.entry: Optional[JournalEntry] = None
+
+    def __enter__(self) -> 'Transaction':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.clear()
+
+    def commit(self) -> Optional[JournalEntry]:
+        self.entry = commit(self._group, self, self._label)
+        self.clear()
+        if self.entry is not None and self._journal is not None:
+            self._journal.record(self.entry)
+        return self.entry
@@ -0,0 +1,178 @@
+"""
+The NiceGUI user interface of the parameters.
+
+This module is imported on the first `create_ui()`/`help_ui()` call, so computing parameters without a
+user interface does not load NiceGUI (FastAPI, uvicorn, ...).
+"""
+
+#%% [Imports]
+from functools import singledispatch
+from typing import Optional
+from nicegui import ui
+from .parameter_base import BaseParameter, RangeParameter, CalculationParameter, HelpType
+from .parameters import BooleanParameter, IntegerParameter, ChoiceParameter, FontParameter
+from . import fonts
+from .catalogs import catalog
+from .choices import ChoiceIndex
+from .help_cache import help_cache, help_text
+from .updates import UpdateBatcher
+
+FRAME_INTERVAL = 1 / 60
+SEARCH_THRESHOLD = 200   # choices up to this count are sent to the browser at once
+SEARCH_LIMIT = 50
+
+#%% [Help]
+
+def rendered_ui(text: str, help_type: HelpType = HelpType.MARKDOWN):
+    """Show markdown/reStructuredText rendered by the shared `help_cache` (instead of `ui.markdown`/`ui.rst`)."""
+    return ui.html(help_cache.render(text, help_type)).classes('nicegui-markdown')
+
+
+def help_ui(parameter: BaseParameter):
+    # the same text `help_cache.warm()` renders in advance
+    rendered = help_text(parameter)
+    if rendered is not None:
+        return rendered_ui(*rendered)
+    else:
+        return ui.label(parameter.help)
+
+#%% [Choices]
+
+def search_options(index: ChoiceIndex, text: Optional[str], value=None) -> dict:
+    """Return the select options matching `text`, the selected `value` is always included."""
+    values = index.search(text if isinstance(text, str) else '', SEARCH_LIMIT)
+    if value in index and value not in values:
+        values.append(value)
+    return index.options(values)
+
+
+def choice_select(index: ChoiceIndex, choices, value) -> ui.select:
+    if len(index) <= SEARCH_THRESHOLD:
+        main = ui.select(options=choices)
+    else:
+        # large catalogs are filtered on the server, the browser only gets the matching options
+        main = ui.select(options=search_options(index, '', value), with_input=True)
+        main.on('input-value', lambda event: main.set_options(search_options(index, event.args, main.value)))
+    main.set_value(value)
+    return main
+
+
+#%% [Value Propagation]
+
+def bind_batcher(element, parameter: BaseParameter, batcher: Optional[UpdateBatcher]):
+    """Forward the value changes of `element` to the batcher (if there is one)."""
+    if batcher is not None:
+        group = parameter._groups[0] if parameter._groups else None
+        element.on_value_change(lambda event: batcher.push(parameter.name, event.value, group))
+    return element
+
+
+def start_batcher(batcher: UpdateBatcher, interval: float = FRAME_INTERVAL) -> ui.timer:
+    """Poll the batcher once per animation frame."""
+    return ui.timer(interval, batcher.poll)
+
+#%% [Parameter Elements]
+
+@singledispatch
+def create_ui(parameter: BaseParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    """Create `(label, element, help)`, `with_help=False` skips the help element (`help` is `None`).
+    
+    Value changes are pushed to `batcher` instead of being applied one by one.
+    """
+    label  = ui.label(parameter.name).props('w-full')
+    # TODO: label.set_tooltip(parameter.param_type)
+    element = ui.input()
+    element.set_value(parameter.value)
+    bind_batcher(element, parameter, batcher)
+    
+    help = help_ui(parameter) if with_help else None
+    
+    return (label, element, help)
+
+
+@create_ui.register
+def create_range_ui(parameter: RangeParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    # TODO: label.set_tooltip(parameter.param_type)
+    with ui.row().classes('m-0 p-0') as element:
+        element_1 = ui.label(parameter.value).props('text-right')
+        if parameter.unit:
+            element_2 = ui.label(parameter.unit)
+        element_3 = ui.slider(value=parameter.value, min=parameter.min_value, max=parameter.max_value, step=parameter.step_value)
+        element_1.bind_text_from(element_3, 'value')
+        bind_batcher(element_3, parameter, batcher)
+    help = help_ui(parameter) if with_help else None
+    
+    return (label, element, help)
+
+
+@create_ui.register
+def create_calculation_ui(parameter: CalculationParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    # TODO: label.set_tooltip(parameter.param_type)
+    
+    # value = ui.label(parameter.value)
+    # TODO: value.set_value(parameter.value)
+
+    element = ui.input().classes('w-full')
+    element.set_value(str(parameter.calc))
+    # TODO: how to solve this? Probably need to use RedBaron
+    
+    help = help_ui(parameter) if with_help else None
+    
+    return (label, element, help)
+
+
+@create_ui.register
+def create_boolean_ui(parameter: BooleanParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    switch = ui.switch()
+    switch.set_value(parameter.value)
+    bind_batcher(switch, parameter, batcher)
+    
+    help   = help_ui(parameter) if with_help else None
+    
+    return (label, switch, help)
+
+
+@create_ui.register
+def create_integer_ui(parameter: IntegerParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    main = ui.number(validation=parameter.dict_valid())
+    main.set_value(parameter.value)
+    bind_batcher(main, parameter, batcher)
+    
+    help   = help_ui(parameter) if with_help else None
+    
+    return (label, main, help)
+
+
+@create_ui.register
+def create_choice_ui(parameter: ChoiceParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    main = choice_select(parameter.index, parameter._choices, parameter.value)
+    bind_batcher(main, parameter, batcher)
+    
+    help   = help_ui(parameter) if with_help else None
+    
+    return (label, main, help)
+
+
+@create_ui.register
+def create_font_ui(parameter: FontParameter, with_help: bool = True, batcher: Optional[UpdateBatcher] = None):
+    label  = ui.label(parameter.name).props('w-full')
+    scanner = fonts.font_scanner.start()
+    installed = catalog('fonts') if scanner.ready else None
+    if installed is None:
+        # the event loop does not wait for the font scan, the names of the last scan are offered meanwhile
+        main = ui.input(value=parameter.value, autocomplete=scanner.cached_names())
+    elif parameter.value in installed:
+        main = choice_select(installed.index, installed.choices, parameter.value)
+    else:
+        # a font that is not installed (lenient validation) stays editable as text
+        main = ui.input(value=parameter.value)
+    bind_batcher(main, parameter, batcher)
+    
+    help   = help_ui(parameter) if with_help else None
+    
+    return (label, main, help)
@@ -0,0 +1,143 @@
+"""
+Units of range and calculation parameters (optional dependency: `param123d[pint]`).
+
+The pint `UnitRegistry` is created on first use, once per process, from pint's on-disk registry cache
+(building it from the definition files takes hundreds of milliseconds). Parsed unit strings and conversion
+factors are cached, converting a parameter set is one multiplication per value.
+Without pint every unit string is accepted and only identical units can be converted.
+"""
+
+#%% [Imports]
+import importlib.util
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:   # `parameter_base` imports this module
+    from .parameter_base import BaseParameter
+
+#%% [Types]
+
+type UnionNumber = Union[int, float]
+
+
+class UnitValue(NamedTuple):
+    value: UnionNumber
+    unit: Optional[str]
+
+
+#%% [Registry]
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def has_pint() -> bool:
+    return importlib.util.find_spec('pint') is not None
+
+
+def require_pint():
+    if not has_pint():
+        raise ImportError("Unit conversions need pint, install it with `pip install param123d[pint]`.")
+
+
+def registry():
+    """Return the process-wide pint `UnitRegistry` (created on the first call)."""
+    global _registry
+    if _registry is None:
+        require_pint()
+        with _registry_lock:
+            if _registry is None:
+                import pint
+                try:
+                    _registry = pint.UnitRegistry(autoconvert_offset_to_baseunit=True, cache_folder=':auto:')
+                except Exception:  # pragma: no cover - e.g. a read-only cache folder
+                    _registry = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+    return _registry
+
+
+def preload() -> Optional[threading.Thread]:
+    """Create the registry on a background thread (e.g. while the UI starts), if pint is installed."""
+    if _registry is not None or not has_pint():
+        return None
+    thread = threading.Thread(target=registry, name='param123d-units', daemon=True)
+    thread.start()
+    return thread
+
+
+#%% [Units]
+
+@lru_cache(maxsize=1024)
+def parse_unit(unit: str):
+    """Return the pint unit of a unit string, raises `ValueError` for unknown units."""
+    if not isinstance(unit, str):
+        raise ValueError(f"Unit '{unit}' is not a string.")
+    try:
+        return registry().parse_units(unit)
+    except (ValueError, AttributeError) as error:   # pint errors derive from these
+        raise ValueError(f"Unit '{unit}' is not a valid unit: {error}") from None
+
+
+@lru_cache(maxsize=1024)
+def is_unit(unit: str) -> bool:
+    if not has_pint():
+        return isinstance(unit, str)
+    try:
+        parse_unit(unit)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def conversion_factor(source: str, target: str) -> float:
+    """Return the factor that converts a value in `source` units to `target` units."""
+    if source == target:
+        return 1.0
+    require_pint()
+    source_unit, target_unit = parse_unit(source), parse_unit(target)
+    if source_unit.dimensionality != target_unit.dimensionality:
+        raise ValueError(f"Unit '{source}' cannot be converted to '{target}'.")
+
+    quantity = registry().Quantity
+    if quantity(0.0, source_unit).to(target_unit).magnitude != 0.0:
+        raise ValueError(f"Unit '{source}' has an offset to '{target}', the conversion is not a factor.")
+    return float(quantity(1.0, source_unit).to(target_unit).magnitude)
+
+
+def convert(value: UnionNumber, source: str, target: str) -> float:
+    return value * conversion_factor(source, target)
+
+
+@lru_cache(maxsize=1024)
+def target_unit(unit: str, targets: tuple) -> Optional[str]:
+    """Return the first unit of `targets` with the dimensionality of `unit`."""
+    for target in targets:
+        if target == unit:
+            return target
+    if not has_pint():
+        return None
+    dimensionality = parse_unit(unit).dimensionality
+    for target in targets:
+        if parse_unit(target).dimensionality == dimensionality:
+            return target
+    return None
+
+
+def convert_parameters(parameters: Iterable['BaseParameter'], targets: Iterable[str]) -> Dict[str, UnitValue]:
+    """Convert the values of a parameter set to the `targets` units (e.g. `['inch', 'inch**2']`).
+
+    Parameters without a unit or without a target of the same dimensionality keep their value.
+    """
+    targets = tuple(targets)
+    values = {}
+    for parameter in parameters:
+        unit = getattr(parameter, 'unit', None)
+        target = target_unit(unit, targets) if unit else None
+        if target is None or not isinstance(parameter.value, (int, float)) or isinstance(parameter.value, bool):
+            values[parameter.name] = UnitValue(parameter.value, unit)
+        else:
+            values[parameter.name] = UnitValue(parameter.value * conversion_factor(unit, target), target)
+    return values
+
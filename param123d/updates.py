@@ -0,0 +1,85 @@
+"""
+Debounced and batched propagation of value changes from UI elements to the parameter model.
+"""
+
+#%% [Imports]
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .parameter_base import Identifier, UnionType
+from .parameter_groups import ParameterGroup
+
+#%% [Types]
+
+# a value is keyed by its group and name, a panel sends several groups (with the same parameter names) through one batcher
+type UpdateKey = Tuple[Optional[ParameterGroup], Identifier]
+type Transaction = Dict[UpdateKey, UnionType]
+type TransactionListener = Callable[[Transaction], Any]
+
+#%% [Main Class]
+
+class UpdateBatcher:
+    """Coalesce rapid value changes and hand them to the listeners as a single transaction.
+
+    `push()` only records the latest value per parameter (keyed by `(group, name)`). `poll()` is meant to be called once per
+    animation frame (e.g. by `ui.timer(1 / 60, batcher.poll)`) and flushes when the changes paused for
+    `debounce` seconds or, while changes continue, at the latest every `throttle` seconds.
+    """
+
+    def __init__(self, debounce: float = 0.05, throttle: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if debounce < 0 or (throttle is not None and throttle <= 0):
+            raise ValueError(f"Debounce '{debounce}' and throttle '{throttle}' must be positive.")
+
+        self._debounce = debounce
+        self._throttle = throttle
+        self._clock = clock
+        self._pending: Transaction = {}
+        self._first_change: Optional[float] = None
+        self._last_change: Optional[float] = None
+        self._listeners: List[TransactionListener] = []
+        self.transactions = 0
+
+    def subscribe(self, listener: TransactionListener) -> Callable[[], None]:
+        """Register a listener and return a function that removes it again."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener) if listener in self._listeners else None
+
+    def push(self, name: Identifier, value: UnionType, group: Optional[ParameterGroup] = None) -> None:
+        now = self._clock()
+        if not self._pending:
+            self._first_change = now
+        self._pending[(group, name)] = value
+        self._last_change = now
+
+    def due(self, now: Optional[float] = None) -> bool:
+        if not self._pending:
+            return False
+        now = self._clock() if now is None else now
+        if now - self._last_change >= self._debounce:
+            return True
+        return self._throttle is not None and now - self._first_change >= self._throttle
+
+    def poll(self, now: Optional[float] = None) -> Optional[Transaction]:
+        """Flush the pending changes if they are due, returns the delivered transaction."""
+        if self.due(now):
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[Transaction]:
+        """Deliver all pending changes immediately, a failing listener is logged and does not stop the others."""
+        if not self._pending:
+            return None
+
+        transaction, self._pending = self._pending, {}
+        self._first_change = self._last_change = None
+        self.transactions += 1
+        for listener in list(self._listeners):
+            try:
+                listener(transaction)
+            except Exception:
+                logging.exception("Transaction listener %r failed", listener)
+        return transaction
+
+    @property
+    def pending(self) -> Transaction:
+        return dict(self._pending)
@@ -0,0 +1,98 @@
+import pickle
+import pytest
+from param123d.build_cache import BuildCache, KeyEntry, parameter_key
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameters import BooleanParameter, FloatParameter, IntegerParameter
+
+calls = []
+
+
+def make_box(values):
+    calls.append(values)
+    if values["hollow"]:
+        return values["width"] * values["height"] - 1.0
+    return values["width"] * values["height"]
+
+
+def make_large(values):
+    return bytes(values["size"])
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def test_parameter_key_is_stable():
+    entries = [KeyEntry("a", "IntegerParameter", ["int", 1], "mm"), KeyEntry("b", "float", ["float", "0x1p+0"], None)]
+    assert parameter_key(entries) == parameter_key(reversed(entries))
+    assert parameter_key(entries) != parameter_key(entries, "other model")
+
+
+def test_only_read_parameters_are_keyed(tmp_path):
+    cache = BuildCache(tmp_path)
+    values = {"width": 2.0, "height": 3.0, "hollow": False, "color": "red"}
+
+    assert cache.build(make_box, values) == 6.0
+    assert cache.build(make_box, {**values, "color": "blue"}) == 6.0
+    assert (cache.hits, cache.misses, len(calls)) == (1, 1, 1)
+
+    # a different branch records a second read set
+    assert cache.build(make_box, {**values, "hollow": True}) == 5.0
+    assert cache.build(make_box, {**values, "width": 4.0}) == 12.0
+    assert cache.build(make_box, {**values, "hollow": True, "color": "green"}) == 5.0
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # a new cache instance (e.g. after a restart) finds the results on disk
+    restarted = BuildCache(tmp_path)
+    assert restarted.build(make_box, {**values, "width": 4.0}) == 12.0
+    assert restarted.hits == 1
+
+
+def test_parameters_with_type_and_unit(tmp_path):
+    cache = BuildCache(tmp_path)
+    with ParameterGroup("box") as group:
+        FloatParameter("width", 2.0, "mm")
+        FloatParameter("height", 3.0, "mm")
+        BooleanParameter("hollow", False)
+        IntegerParameter("count", 4, max_value=10)
+
+    assert cache.build(make_box, group) == 6.0
+    assert cache.build(make_box, group) == 6.0
+    group["count"].set_value(5)
+    assert cache.build(make_box, group) == 6.0
+    assert cache.misses == 1
+
+    inches = {parameter.name: parameter for parameter in group}
+    inches["width"] = FloatParameter("width", 2.0, "in")
+    assert cache.build(make_box, inches) == 6.0
+    assert cache.misses == 2
+
+
+def test_declared_reads(tmp_path):
+    cache = BuildCache(tmp_path)
+    assert cache.build(make_box, {"width": 1.0, "height": 1.0, "hollow": False}, reads=["width", "height", "hollow"]) == 1.0
+    with pytest.raises(ValueError, match="undefined parameters: depth"):
+        cache.build(make_box, {"width": 1.0}, reads=["width", "depth"])
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    cache = BuildCache(tmp_path, max_bytes=3000)
+    for size in (1000, 1001, 1002):
+        cache.build(make_large, {"size": size})
+    assert len(cache) == 2
+    assert cache.size <= 3000
+
+    cache.build(make_large, {"size": 1001})
+    assert cache.hits == 1
+    cache.build(make_large, {"size": 1003})
+    assert cache.build(make_large, {"size": 1001}) == bytes(1001)
+    assert cache.hits == 2
+
+
+def test_wrapped_model_is_picklable(tmp_path):
+    cached = BuildCache(tmp_path).wrap(make_box)
+    cached({"width": 1.0, "height": 2.0, "hollow": False})
+    copy = pickle.loads(pickle.dumps(cached))
+    assert copy({"width": 1.0, "height": 2.0, "hollow": False}) == 2.0
+    assert copy.cache.hits == 1
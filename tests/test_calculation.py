@@ -0,0 +1,39 @@
+import pytest
+from param123d.calculation import compile_calculation, evaluate
+from param123d.parameter_base import CalculationParameter, RangeParameter
+from param123d.parameter_types import ParameterType
+
+
+def test_compile_is_cached():
+    assert compile_calculation("width * 2") is compile_calculation("width * 2")
+
+def test_compile_names():
+    compiled = compile_calculation("max(width, height) / 2 + sin(pi * angle)")
+    assert compiled.names == {'width', 'height', 'angle'}
+
+@pytest.mark.parametrize("calc", [
+    "__import__('os')",
+    "width.__class__",
+    "open('file')",
+    "[x for x in range(3)]",
+    "a = 1",
+    "lambda: 1",
+    "_hidden + 1",
+])
+def test_compile_rejects_unsafe(calc):
+    with pytest.raises(ValueError):
+        compile_calculation(calc)
+
+def test_evaluate():
+    assert evaluate("width * 2 + 1", {'width': 10}) == 21
+    assert evaluate("10 if flag else 20", {'flag': False}) == 20
+
+def test_evaluate_undefined():
+    with pytest.raises(ValueError, match="undefined parameters: height"):
+        evaluate("width * height", {'width': 10})
+
+def test_calculation_parameter_evaluate():
+    width = RangeParameter("width", 10, ParameterType.IntegerParameter, "mm")
+    area = CalculationParameter("area", 0, ParameterType.IntegerParameter, "mm", calc="width * width")
+    assert area.evaluate({'width': width}) == 100
+    assert area.is_calculation("import os") == False
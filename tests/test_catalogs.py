@@ -0,0 +1,112 @@
+import io
+import json
+import threading
+import time
+import tracemalloc
+import pytest
+from param123d import streaming
+from param123d.catalogs import CatalogRegistry, catalog, catalogs, register_catalog
+from param123d.parameters import ChoiceParameter
+
+
+@pytest.fixture
+def materials():
+    register_catalog("test_materials", {"PLA": "PLA (1.24 g/cm³)", "PETG": "PETG (1.27 g/cm³)", "ABS": "ABS (1.04 g/cm³)"})
+    yield catalog("test_materials")
+    catalogs.unregister("test_materials")
+
+
+def test_sources_load_once(tmp_path):
+    registry = CatalogRegistry()
+    (tmp_path / "threads.csv").write_text("value,label\nM3,M3 x 0.5\nM4,M4 x 0.7\n", encoding="utf-8")
+    (tmp_path / "sizes.json").write_text(json.dumps([8, 10, 12]), encoding="utf-8")
+    registry.register("threads", tmp_path / "threads.csv")
+    registry.register("sizes", str(tmp_path / "sizes.json"))
+    registry.register("fonts", lambda: ["Arial", "DejaVu Sans"])
+
+    assert not registry.is_loaded("threads")
+    assert registry.get("threads").choices == {"M3": "M3 x 0.5", "M4": "M4 x 0.7"}
+    assert registry.get("threads") is registry.get("threads")
+    assert 10 in registry.get("sizes")
+    assert len(registry.get("fonts")) == 2
+    assert registry.loads == 3
+    assert registry.names() == ["fonts", "sizes", "threads"]
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("sizes", [1])
+    with pytest.raises(ValueError, match="not registered"):
+        registry.get("missing")
+
+
+def test_invalid_sources(tmp_path):
+    registry = CatalogRegistry()
+    registry.register("mixed", ["A", 1])
+    registry.register("text", tmp_path / "catalog.txt")
+    with pytest.raises(ValueError, match="different types"):
+        registry.get("mixed")
+    with pytest.raises(ValueError, match="suffixes"):
+        registry.get("text")
+
+
+def test_loader_runs_without_the_lock():
+    registry = CatalogRegistry()
+    registry.register("sizes", [8, 10, 12])
+    # a slow loader (e.g. the font scan) must not block other catalogs
+    registry.register("boards", lambda: [size * 2 for size in registry.get("sizes").choices])
+    assert registry.get("boards").choices == [16, 20, 24]
+    assert registry.loads == 2
+
+
+def test_concurrent_first_calls_load_once():
+    registry = CatalogRegistry()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return ["M3", "M4", "M5"]
+
+    registry.register("screws", slow_loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("screws"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and registry.loads == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+
+
+def test_parameters_share_the_catalog(materials):
+    first = ChoiceParameter("material", materials, "PETG")
+    second = ChoiceParameter("support", materials)
+    assert first.value == "PETG" and second.value == "ABS"
+    assert first.catalog is materials
+    assert first.index is second.index is materials.index
+    assert first._choices is materials.choices
+    with pytest.raises(ValueError):
+        first.set_value("Wood")
+
+
+def test_memory_stays_flat():
+    register_catalog("test_parts", [f"part_{index}" for index in range(20_000)])
+    try:
+        parts = catalog("test_parts")
+        tracemalloc.start()
+        parameters = [ChoiceParameter(f"part_{index}", parts, "part_7") for index in range(1_000)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert size / len(parameters) < 2_000
+    finally:
+        catalogs.unregister("test_parts")
+
+
+def test_streaming_references_the_catalog(materials):
+    stream = io.StringIO()
+    streaming.write_jsonl([ChoiceParameter("material", materials, "PLA")], stream)
+    assert '"catalog": "test_materials"' in stream.getvalue()
+    assert "choices" not in stream.getvalue()
+
+    stream.seek(0)
+    parameter = next(streaming.read_jsonl(stream))
+    assert parameter.catalog is materials and parameter.value == "PLA"
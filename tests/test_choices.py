@@ -0,0 +1,54 @@
+import pytest
+from param123d.catalogs import Catalog
+from param123d.choices import ChoiceIndex
+from param123d.parameters import ChoiceParameter
+
+SCREWS = [f"M{size}x{length}" for size in (2, 3, 4, 5, 6, 8) for length in range(4, 100, 2)]
+
+
+def test_index_lookups():
+    index = ChoiceIndex({15: "15 mm", 18: "18 mm", 12: "12 mm"})
+    assert index.valid
+    assert 18 in index and 20 not in index and [1] not in index
+    assert index.sorted_keys == (12, 15, 18)
+    assert index.label(18) == "18 mm"
+    assert index.value_of("12 mm") == 12
+    with pytest.raises(ValueError):
+        index.value_of("20 mm")
+
+
+def test_index_validity():
+    assert not ChoiceIndex(["A", 1]).valid
+    assert not ChoiceIndex([]).valid
+    assert not ChoiceIndex("ABC").valid
+    assert not ChoiceIndex([["A"], ["B"]]).valid
+
+
+def test_search():
+    index = ChoiceIndex(SCREWS)
+    assert index.search("m3x1", limit=3) == ["M3x10", "M3x12", "M3x14"]
+    assert index.search("x98") == ["M2x98", "M3x98", "M4x98", "M5x98", "M6x98", "M8x98"]
+    assert len(index.search("", limit=10)) == 10
+    assert index.options(["M3x10", "unknown"]) == {"M3x10": "M3x10"}
+
+
+def test_index_is_owned():
+    choices = list(SCREWS)
+    first = ChoiceParameter("screw", choices, "M4x20")
+    choices.append("M10x20")    # a later list is indexed on its own, not by a stale shared index
+    second = ChoiceParameter("other_screw", choices)
+    assert first.index is not second.index
+    assert "M10x20" in second.index and "M10x20" not in first.index
+    assert second.value == "M2x4"
+
+    screws = Catalog("screws", SCREWS)
+    assert ChoiceParameter("screw", screws).index is ChoiceParameter("other_screw", screws).index is screws.index
+
+
+def test_choice_parameter_membership():
+    parameter = ChoiceParameter("size", {15: "15 mm", 18: "18 mm", 12: "12 mm"}, 99)
+    assert parameter.value == 12
+    parameter.set_value(18)
+    with pytest.raises(ValueError):
+        parameter.set_value(20)
+    assert ChoiceParameter("g", ["A", 1]).choices == ["A", "B", "C"]
@@ -0,0 +1,66 @@
+import pytest
+from param123d.catalogs import Catalog
+from param123d.compact import CompactParameter, ParameterSpec, compact
+from param123d.parameter_base import RangeParameter
+from param123d.parameter_types import ParameterType
+from param123d.parameters import ChoiceParameter
+
+
+def width(value=10, name="width"):
+    return RangeParameter(name, value, ParameterType.IntegerParameter, "mm", help="The width", min_value=0, max_value=100, step_value=1)
+
+
+def test_specs_are_interned():
+    first, second = compact([width(10), width(20)])
+    assert first.spec is second.spec
+    assert first.value == 10
+    assert second.value == 20
+    choices = ["A", "B"]
+    assert ParameterSpec.of(ChoiceParameter("g", choices, "A")) is ParameterSpec.of(ChoiceParameter("g", choices, "A"))
+
+def test_names_are_not_part_of_the_spec():
+    first, second = compact([width(10, "width"), width(20, "depth")])
+    assert first.spec is second.spec
+    assert (first.name, second.name) == ("width", "depth")
+    assert second.to_parameter().name == "depth"
+
+def test_choice_keys():
+    materials = Catalog("materials", [f"material {index}" for index in range(20_000)])
+    parameters = compact(ChoiceParameter(f"part_{index}", materials, "material 7") for index in range(100))
+    assert all(parameter.spec is parameters[0].spec for parameter in parameters)
+
+    # plain choices are keyed by their content, a changed list gets its own spec
+    choices = ["A", "B"]
+    spec = ParameterSpec.of(ChoiceParameter("g", choices, "A"))
+    assert ParameterSpec.of(ChoiceParameter("h", ["A", "B"], "A")) is spec
+    choices.append("C")
+    assert spec.create("g", "A")._choices == ["A", "B"]
+
+    parameter = CompactParameter.from_parameter(ChoiceParameter("g", choices, "A"))
+    assert parameter.spec is not spec
+    parameter.set_value("C")
+    assert parameter.to_parameter().choices == ["A", "B", "C"]
+
+def test_spec_metadata():
+    spec = ParameterSpec.of(width())
+    assert (spec.param_type, spec.unit, spec.help) == (ParameterType.IntegerParameter, "mm", "The width")
+    assert (spec.min_value, spec.max_value, spec.step_value) == (0, 100, 1)
+    assert spec.kind is RangeParameter
+
+def test_compact_is_slotted():
+    parameter = CompactParameter.from_parameter(width())
+    assert not hasattr(parameter, '__dict__')
+
+def test_set_value_validates():
+    parameter = CompactParameter.from_parameter(width())
+    parameter.set_value(42)
+    assert parameter.value == 42
+    with pytest.raises(ValueError):
+        parameter.set_value("42")
+
+def test_to_parameter():
+    parameter = CompactParameter(ParameterSpec.of(width()), "width", 33).to_parameter()
+    assert isinstance(parameter, RangeParameter)
+    assert parameter.name == "width"
+    assert parameter.value == 33
+    assert parameter.max_value == 100
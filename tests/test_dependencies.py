@@ -0,0 +1,73 @@
+import pytest
+from param123d.dependencies import DependencyGraph
+from param123d.parameter_base import CalculationParameter, RangeParameter
+from param123d.parameter_types import ParameterType
+
+
+def float_range(name, value):
+    return RangeParameter(name, value, ParameterType.FloatParameter, "mm")
+
+def calculation(name, calc):
+    return CalculationParameter(name, 0.0, ParameterType.FloatParameter, "mm", calc=calc)
+
+
+@pytest.fixture
+def graph():
+    return DependencyGraph([
+        float_range("width", 10.0),
+        float_range("height", 5.0),
+        calculation("volume", "area * depth"),
+        calculation("area", "width * height"),
+        calculation("depth", "height / 2"),
+        calculation("margin", "width + 1"),
+    ])
+
+
+def test_order(graph):
+    order = graph.order
+    assert order.index("area") < order.index("volume")
+    assert order.index("depth") < order.index("volume")
+
+def test_downstream(graph):
+    assert set(graph.downstream("width")) == {"area", "volume", "margin"}
+    assert graph.downstream("height")[-1] == "volume"
+    assert graph.downstream("margin") == ()
+
+def test_update_recomputes_only_downstream(graph):
+    graph.recompute()
+    results = graph.set_value("height", 2.0)
+    assert set(results) == {"area", "depth", "volume"}
+    assert graph["volume"].value == 20.0
+    assert graph["margin"].value == 11.0
+
+def test_cycle():
+    with pytest.raises(ValueError, match="cycle"):
+        DependencyGraph([calculation("a", "b + 1"), calculation("b", "a + 1")])
+
+def test_undefined_name():
+    with pytest.raises(ValueError, match="undefined parameters: n"):
+        DependencyGraph([calculation("a", "n / 360")])
+    
+    graph = DependencyGraph([calculation("a", "n / 360")], constants={'n': 720})
+    assert graph.recompute() == {'a': 2.0}
+
+def test_failed_update_changes_nothing(graph):
+    graph.recompute()
+    with pytest.raises(ValueError):
+        graph.update({"width": 3.0, "height": "bad"})
+    assert (graph["width"].value, graph["area"].value) == (10.0, 50.0)
+
+    count = RangeParameter("count", 4, ParameterType.IntegerParameter, "pcs")
+    half = CalculationParameter("half", 2, ParameterType.IntegerParameter, "pcs", calc="count // 2 if count % 2 == 0 else count / 2")
+    graph = DependencyGraph([count, half])
+    graph.update({"count": 6})
+    with pytest.raises(ValueError):
+        graph.update({"count": 5})     # 2.5 is not an integer
+    assert (count.value, half.value) == (6, 3)
+
+def test_evaluate_changes_nothing(graph):
+    graph.recompute()
+    assert graph.evaluate({"height": 2.0}) == {"area": 20.0, "depth": 1.0, "volume": 20.0}
+    assert (graph["height"].value, graph["volume"].value) == (5.0, 125.0)
+    with pytest.raises(ValueError):
+        graph.evaluate({"depth": "bad"})
@@ -0,0 +1,66 @@
+import pytest
+from param123d.dependencies import DependencyGraph
+from param123d.explore import Exploration, cartesian_product, explore, latin_hypercube, parameter_levels
+from param123d.parameter_base import CalculationParameter, RangeParameter
+from param123d.parameter_types import ParameterType
+from param123d.parameters import BooleanParameter, ChoiceParameter
+
+
+def volume(values):
+    if values["material"] == "C":
+        raise ValueError("unsupported material")
+    return values["width"] * values["height"]
+
+
+@pytest.fixture
+def parameters():
+    return [
+        RangeParameter("width", 1, ParameterType.IntegerParameter, "mm", min_value=1, max_value=3, step_value=1),
+        RangeParameter("height", 1.0, ParameterType.FloatParameter, "mm", min_value=0.5, max_value=1.5, step_value=0.5),
+        ChoiceParameter("material", ["A", "B", "C"], "A"),
+    ]
+
+
+def test_parameter_levels(parameters):
+    assert parameter_levels(parameters[0]) == (1, 2, 3)
+    assert parameter_levels(parameters[1]) == (0.5, 1.0, 1.5)
+    assert parameter_levels(parameters[2]) == ("A", "B", "C")
+    assert parameter_levels(BooleanParameter("flag", True)) == (False, True)
+
+def test_cartesian_product(parameters):
+    variants = list(cartesian_product(parameters))
+    assert len(variants) == 27
+    assert variants[0] == {"width": 1, "height": 0.5, "material": "A"}
+
+def test_latin_hypercube(parameters):
+    variants = latin_hypercube(parameters, 3, seed=1)
+    assert len(variants) == 3
+    assert sorted(variant["width"] for variant in variants) == [1, 2, 3]
+    assert latin_hypercube(parameters, 3, seed=1) == variants
+
+def test_explore(parameters):
+    results = explore(volume, cartesian_product(parameters), max_workers=2, chunksize=4)
+    assert [result.index for result in results] == list(range(27))
+    for result in results:
+        if result.values["material"] == "C":
+            assert isinstance(result.error, ValueError)
+        else:
+            assert result.result == result.values["width"] * result.values["height"]
+
+def test_explore_with_graph(parameters):
+    graph = DependencyGraph(parameters + [CalculationParameter("area", 0.0, ParameterType.FloatParameter, "mm", calc="width * height")])
+    calls = []
+    graph["area"].subscribe(calls.append, weak=False)
+    results = explore(dict, [{"width": 2, "height": 1.5}, {"width": 3, "height": 0.5}], max_workers=1, graph=graph)
+    assert [result.result["area"] for result in results] == [3.0, 1.5]
+    # the variants are evaluated on plain values, the parameters keep their values
+    assert graph.values()["width"] == 1 and graph["area"].value == 0.0 and calls == []
+
+def test_cancel(parameters):
+    with Exploration(volume, cartesian_product(parameters), max_workers=1) as exploration:
+        received = []
+        for result in exploration:
+            received.append(result)
+            exploration.cancel()
+    assert len(received) == 1
+    assert exploration.cancelled
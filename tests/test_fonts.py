@@ -0,0 +1,89 @@
+import os
+import struct
+import pytest
+from param123d import fonts
+from param123d.fonts import FontScanner, FontValidation, read_font_families, set_font_validation
+from param123d.parameters import FontParameter
+
+
+def name_table(*families):
+    records, strings = b"", b""
+    for family in families:
+        data = family.encode("utf-16-be")
+        records += struct.pack(">HHHHHH", 3, 1, 0x409, 1, len(data), len(strings))
+        strings += data
+    # a Macintosh record with another name that is only used when there is no Windows name
+    records += struct.pack(">HHHHHH", 1, 0, 0, 1, 3, len(strings))
+    strings += b"Mac"
+    count = len(families) + 1
+    return struct.pack(">HHH", 0, count, 6 + 12 * count) + records + strings
+
+
+def sfnt(offset, *families):
+    table = name_table(*families)
+    header = struct.pack(">4sHHHH", b"\x00\x01\x00\x00", 1, 0, 0, 0)
+    record = struct.pack(">4sIII", b"name", 0, offset + 12 + 16, len(table))
+    return header + record + table
+
+
+def make_font(path, family):
+    path.write_bytes(sfnt(0, family))
+    return path
+
+
+def make_collection(path, *families):
+    data = b"ttcf" + struct.pack(">II", 0x00010000, len(families))
+    offset = len(data) + 4 * len(families)
+    fonts, offsets = b"", []
+    for family in families:
+        offsets.append(offset + len(fonts))
+        fonts += sfnt(offset + len(fonts), family)
+    path.write_bytes(data + struct.pack(f">{len(families)}I", *offsets) + fonts)
+    return path
+
+
+def test_read_font_families(tmp_path):
+    assert read_font_families(make_font(tmp_path / "a.ttf", "Open Sans")) == {"Open Sans"}
+    assert read_font_families(make_collection(tmp_path / "b.ttc", "Noto Sans", "Noto Serif")) == {"Noto Sans", "Noto Serif"}
+    (tmp_path / "c.ttf").write_bytes(b"not a font")
+    with pytest.raises(ValueError):
+        read_font_families(tmp_path / "c.ttf")
+
+
+def test_scan_is_cached_by_directory_mtime(tmp_path):
+    folder = tmp_path / "fonts"
+    (folder / "sans").mkdir(parents=True)
+    make_font(folder / "sans" / "open.ttf", "Open Sans")
+    make_font(folder / "serif.otf", "Liberation Serif")
+    (folder / "broken.ttf").write_bytes(b"broken")
+    cache_file = tmp_path / "cache" / "fonts.json"
+
+    first = FontScanner([folder], cache_file).start()
+    assert first.names() == ["Liberation Serif", "Open Sans"]
+    assert first.parsed_files == 2
+    assert first.is_installed("open sans") and not first.is_installed("Comic Sans")
+
+    second = FontScanner([folder], cache_file)
+    assert second.names() == first.names()
+    assert second.parsed_files == 0
+
+    make_font(folder / "sans" / "noto.ttf", "Noto Sans")
+    stat = os.stat(folder / "sans")
+    os.utime(folder / "sans", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = FontScanner([folder], cache_file)
+    assert "Noto Sans" in third.names()
+    assert third.parsed_files == 1
+
+
+def test_strict_validation(tmp_path, monkeypatch):
+    scanner = FontScanner([make_font(tmp_path / "open.ttf", "Open Sans").parent])
+    monkeypatch.setattr(fonts, "font_scanner", scanner)
+    assert FontParameter("title", "Comic Sans").value == "Comic Sans"
+
+    try:
+        set_font_validation(FontValidation.STRICT)
+        assert FontParameter("title", "Open Sans").value == "Open Sans"
+        with pytest.raises(ValueError):
+            FontParameter("title", "Comic Sans")
+    finally:
+        set_font_validation(FontValidation.LENIENT)
@@ -0,0 +1,77 @@
+import os
+import pytest
+from param123d import help_cache
+from param123d.help_cache import HelpCache, help_text, render_help
+from param123d.parameter_base import HelpType, detect_help_type
+from param123d.parameters import BooleanParameter, IntegerParameter, StringParameter
+
+
+def test_detect_help_type():
+    assert detect_help_type(None) == HelpType.SIMPLE
+    assert detect_help_type("# Title") == HelpType.MARKDOWN
+    assert detect_help_type(".. note:: text") == HelpType.RESTRUCTURED_TEXT
+    assert detect_help_type("plain text") == HelpType.SIMPLE
+
+
+def test_render_memoized():
+    cache = HelpCache()
+    html = cache.render("# Title\n\nSome *text*.")
+    assert "<h1>Title</h1>" in html
+    assert cache.render("# Title\n\nSome *text*.") is html
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    rst = cache.render(".. note:: A note.")
+    assert "note" in rst
+    assert cache.misses == 2
+
+
+def test_render_simple_rejected():
+    with pytest.raises(ValueError):
+        render_help("plain text", HelpType.SIMPLE)
+
+
+def test_disk_cache(tmp_path):
+    html = HelpCache(directory=tmp_path).render("- item")
+    assert len(list(tmp_path.glob("*.html"))) == 1
+
+    cache = HelpCache(directory=tmp_path)
+    assert cache.render("- item") == html
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+
+
+def test_lru_bound_and_warm():
+    cache = HelpCache(max_entries=2)
+    parameters = [BooleanParameter(f"flag_{index}", True, help=f"# Flag {index}") for index in range(3)]
+    parameters.append(StringParameter("plain", "text", help="plain help"))
+    assert cache.warm(parameters) == 3
+    assert len(cache) == 2
+
+
+def test_warm_renders_the_ui_help():
+    cache = HelpCache()
+    flag = BooleanParameter("flag", True, help="plain help")
+    count = IntegerParameter("count", 20, min_value=10, max_value=100, step_value=10, help="An *integer*")
+    assert cache.warm([flag, count]) == 2
+    # the user interface renders boolean help as markdown and adds the bounds of integers
+    assert help_text(count) == ("An *integer*\n- Min: 10,\n- Max: 100", HelpType.MARKDOWN)
+    for parameter in (flag, count):
+        cache.render(*help_text(parameter))
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_renderer_version_is_part_of_the_key(monkeypatch):
+    key = HelpCache.key("- item", HelpType.MARKDOWN)
+    monkeypatch.setattr(help_cache, "renderer_version", lambda help_type: "markdown2 99.0")
+    assert HelpCache.key("- item", HelpType.MARKDOWN) != key
+
+
+def test_disk_cache_is_bounded(tmp_path):
+    cache = HelpCache(directory=tmp_path, max_disk_bytes=200)
+    for index in range(10):
+        cache.render(f"- item {index}")
+        os.utime(tmp_path / f"{cache.key(f'- item {index}', HelpType.MARKDOWN)}.html", (index, index))
+    files = list(tmp_path.glob("*.html"))
+    assert 0 < len(files) < 10 and sum(path.stat().st_size for path in files) <= 200
+    # the least recently used files are removed first
+    assert (tmp_path / f"{cache.key('- item 9', HelpType.MARKDOWN)}.html").exists()
+    assert not (tmp_path / f"{cache.key('- item 0', HelpType.MARKDOWN)}.html").exists()
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_import_does_not_load_nicegui():
+    code = "import sys, param123d, param123d.parameters; print('nicegui' in sys.modules)"
+    process = subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parents[1], capture_output=True, text=True, check=True)
+    assert process.stdout.strip() == 'False'
+
+def test_create_ui_dispatch():
+    from param123d import ui
+    from param123d.parameters import BooleanParameter, FloatParameter, IntegerParameter
+    from param123d.parameter_base import BaseParameter
+    
+    assert ui.create_ui.dispatch(IntegerParameter) is ui.create_integer_ui
+    assert ui.create_ui.dispatch(FloatParameter) is ui.create_range_ui
+    assert ui.create_ui.dispatch(BooleanParameter) is ui.create_boolean_ui
+    assert ui.create_ui.dispatch(BaseParameter) is ui.create_ui.dispatch(object)
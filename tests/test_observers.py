@@ -0,0 +1,97 @@
+import gc
+from param123d.observers import ChangeEvent, batch
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameters import BooleanParameter, FloatParameter, IntegerParameter
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, argument):
+        self.calls.append(argument)
+
+    def on_change(self, argument):
+        self.calls.append(argument)
+
+
+def box():
+    with ParameterGroup("box") as group:
+        IntegerParameter("count", 2, max_value=10)
+        FloatParameter("width", 1.0)
+        BooleanParameter("hollow", False)
+    return group
+
+
+def test_parameter_listener():
+    group = box()
+    recorder = Recorder()
+    unsubscribe = group.count.subscribe(recorder)
+
+    group.count.value = 3
+    group.count.set_value(3)    # unchanged values are not delivered
+    assert recorder.calls == [ChangeEvent(group.count, 2, 3)]
+    assert recorder.calls[0].name == "count"
+
+    unsubscribe()
+    group.count.value = 4
+    assert len(recorder.calls) == 1
+
+
+def test_group_listener():
+    group = box()
+    recorder = Recorder()
+    group.subscribe(recorder.on_change)
+
+    group.width.value = 2.0
+    assert recorder.calls == [[ChangeEvent(group.width, 1.0, 2.0)]]
+
+
+def test_listeners_are_weak():
+    group = box()
+    recorder = Recorder()
+    group.subscribe(recorder.on_change)
+    group.count.subscribe(recorder)
+    group.hollow.subscribe(lambda event: None)                    # dropped right away
+    calls = []
+    group.hollow.subscribe(lambda event: calls.append(event), weak=False)
+
+    del recorder
+    gc.collect()
+    group.count.value = 5
+    group.hollow.value = True
+    assert len(group._observers) == 0 and len(group.count._observers) == 0
+    assert len(calls) == 1
+
+
+def test_batch_notifies_once():
+    group = box()
+    group_recorder, count_recorder = Recorder(), Recorder()
+    group.subscribe(group_recorder)
+    group.count.subscribe(count_recorder)
+
+    with batch():
+        group.count.value = 3
+        with batch():
+            group.count.value = 4
+        group.width.value = 5.0
+        group.hollow.value = True
+        group.hollow.value = False       # reverted, not delivered
+        assert group_recorder.calls == []
+
+    assert count_recorder.calls == [ChangeEvent(group.count, 2, 4)]
+    assert group_recorder.calls == [[ChangeEvent(group.count, 2, 4), ChangeEvent(group.width, 1.0, 5.0)]]
+
+
+def test_failing_listener_does_not_stop_others(caplog):
+    group = box()
+    recorder = Recorder()
+
+    def broken(event):
+        raise RuntimeError("closed")
+
+    group.count.subscribe(broken)
+    group.count.subscribe(recorder)
+    group.count.value = 7
+    assert len(recorder.calls) == 1
+    assert "failed" in caplog.text
@@ -0,0 +1,131 @@
+import json
+import threading
+import pytest
+from nicegui import ui
+from nicegui.client import Client
+from nicegui.page import page
+from param123d import catalogs, fonts, ui as parameter_ui
+from param123d.catalogs import CatalogRegistry
+from param123d.fonts import FontScanner
+from param123d.help_cache import HelpCache
+from param123d.panel import ParameterPanel, visible_rows
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameters import ChoiceParameter, FontParameter, IntegerParameter
+from param123d.ui import create_ui, search_options
+from param123d.updates import UpdateBatcher
+
+
+class GatedScanner(FontScanner):
+    """A font scanner whose scan waits until `proceed` is set."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.proceed = threading.Event()
+
+    def scan(self):
+        self.proceed.wait(5)
+        return super().scan()
+
+
+@pytest.fixture(autouse=True)
+def help_cache(tmp_path, monkeypatch):
+    # rendered help is cached in the temporary folder instead of the user's cache folder
+    cache = HelpCache(directory=tmp_path / "help")
+    monkeypatch.setattr(parameter_ui, "help_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def font_scanner(tmp_path, monkeypatch):
+    # the panel starts the shared font scan, the tests scan an empty folder instead of the system fonts
+    cache_file = tmp_path / "fonts.json"
+    cache_file.write_text(json.dumps({'version': 1, 'directories': {str(tmp_path): {'mtime_ns': 0, 'files': {'open.ttf': ['Open Sans']}, 'directories': []}}}))
+    scanner = GatedScanner([], cache_file)
+    monkeypatch.setattr(fonts, "font_scanner", scanner)
+    registry = CatalogRegistry()
+    registry.register('fonts', fonts.font_names)
+    monkeypatch.setattr(catalogs, "catalogs", registry)
+    yield scanner
+    scanner.proceed.set()
+
+
+def test_visible_rows():
+    assert visible_rows(0, 480, 48, 500, overscan=2) == range(0, 13)
+    assert visible_rows(4800, 480, 48, 500, overscan=2) == range(98, 113)
+    assert visible_rows(23_900, 480, 48, 500, overscan=2) == range(495, 500)
+    assert visible_rows(0, 480, 48, 3) == range(0, 3)
+
+def test_panel_renders_lazily():
+    with ParameterGroup('Box') as group:
+        for index in range(500):
+            IntegerParameter(f"p_{index}", 20, min_value=10, max_value=100, step_value=10, help='An **integer** parameter')
+    
+    with Client(page('/'), request=None):
+        panel = ParameterPanel([group], row_height=48, viewport_height=480, overscan=2)
+        panel.render()
+        collapsed = panel.element_count
+        
+        expansion = next(element for element in panel._root.descendants() if isinstance(element, ui.expansion))
+        expansion.set_value(True)
+        expanded = panel.element_count
+        
+        panel.show_help(group.p_0)
+        assert panel.element_count > expanded
+    
+    assert collapsed == 2
+    assert expanded < 100
+    assert panel.render_time > 0
+
+def test_create_ui_pushes_to_batcher():
+    with ParameterGroup('Box') as group:
+        IntegerParameter("count", 20, min_value=10, max_value=100, step_value=10)
+    
+    batcher = UpdateBatcher()
+    with Client(page('/'), request=None):
+        label, element, help = create_ui(group.count, with_help=False, batcher=batcher)
+        element.set_value(30)
+        element.set_value(40)
+    
+    assert help is None
+    assert batcher.pending == {(group, "count"): 40}
+
+def test_help_is_rendered_by_the_cache(help_cache):
+    parameter = IntegerParameter("count", 20, min_value=10, max_value=100, step_value=10, help='An **integer** parameter')
+    
+    with Client(page('/'), request=None):
+        label, element, help = create_ui(parameter)
+    
+    assert help_cache.misses == 1
+    assert len(list(help_cache.directory.glob("*.html"))) == 1
+
+def test_large_choice_select_searches_on_server():
+    parameter = ChoiceParameter("screw", [f"M{size}x{length}" for size in range(2, 30) for length in range(4, 200, 2)], "M12x40")
+    
+    with Client(page('/'), request=None):
+        label, element, help = create_ui(parameter, with_help=False)
+        assert len(element.options) <= 51
+        assert element.value == "M12x40"
+        
+        listeners = [listener for listener in element._event_listeners.values() if listener.type == 'inputValue']
+        assert len(listeners) == 1
+        element.set_options(search_options(parameter.index, "m7x1", element.value))
+    
+    assert list(element.options)[:3] == ["M7x10", "M7x12", "M7x14"]
+    assert "M12x40" in element.options
+    assert element.value == "M12x40"
+
+def test_font_ui_does_not_wait_for_the_scan(font_scanner):
+    parameter = FontParameter("title", "Open Sans")
+
+    with Client(page('/'), request=None):
+        ParameterPanel([])
+        assert not font_scanner.ready
+        label, element, help = create_ui(parameter, with_help=False)
+        assert isinstance(element, ui.input)
+        assert element.props['_autocomplete'] == ['Open Sans']
+
+        font_scanner.proceed.set()
+        font_scanner.wait(5)
+        label, element, help = create_ui(parameter, with_help=False)
+        # the scan found no fonts: the default font is the only choice and the title stays editable as text
+        assert isinstance(element, ui.input) and catalogs.catalog('fonts').choices == [fonts.DEFAULT_FONT]
@@ -19,3 +19,8 @@ def test_invalid_parameter_name():
 def test_invalid_parameter_value_type():
     with pytest.raises(ValueError, match="Parameter value 'invalid' is not a valid value for type 'ParameterType.FloatParameter'."):
         BaseParameter(name="valid_name", value="invalid", param_type=ParameterType.FloatParameter)
+
+@pytest.mark.parametrize("name", ["class", "None", "1abc", "a-b", "", "ﬁle"])
+def test_invalid_parameter_names(name):
+    with pytest.raises(ValueError, match="is not a valid Python identifier"):
+        BaseParameter(name=name, value=10.0, param_type=ParameterType.FloatParameter)
@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from param123d.parameter_base import BaseParameter, RangeParameter, CalculationParameter, HelpType
+from param123d import parameter_base
+from param123d.parameter_base import BaseParameter, RangeParameter, CalculationParameter, HelpType, register_validator, type_validator
 from param123d.parameter_types import ParameterType
 
 # FILE: test_parameter_base.py
@@ -101,5 +102,24 @@ def test_is_path_invalid(valid_file_path):
     param = BaseParameter(name="param8", value=valid_file_path, param_type=ParameterType.FileNameParameter)
     assert param.is_path("invalid:path") == False
 
+def test_register_validator():
+    assert type_validator(ParameterType.AxisParameter) is None
+    
+    @register_validator(ParameterType.AxisParameter)
+    def validate_axis(parameter, value):
+        return value in ("X", "Y", "Z")
+    
+    try:
+        param = BaseParameter("test_axis", "X", ParameterType.AxisParameter)
+        assert param.is_valid_type("Z") == True
+        assert param.is_valid_type("W") == False
+        
+        with pytest.raises(ValueError, match="already registered"):
+            register_validator(ParameterType.AxisParameter, validate_axis)
+        register_validator(ParameterType.AxisParameter, lambda parameter, value: value == "X", replace=True)
+        assert param.is_valid_type("Z") == False
+    finally:
+        del parameter_base._type_validators[ParameterType.AxisParameter]
+
 if __name__ == '__main__':
     pytest.main()
\ No newline at end of file
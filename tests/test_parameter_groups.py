@@ -0,0 +1,66 @@
+import pytest
+from param123d.parameter_base import BaseParameter, RangeParameter
+from param123d.parameter_groups import ParameterGroup, CaptureMode
+from param123d.parameter_types import ParameterType
+
+
+def test_frame_capture_is_lazy():
+    with ParameterGroup() as group:
+        line_number = group.context.line_number
+    
+    assert group.capture == CaptureMode.FRAME
+    assert group.context.file_name == __file__
+    assert group.context.code_context is None
+    assert line_number == test_frame_capture_is_lazy.__code__.co_firstlineno + 1
+
+def test_frame_capture_loads_source_on_str():
+    with ParameterGroup() as group:
+        pass
+    
+    assert "with ParameterGroup() as group:" in str(group.context)
+    assert group.context.code_context is not None
+
+def test_stack_capture():
+    with ParameterGroup(capture=CaptureMode.STACK) as group:
+        pass
+    
+    assert group.context.file_name == __file__
+    assert "ParameterGroup" in group.context.extract_code_context()
+
+def test_invalid_capture_mode():
+    with pytest.raises(ValueError, match="is not a valid capture mode"):
+        ParameterGroup(capture="frame")
+
+def test_parameters_are_added_to_group():
+    with ParameterGroup('Box') as outer:
+        width = BaseParameter("width", 10, ParameterType.IntegerParameter)
+        with ParameterGroup('Lid') as inner:
+            height = BaseParameter("height", 2, ParameterType.IntegerParameter)
+    
+    outside = BaseParameter("depth", 1, ParameterType.IntegerParameter)
+    assert list(outer) == [width]
+    assert list(inner) == [height]
+    assert outer.width is width
+    assert outer['width'] is width
+    assert inner('height') is height
+    assert "depth" not in outer
+
+def test_duplicate_names_in_group():
+    with ParameterGroup('Box') as group:
+        BaseParameter("width", 10, ParameterType.IntegerParameter)
+        with pytest.raises(ValueError, match="already used in group 'Box'"):
+            BaseParameter("width", 20, ParameterType.IntegerParameter)
+    assert len(group) == 1
+
+def test_failed_parameter_is_not_added():
+    with ParameterGroup('Box') as group:
+        with pytest.raises(ValueError):
+            RangeParameter("width", 5.0, ParameterType.FloatParameter, "mm", min_value=10.0, max_value=2.0)
+        width = RangeParameter("width", 15.0, ParameterType.FloatParameter, "mm", min_value=10.0, max_value=20.0)
+    assert list(group) == [width]
+    assert repr(group.width)
+
+def test_missing_parameter():
+    group = ParameterGroup('Box')
+    with pytest.raises(AttributeError):
+        group.width
@@ -0,0 +1,69 @@
+import pytest
+from pathlib import Path
+from param123d import parameter_sets
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameter_sets import ParameterSetFile, apply, load, save, snapshot
+from param123d.parameters import BooleanParameter, FloatParameter, IntegerParameter, StringParameter
+
+VALUES = {"width": 12, "depth": -3, "ratio": 0.25, "label": "Grüße", "visible": True, "hidden": False, "empty": None, "folder": Path("/tmp")}
+
+
+def test_binary_round_trip(tmp_path):
+    file_name = tmp_path / "variant.pset"
+    save(VALUES, file_name)
+
+    with load(file_name) as loaded:
+        assert isinstance(loaded, ParameterSetFile)
+        assert len(loaded) == len(VALUES)
+        assert loaded["label"] == "Grüße"
+        assert loaded["ratio"] == 0.25
+        assert loaded["visible"] is True and loaded["hidden"] is False
+        assert loaded["empty"] is None
+        assert "missing" not in loaded
+        assert list(loaded) == sorted(VALUES)
+        assert loaded.to_dict() == {**VALUES, "folder": "/tmp"}
+        with pytest.raises(KeyError):
+            loaded["missing"]
+
+
+def test_binary_empty_and_invalid(tmp_path):
+    save({}, tmp_path / "empty.pset")
+    with load(tmp_path / "empty.pset") as loaded:
+        assert dict(loaded) == {}
+
+    (tmp_path / "broken.pset").write_bytes(b"not a parameter set")
+    with pytest.raises(ValueError):
+        load(tmp_path / "broken.pset")
+    with pytest.raises(ValueError):
+        save({"values": [1, 2]}, tmp_path / "list.pset")
+    with pytest.raises(ValueError):
+        save(VALUES, tmp_path / "variant.txt")
+
+
+def test_yaml_round_trip(tmp_path):
+    pytest.importorskip("yaml")
+    file_name = tmp_path / "variant.yaml"
+    save(VALUES, file_name)
+    assert load(file_name) == {**VALUES, "folder": "/tmp"}
+
+
+def test_yaml_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(parameter_sets, "yaml", None)
+    with pytest.raises(ImportError):
+        save(VALUES, tmp_path / "variant.yaml")
+
+
+def test_group_snapshot_and_apply(tmp_path):
+    with ParameterGroup("box") as group:
+        IntegerParameter("count", 3, min_value=0, max_value=10)
+        FloatParameter("size", 1.5)
+        BooleanParameter("hollow", False)
+        StringParameter("title", "box")
+
+    save(group, tmp_path / "box.pset")
+    group.count.set_value(7)
+    group["title"].set_value("crate")
+
+    with load(tmp_path / "box.pset") as loaded:
+        apply(group, loaded)
+    assert snapshot(group) == {"count": 3, "size": 1.5, "hollow": False, "title": "box"}
@@ -0,0 +1,111 @@
+import ast
+import os
+import pytest
+from param123d import parser
+from param123d.parser import Expression, IncrementalParser, parse_file, parse_source, parse_tree
+
+MODEL = '''
+n = 42
+with ParameterGroup('Box') as pars:
+    a = IntegerParameter('a', 12, calc=n/360)
+    pars('a').help = 'A simple parameter'
+    FontParameter('Title', "font_name")
+
+    b = AngleParameter('b', 12, calc=n/360,
+        unit='degree',
+        help='The angle of the lines [a] and [b].')
+
+def main():
+    with ParameterGroup() as other:
+        c = FloatParameter(value=1.5)
+'''
+
+
+def test_parse_groups():
+    table = parse_source(MODEL)
+    assert [(group.name, group.alias) for group in table.groups] == [('Box', 'pars'), (None, 'other')]
+    assert table.groups[0].line_start == 3
+    assert table.groups[0].line_end == 10
+
+def test_parse_parameters():
+    table = parse_source(MODEL)
+    names = [(entry.group, entry.name, entry.type) for entry in table.parameters]
+    assert names == [
+        ('Box', 'a', 'IntegerParameter'),
+        ('Box', 'Title', 'FontParameter'),
+        ('Box', 'b', 'AngleParameter'),
+        ('other', 'c', 'FloatParameter'),
+    ]
+    
+    b = table.parameters[2]
+    assert b.args == ('b', 12)
+    assert b.kwarg('unit') == 'degree'
+    assert b.kwarg('calc') == Expression('n / 360')
+    assert (b.line_start, b.line_end) == (8, 10)
+
+def test_parse_cache(tmp_path):
+    parser.clear_cache()
+    file_name = tmp_path / "model.py"
+    file_name.write_text(MODEL)
+    
+    assert parse_file(file_name) is parse_file(file_name)
+    
+    file_name.write_text(MODEL.replace("12", "13"))
+    assert parse_file(file_name).parameters[0].args == ('a', 13)
+
+def test_parse_syntax_error():
+    with pytest.raises(SyntaxError):
+        parse_source("with ParameterGroup() as pars\n")
+
+def test_incremental_update():
+    model = IncrementalParser(source=MODEL)
+    
+    table = model.update(MODEL.replace("FontParameter('Title', \"font_name\")", "FontParameter('Title', \"font_name\")\n    d = BooleanParameter('d', True)"))
+    assert model.full_parses == 1
+    assert model.incremental_parses == 1
+    assert table == parse_tree(ast.parse(model.source))
+    assert table.parameters[2].name == 'd'
+    assert table.groups[1].line_start == 14
+
+def test_incremental_update_indented_block():
+    model = IncrementalParser(source=MODEL)
+    
+    table = model.update(MODEL.replace("value=1.5", "value=2.5"))
+    assert model.incremental_parses == 1
+    assert table.parameters[-1].kwarg('value') == 2.5
+    assert table == parse_tree(ast.parse(model.source))
+
+def test_incremental_update_falls_back():
+    model = IncrementalParser(source=MODEL)
+    
+    model.update(MODEL.replace("n = 42", "n = 43"))
+    model.update(MODEL.replace("ParameterGroup('Box')", "ParameterGroup('Crate')"))
+    assert model.full_parses == 3
+    assert model.table.groups[0].name == 'Crate'
+
+def test_incremental_refresh(tmp_path):
+    file_name = tmp_path / "model.py"
+    file_name.write_text(MODEL)
+    model = IncrementalParser(file_name)
+    assert model.refresh() == False
+    
+    file_name.write_text(MODEL.replace("12", "14"))
+    os.utime(file_name, ns=(0, os.stat(file_name).st_mtime_ns + 1_000_000))
+    assert model.refresh() == True
+    assert model.table.parameters[0].args == ('a', 14)
+
+def test_incremental_update_dedent():
+    parser.clear_cache()
+    source = "with ParameterGroup('Box'):\n    a = IntegerParameter('a', 1)\n    c = IntegerParameter('c', 3)\n"
+    model = IncrementalParser(source=source)
+    
+    source = source.replace("    c =", "c =")
+    table = model.update(source)
+    assert [entry.name for entry in table.parameters] == ['a', 'c']
+    assert table == parse_tree(ast.parse(source))
+    assert parse_source(source) == table
+    
+    indented = MODEL.replace("        c = FloatParameter(value=1.5)", "        c = FloatParameter(value=1.5)\n        d = FloatParameter(value=2.5)")
+    model = IncrementalParser(source=indented)
+    source = indented.replace("        d =", "d =")
+    assert model.update(source) == parse_tree(ast.parse(source))
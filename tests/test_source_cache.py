@@ -0,0 +1,82 @@
+import os
+import pytest
+from param123d.source_cache import SourceCache
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    file_name = tmp_path / "model.py"
+    file_name.write_text("a = 1\nb = 2\nc = 3\n")
+    return str(file_name)
+
+
+def test_hits_and_misses(source_file):
+    cache = SourceCache()
+    assert cache.line_count(source_file) == 3
+    assert cache.line_count(source_file) == 3
+    assert cache.get_line(source_file, 2) == "b = 2"
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+def test_invalidated_on_change(source_file):
+    cache = SourceCache()
+    assert cache.line_count(source_file) == 3
+    
+    with open(source_file, "a") as f:
+        f.write("d = 4\n")
+    stat = os.stat(source_file)
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert cache.line_count(source_file) == 4
+    assert cache.misses == 2
+
+def test_lru_eviction(tmp_path):
+    cache = SourceCache(max_files=2)
+    files = []
+    for i in range(3):
+        file_name = tmp_path / f"file_{i}.py"
+        file_name.write_text(f"x = {i}\n")
+        files.append(str(file_name))
+    
+    cache.lines(files[0])
+    cache.lines(files[1])
+    cache.lines(files[0])
+    cache.lines(files[2])
+    
+    assert len(cache) == 2
+    assert files[0] in cache
+    assert files[1] not in cache
+
+def test_missing_file(tmp_path):
+    cache = SourceCache()
+    missing = str(tmp_path / "missing.py")
+    assert cache.exists(missing) == False
+    assert cache.lines(missing) is None
+    assert cache.line_count(missing) == 0
+    assert cache.get_line(missing, 1) == ""
+
+def test_exists_does_not_read(source_file, tmp_path):
+    cache = SourceCache()
+    assert cache.exists(source_file) and cache.exists(str(tmp_path))
+    assert cache.misses == 0 and len(cache) == 0
+    assert cache.line_count(str(tmp_path), check=False) == 0
+
+def test_encoding_cookie(tmp_path):
+    file_name = tmp_path / "latin.py"
+    file_name.write_bytes("# -*- coding: latin-1 -*-\nname = 'Grüße'\n".encode("latin-1"))
+    assert SourceCache().get_line(str(file_name), 2) == "name = 'Grüße'"
+
+def test_get_lines(source_file):
+    cache = SourceCache()
+    assert cache.get_lines(source_file, 2, 3) == ["b = 2", "c = 3"]
+
+def test_code_context_stats_once(source_file, monkeypatch):
+    from param123d import source_cache
+    from param123d.code_context import CodeContext
+    
+    calls = []
+    stat = os.stat
+    monkeypatch.setattr(source_cache.os, "stat", lambda path: calls.append(path) or stat(path))
+    context = CodeContext(source_file, 2, None, None)
+    assert calls == [source_file]
+    assert context.line_counter == 3
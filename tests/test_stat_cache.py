@@ -0,0 +1,71 @@
+import pytest
+from param123d.parameter_base import BaseParameter, validate_parameters
+from param123d.parameter_types import ParameterType
+from param123d.stat_cache import StatCache, stat_cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_stat_is_cached(tmp_path):
+    cache = StatCache(ttl=10.0)
+    file_name = tmp_path / "part.step"
+    file_name.write_text("solid")
+    
+    assert cache.exists(file_name)
+    assert cache.is_file(file_name)
+    assert not cache.is_dir(file_name)
+    assert cache.is_dir(tmp_path)
+    assert cache.misses == 2
+    assert cache.hits == 2
+
+def test_ttl_expires(tmp_path):
+    clock = Clock()
+    cache = StatCache(ttl=1.0, clock=clock)
+    file_name = tmp_path / "part.step"
+    
+    assert not cache.exists(file_name)
+    file_name.write_text("solid")
+    assert not cache.exists(file_name)
+    
+    clock.now = 2.0
+    assert cache.exists(file_name)
+
+def test_prefetch(tmp_path):
+    cache = StatCache()
+    paths = [tmp_path / f"part_{index}.step" for index in range(20)]
+    for path in paths[:10]:
+        path.write_text("solid")
+    
+    cache.prefetch(paths, max_workers=4)
+    assert cache.misses == 20
+    assert sum(cache.is_file(path) for path in paths) == 10
+    assert cache.hits == 20
+
+def test_validate_parameters(tmp_path):
+    file_name = tmp_path / "part.step"
+    file_name.write_text("solid")
+    folder = tmp_path / "parts"
+    folder.mkdir()
+    parameters = [
+        BaseParameter("part", str(file_name), ParameterType.FileParameter),
+        BaseParameter("folder", str(folder), ParameterType.PathParameter),
+    ]
+    assert validate_parameters(parameters) == []
+    
+    folder.rmdir()
+    stat_cache.invalidate(folder)
+    assert validate_parameters(parameters) == [parameters[1]]
+
+def test_shared_cache_does_not_keep_misses(tmp_path):
+    file_name = tmp_path / "part.step"
+    with pytest.raises(ValueError):
+        BaseParameter("part", str(file_name), ParameterType.FileParameter)
+    
+    file_name.write_text("solid")
+    assert BaseParameter("part", str(file_name), ParameterType.FileParameter).value == str(file_name)
@@ -0,0 +1,79 @@
+import io
+import pytest
+from param123d import streaming
+from param123d.parameter_base import CalculationParameter
+from param123d.parameter_types import ParameterType
+from param123d.parameters import BooleanParameter, ChoiceParameter, FloatParameter, FontParameter, IntegerParameter, StringParameter
+
+
+def parameters():
+    yield IntegerParameter("count", 3, "pcs", help="Number of holes", min_value=0, max_value=20, step_value=1, default_value=5)
+    yield FloatParameter("width", 12.5, "mm", min_value=1.0, max_value=100.0, step_value=0.5, default_value=10.0)
+    yield BooleanParameter("hollow", True)
+    yield StringParameter("label", "Grüße, \"world\"")
+    yield ChoiceParameter("material", ["PLA", "PETG"], "PETG")
+    yield CalculationParameter("area", 25.0, ParameterType.FloatParameter, "mm^2", calc="width * 2")
+
+
+def snapshot(items):
+    return [(type(item), item.name, item.value, item.param_type) for item in items]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_round_trip(tmp_path, suffix):
+    file_name = tmp_path / f"parameters{suffix}"
+    assert streaming.write(parameters(), file_name) == 6
+
+    loaded = list(streaming.read(file_name))
+    assert snapshot(loaded) == snapshot(parameters())
+    assert loaded[0].max_value == 20 and loaded[0].unit == "pcs"
+    assert loaded[4].choices == ["PLA", "PETG"]
+    assert loaded[5].calc == "width * 2"
+
+
+def test_reader_is_lazy():
+    lines = (f'{{"name": "p_{index}", "type": "IntegerParameter", "value": {index}}}\n' for index in range(10**9))
+    reader = streaming.read_jsonl(lines)
+    assert [next(reader).value for _ in range(3)] == [0, 1, 2]
+
+
+def test_invalid_records():
+    stream = io.StringIO('{"name": "ok", "type": "FloatParameter", "value": 1.0}\n'
+                         '{"name": "bad", "type": "IntegerParameter", "value": "x"}\n'
+                         '[1, 2]\n'
+                         '{"name": "ok_2", "type": "bool", "value": false}\n')
+    with pytest.raises(ValueError, match="<jsonl>:2: Parameter value 'x'"):
+        list(streaming.read_jsonl(stream))
+
+    stream.seek(0)
+    assert [parameter.name for parameter in streaming.read_jsonl(stream, skip_invalid=True)] == ["ok", "ok_2"]
+
+
+def test_csv_conversion():
+    stream = io.StringIO("name,type,value\nflag,BooleanParameter,no\nsize,integer,4\n")
+    assert [parameter.value for parameter in streaming.read_csv(stream, skip_invalid=True)] == [4]
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="suffixes"):
+        streaming.write(parameters(), tmp_path / "parameters.txt")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_round_trip_empty_text_and_labels(tmp_path, suffix):
+    file_name = tmp_path / f"parameters{suffix}"
+    streaming.write([StringParameter("note", ""), ChoiceParameter("board", {15: "15 mm", 18: "18 mm"}, 18)], file_name)
+
+    note, board = streaming.read(file_name)
+    assert note.value == ""
+    assert board.choices == [15, 18] and board.index.label(15) == "15 mm" and board.value == 18
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl"])
+def test_round_trip_font(tmp_path, suffix):
+    file_name = tmp_path / f"parameters{suffix}"
+    streaming.write([FontParameter("title", "Open Sans", "Roboto", help="# The title font")], file_name)
+
+    title, = streaming.read(file_name)
+    assert isinstance(title, FontParameter)
+    assert (title.value, title.help, title.default_value) == ("Open Sans", "# The title font", "Roboto")
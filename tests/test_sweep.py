@@ -0,0 +1,42 @@
+import pytest
+from param123d.dependencies import DependencyGraph
+from param123d.parameter_base import CalculationParameter, RangeParameter
+from param123d.parameter_types import ParameterType
+
+np = pytest.importorskip("numpy")
+from param123d.sweep import compile_vectorized, range_values, sweep, vector_functions
+
+
+@pytest.fixture
+def graph():
+    return DependencyGraph([
+        RangeParameter("width", 10.0, ParameterType.FloatParameter, "mm", min_value=0.0, max_value=2.0, step_value=0.5),
+        RangeParameter("count", 2, ParameterType.IntegerParameter, "", min_value=1, max_value=4, step_value=1),
+        CalculationParameter("area", 0.0, ParameterType.FloatParameter, "mm", calc="width * width"),
+        CalculationParameter("total", 0.0, ParameterType.FloatParameter, "mm", calc="area * count if width > 0.5 else 0.0"),
+        CalculationParameter("limit", 0.0, ParameterType.FloatParameter, "mm", calc="max(count, 3) * 1.0"),
+    ])
+
+
+def test_range_values(graph):
+    assert range_values(graph["width"]).tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert range_values(graph["count"]).tolist() == [1, 2, 3, 4]
+
+def test_sweep_full_range(graph):
+    results = sweep(graph, {"width": None})
+    assert set(results) == {"width", "area", "total"}
+    assert results["area"].tolist() == [0.0, 0.25, 1.0, 2.25, 4.0]
+    assert results["total"].tolist() == [0.0, 0.0, 2.0, 4.5, 8.0]
+
+def test_sweep_matches_scalar_evaluation(graph):
+    width, count = np.meshgrid(np.linspace(0.0, 2.0, 7), np.arange(1, 5))
+    results = sweep(graph, {"width": width, "count": count})
+    
+    for index in np.ndindex(width.shape):
+        graph.update({"width": float(width[index]), "count": int(count[index])})
+        assert results["total"][index] == pytest.approx(graph["total"].value)
+        assert results["limit"][index] == pytest.approx(graph["limit"].value)
+
+def test_compile_vectorized_chained_compare():
+    code = compile_vectorized("1 < x < 3")
+    assert eval(code, vector_functions(), {"x": np.arange(5)}).tolist() == [False, False, True, False, False]
@@ -0,0 +1,95 @@
+import pytest
+from param123d.parameter_groups import ParameterGroup
+from param123d.parameter_sets import apply
+from param123d.parameters import BooleanParameter, FloatParameter, IntegerParameter
+from param123d.transactions import Journal, JournalEntry
+
+
+def box():
+    with ParameterGroup("box") as group:
+        IntegerParameter("count", 2, max_value=10)
+        FloatParameter("width", 1.0)
+        BooleanParameter("hollow", False)
+    return group
+
+
+def values(group):
+    return {parameter.name: parameter.value for parameter in group}
+
+
+def test_transaction_applies_on_exit():
+    group = box()
+    calls = []
+    group.subscribe(calls.append, weak=False)
+
+    with group.transaction("resize") as changes:
+        changes["count"] = 4
+        changes["width"] = 2.5
+        changes["hollow"] = False   # unchanged values are not recorded
+        assert group.count.value == 2
+
+    assert values(group) == {"count": 4, "width": 2.5, "hollow": False}
+    assert len(calls) == 1 and [event.name for event in calls[0]] == ["count", "width"]
+    assert changes.entry == JournalEntry("resize", ("count", "width"), (2, 1.0), (4, 2.5))
+
+
+def test_invalid_values_change_nothing():
+    group = box()
+    calls = []
+    group.subscribe(calls.append, weak=False)
+
+    with pytest.raises(ValueError) as error:
+        group.apply({"count": 5, "width": "wide", "depth": 3})
+    assert "'width'" in str(error.value) and "'depth'" in str(error.value)
+    assert values(group) == {"count": 2, "width": 1.0, "hollow": False}
+    assert calls == [] and not group.journal.can_undo
+
+
+def test_exception_in_block_discards_changes():
+    group = box()
+    with pytest.raises(RuntimeError):
+        with group.transaction() as changes:
+            changes["count"] = 5
+            raise RuntimeError("abort")
+    assert group.count.value == 2
+    assert not group.journal.can_undo
+
+
+def test_undo_redo():
+    group = box()
+    group.apply({"count": 3})
+    group.apply({"count": 4, "hollow": True})
+
+    assert group.undo().new == (4, True)
+    assert values(group) == {"count": 3, "width": 1.0, "hollow": False}
+    assert group.undo() is not None and group.count.value == 2
+    assert group.undo() is None
+
+    group.redo()
+    assert group.count.value == 3
+    group.apply({"width": 2.0})     # a new change clears the redo stack
+    assert not group.journal.can_redo and group.redo() is None
+
+
+def test_journal_is_bounded():
+    group = box()
+    group._journal = Journal(max_entries=2)
+    for count in range(3, 7):
+        group.apply({"count": count})
+    assert [entry.new for entry in group.journal.entries] == [(5,), (6,)]
+    with pytest.raises(ValueError):
+        Journal(0)
+
+
+def test_parameter_set_apply_uses_one_transaction():
+    group = box()
+    calls = []
+    group.subscribe(calls.append, weak=False)
+
+    apply(group, {"count": 7, "width": 3.0, "unknown": 1})
+    assert values(group) == {"count": 7, "width": 3.0, "hollow": False}
+    assert len(calls) == 1 and len(group.journal.entries) == 1
+
+    with pytest.raises(ValueError):
+        apply(group, {"count": 8, "hollow": "yes"})
+    assert group.count.value == 7
@@ -0,0 +1,56 @@
+import pytest
+from param123d import units
+from param123d.parameter_base import CalculationParameter, RangeParameter
+from param123d.parameter_types import ParameterType
+from param123d.parameters import FloatParameter, IntegerParameter, StringParameter
+
+pint = pytest.importorskip("pint")
+
+
+def test_registry_is_shared():
+    assert units.registry() is units.registry()
+    assert units.preload() is None
+
+
+def test_is_unit():
+    assert units.is_unit("mm")
+    assert units.is_unit("mm^2")
+    assert units.is_unit("m/s")
+    assert not units.is_unit("furlongs_per_fortnite")
+    assert not units.is_unit("mm**")
+    assert not units.is_unit(None)
+
+
+def test_parameters_validate_units():
+    RangeParameter("length", 10, ParameterType.IntegerParameter, "mm")
+    CalculationParameter("area", 1.0, ParameterType.FloatParameter, "mm^2", calc="length * length")
+    with pytest.raises(ValueError, match="is not a valid unit"):
+        RangeParameter("length", 10, ParameterType.IntegerParameter, "foo")
+    with pytest.raises(ValueError, match="is not a valid unit"):
+        CalculationParameter("area", 1.0, ParameterType.FloatParameter, "foo^2")
+
+
+def test_conversion_factor():
+    assert units.conversion_factor("inch", "mm") == pytest.approx(25.4)
+    assert units.convert(50.8, "mm", "inch") == pytest.approx(2.0)
+    assert units.conversion_factor("mm", "mm") == 1.0
+    with pytest.raises(ValueError, match="cannot be converted"):
+        units.conversion_factor("mm", "s")
+    with pytest.raises(ValueError, match="offset"):
+        units.conversion_factor("degC", "degF")
+
+
+def test_convert_parameters():
+    parameters = [
+        FloatParameter("width", 25.4, "mm", default_value=1.0),
+        IntegerParameter("count", 3, None, max_value=10, default_value=1),
+        CalculationParameter("area", 645.16, ParameterType.FloatParameter, "mm^2", calc="width * width"),
+        FloatParameter("time", 60.0, "s", default_value=1.0),
+        StringParameter("label", "box"),
+    ]
+    values = units.convert_parameters(parameters, ["inch", "inch^2"])
+    assert values["width"].value == pytest.approx(1.0) and values["width"].unit == "inch"
+    assert values["area"].value == pytest.approx(1.0) and values["area"].unit == "inch^2"
+    assert values["count"] == (3, None)
+    assert values["time"] == (60.0, "s")
+    assert values["label"] == ("box", None)
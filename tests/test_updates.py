@@ -0,0 +1,79 @@
+import logging
+import pytest
+from param123d.parameter_groups import ParameterGroup
+from param123d.updates import UpdateBatcher
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_debounce_coalesces_changes():
+    clock = Clock()
+    batcher = UpdateBatcher(debounce=0.1, clock=clock)
+    transactions = []
+    batcher.subscribe(transactions.append)
+    
+    for step in range(10):
+        clock.now = step * 0.016
+        batcher.push("width", step)
+        batcher.push("height", 2 * step)
+        assert batcher.poll() is None
+    
+    clock.now += 0.1
+    assert batcher.poll() == {(None, "width"): 9, (None, "height"): 18}
+    assert transactions == [{(None, "width"): 9, (None, "height"): 18}]
+    assert batcher.poll() is None
+
+def test_throttle_flushes_during_changes():
+    clock = Clock()
+    batcher = UpdateBatcher(debounce=0.1, throttle=0.05, clock=clock)
+    flushed = []
+    
+    for step in range(12):
+        clock.now = step * 0.016
+        batcher.push("width", step)
+        transaction = batcher.poll()
+        if transaction:
+            flushed.append(transaction[(None, "width")])
+    
+    assert flushed == [4, 9]
+    assert batcher.pending == {(None, "width"): 11}
+
+def test_unsubscribe():
+    batcher = UpdateBatcher()
+    transactions = []
+    unsubscribe = batcher.subscribe(transactions.append)
+    unsubscribe()
+    batcher.push("width", 1)
+    batcher.flush()
+    assert transactions == []
+    assert batcher.transactions == 1
+
+def test_groups_keep_their_values():
+    batcher = UpdateBatcher()
+    box, lid = ParameterGroup("box"), ParameterGroup("lid")
+    batcher.push("width", 1, box)
+    batcher.push("width", 2, lid)
+    assert batcher.flush() == {(box, "width"): 1, (lid, "width"): 2}
+
+def test_failing_listener_is_logged(caplog):
+    clock = Clock()
+    batcher = UpdateBatcher(clock=clock)
+    transactions = []
+    batcher.subscribe(lambda transaction: 1 / 0)
+    batcher.subscribe(transactions.append)
+    batcher.push("width", 1)
+    clock.now = 1.0
+    with caplog.at_level(logging.ERROR):
+        assert batcher.poll() == {(None, "width"): 1}
+    assert transactions == [{(None, "width"): 1}]
+    assert "Transaction listener" in caplog.text and batcher.pending == {}
+
+def test_invalid_timing():
+    with pytest.raises(ValueError):
+        UpdateBatcher(throttle=0)